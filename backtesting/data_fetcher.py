@@ -33,20 +33,7 @@ class DataFetcher:
             import yfinance as yf
             
             data = yf.download(symbol, start=start_date, end=end_date, interval=interval, progress=False)
-            
-            candles = []
-            for timestamp, row in data.iterrows():
-                candle = {
-                    'timestamp': int(timestamp.timestamp()),
-                    'open': float(row['Open']),
-                    'high': float(row['High']),
-                    'low': float(row['Low']),
-                    'close': float(row['Close']),
-                    'volume': float(row['Volume']) if 'Volume' in row else 0
-                }
-                candles.append(candle)
-            
-            return candles
+            return DataFetcher._frame_to_candles(data)
         except ImportError:
             print("yfinance not installed. Install with: pip install yfinance")
             return []
@@ -54,6 +41,70 @@ class DataFetcher:
             print(f"Error fetching data: {e}")
             return []
 
+    @staticmethod
+    def fetch_many_from_yfinance(
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        interval: str = "1h"
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch several symbols with a single threaded yfinance download.
+        
+        Args:
+            symbols: yfinance tickers (e.g., ["6E=F", "GC=F"])
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            interval: Interval (1m, 5m, 15m, 1h, 1d)
+            
+        Returns:
+            Dict of {symbol: [candles]}; symbols with no data are omitted
+        """
+        if not symbols:
+            return {}
+        
+        try:
+            import yfinance as yf
+            
+            data = yf.download(symbols, start=start_date, end=end_date, interval=interval,
+                               group_by='ticker', threads=True, progress=False)
+            
+            if data.columns.nlevels == 1:  # single ticker comes back flat
+                frames = {symbols[0]: data}
+            else:
+                available = set(data.columns.get_level_values(0))
+                frames = {s: data[s].dropna(how='all') for s in symbols if s in available}
+            
+            result = {}
+            for symbol, frame in frames.items():
+                candles = DataFetcher._frame_to_candles(frame)
+                if candles:
+                    result[symbol] = candles
+            return result
+        except ImportError:
+            print("yfinance not installed. Install with: pip install yfinance")
+            return {}
+        except Exception as e:
+            print(f"Error fetching data: {e}")
+            return {}
+
+    @staticmethod
+    def _frame_to_candles(data) -> List[Dict]:
+        """Convert a yfinance OHLCV DataFrame to a list of candle dicts."""
+        candles = []
+        for timestamp, row in data.iterrows():
+            candle = {
+                'timestamp': int(timestamp.timestamp()),
+                'open': float(row['Open']),
+                'high': float(row['High']),
+                'low': float(row['Low']),
+                'close': float(row['Close']),
+                'volume': float(row['Volume']) if 'Volume' in row else 0
+            }
+            candles.append(candle)
+        
+        return candles
+
     @staticmethod
     def fetch_sample_data() -> Dict[str, List[Dict]]:
         """
@@ -3,10 +3,14 @@ Forex API Connector
 Integration with forex brokers (MT5, Interactive Brokers).
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import queue
+import threading
+import time
 
 
 class BrokerType(Enum):
@@ -39,9 +43,15 @@ class HistoricalData:
 class ForexConnector:
     """Base class for forex broker connections."""
 
+    # Seconds a quote fetched by get_prices() is reused
+    QUOTE_TTL = 0.2
+
     def __init__(self, broker_type: BrokerType):
         self.broker_type = broker_type
         self.connected = False
+        self._quote_cache: Dict[str, Tuple[float, Symbol]] = {}
+        self._quote_lock = threading.Lock()
+        self._quote_pool: Optional[ThreadPoolExecutor] = None
 
     def connect(self) -> bool:
         """Establish connection to broker."""
@@ -59,6 +69,50 @@ class ForexConnector:
         """Get list of available symbols."""
         raise NotImplementedError
 
+    def get_prices(self, symbols: List[str]) -> Dict[str, Symbol]:
+        """
+        Current quotes for several symbols at once.
+        
+        Quotes younger than QUOTE_TTL are reused; the rest are fetched
+        concurrently with get_symbol(). Symbols without a quote are omitted.
+        
+        Args:
+            symbols: Trading pairs (e.g., ["EURUSD", "GBPUSD"])
+            
+        Returns:
+            Dict mapping symbol -> Symbol quote
+        """
+        now = time.monotonic()
+        prices = {}
+        missing = []
+        with self._quote_lock:
+            for symbol in dict.fromkeys(symbols):
+                cached = self._quote_cache.get(symbol)
+                if cached is not None and now - cached[0] < self.QUOTE_TTL:
+                    prices[symbol] = cached[1]
+                else:
+                    missing.append(symbol)
+        
+        quotes = self._fetch_quotes(missing) if missing else []
+        
+        fetched_at = time.monotonic()
+        with self._quote_lock:
+            for symbol, quote in zip(missing, quotes):
+                if quote is not None:
+                    self._quote_cache[symbol] = (fetched_at, quote)
+                    prices[symbol] = quote
+        return prices
+
+    def _fetch_quotes(self, symbols: List[str]) -> List[Optional[Symbol]]:
+        """Quotes for `symbols` (None where unavailable), fetched concurrently."""
+        if len(symbols) == 1:
+            return [self.get_symbol(symbols[0])]
+        
+        with self._quote_lock:
+            if self._quote_pool is None:
+                self._quote_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="quotes")
+        return list(self._quote_pool.map(self.get_symbol, symbols))
+
     def get_historical_data(
         self,
         symbol: str,
@@ -215,4 +269,116 @@ class MT5Connector(ForexConnector):
             return {}
 
 
+class QueuedConnector(ForexConnector):
+    """
+    Serializes every call into a connector through one worker thread.
+    
+    The MT5 Python bridge isn't reentrant - concurrent calls from the scan
+    pool, the price feed and the order path can make it return None.
+    Callers queue their request and wait for its result instead.
+    """
+
+    # Seconds a data request may wait before the caller gets the
+    # failure value (None / [] / {}), as if the broker call had failed
+    REQUEST_TIMEOUT = 5.0
+
+    def __init__(self, connector: ForexConnector):
+        super().__init__(connector.broker_type)
+        self.connector = connector
+        self._requests: queue.Queue = queue.Queue()
+        
+        # Started by the first request, stopped by disconnect(); the lock
+        # keeps requests from being queued behind the stop sentinel
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def _serve(self):
+        """Run queued requests one at a time until the stop sentinel (worker thread)."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            method, args, future = request
+            if not future.set_running_or_notify_cancel():
+                continue  # caller timed out before it started
+            try:
+                future.set_result(method(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _call(self, method: Callable, *args, default=None, timeout: Optional[float] = REQUEST_TIMEOUT):
+        """Queue method(*args) for the worker and wait for its result."""
+        future = Future()
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._serve, name=f"{self.broker_type.value}-requests", daemon=True
+                )
+                self._worker.start()
+            self._requests.put((method, args, future))
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            future.cancel()
+            return default
+
+    def connect(self) -> bool:
+        """Connect the wrapped connector (waits however long it takes)."""
+        result = self._call(self.connector.connect, timeout=None)
+        self.connected = self.connector.connected
+        return result
+
+    def disconnect(self) -> bool:
+        """Disconnect the wrapped connector and stop the worker thread."""
+        result = self._call(self.connector.disconnect, timeout=None)
+        self.connected = self.connector.connected
+        
+        # Requests already queued run first; a later call starts a new worker
+        with self._worker_lock:
+            if self._worker is not None:
+                self._requests.put(None)
+                self._worker.join()
+                self._worker = None
+        return result
+
+    def get_symbol(self, symbol: str) -> Optional[Symbol]:
+        """Get current bid/ask prices for a symbol."""
+        return self._call(self.connector.get_symbol, symbol)
+
+    def get_symbols(self, filter_pattern: str = "") -> List[Symbol]:
+        """Get list of available symbols."""
+        return self._call(self.connector.get_symbols, filter_pattern, default=[])
+
+    def _fetch_quotes(self, symbols: List[str]) -> List[Optional[Symbol]]:
+        """Quotes for `symbols`, fetched one after another in a single request."""
+        return self._call(
+            lambda: [self.connector.get_symbol(symbol) for symbol in symbols],
+            default=[None] * len(symbols)
+        )
+
+    def get_historical_data(
+        self,
+        symbol: str,
+        timeframe: str,
+        bars: int
+    ) -> List[HistoricalData]:
+        """Get historical price data."""
+        return self._call(self.connector.get_historical_data, symbol, timeframe, bars, default=[])
 
+    def place_order(
+        self,
+        symbol: str,
+        order_type: str,
+        quantity: float,
+        price: float
+    ) -> str:
+        """Place an order (never abandoned - a timed-out order could still fill)."""
+        return self._call(self.connector.place_order, symbol, order_type, quantity, price, timeout=None)
+
+    def close_order(self, order_id: str) -> bool:
+        """Close an open order (never abandoned, like place_order)."""
+        return self._call(self.connector.close_order, order_id, timeout=None)
+
+    def get_account_info(self) -> Dict:
+        """Get account balance, equity, margin info."""
+        return self._call(self.connector.get_account_info, default={})
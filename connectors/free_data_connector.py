@@ -8,14 +8,27 @@ Uses multiple free APIs:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import logging
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _parse_json(response: requests.Response):
+    """Decode a JSON response body, using orjson's C parser when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 class FreeDataConnector:
     """
     Free market data connector for testing strategies.
@@ -39,6 +52,13 @@ class FreeDataConnector:
         self.alphavantage_key = alphavantage_key
         self.connected = True
         
+        # One pooled session for all HTTP calls so repeated requests to the
+        # same host reuse the TCP/TLS connection instead of reconnecting
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Map our timeframes to Alpha Vantage intervals
         self.av_interval_map = {
             'M1': '1min',
@@ -57,8 +77,9 @@ class FreeDataConnector:
         return True
     
     def disconnect(self):
-        """Disconnect."""
+        """Disconnect and release pooled HTTP connections."""
         self.connected = False
+        self.session.close()
     
     def get_current_price(self, symbol: str) -> float:
         """
@@ -80,10 +101,10 @@ class FreeDataConnector:
                 quote = pair[3:]
                 
                 url = f"https://open.er-api.com/v6/latest/{base}"
-                response = requests.get(url, timeout=10)
+                response = self.session.get(url, timeout=10)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _parse_json(response)
                     rates = data.get('rates', {})
                     if quote in rates:
                         price = rates[quote]
@@ -146,13 +167,13 @@ class FreeDataConnector:
                     'outputsize': 'full' if count > 100 else 'compact'
                 }
             
-            response = requests.get(url, params=params, timeout=15)
+            response = self.session.get(url, params=params, timeout=15)
             
             if response.status_code != 200:
                 logger.warning(f"Alpha Vantage returned {response.status_code}")
                 return {}
             
-            data = response.json()
+            data = _parse_json(response)
             
             # Check for error messages
             if 'Error Message' in data:
@@ -13,6 +13,8 @@ import MetaTrader5 as mt5
 from datetime import datetime, timedelta
 import logging
 
+from core.candles import Candles
+
 logger = logging.getLogger(__name__)
 
 
@@ -137,7 +139,7 @@ class MT5Connector:
             logger.error(f"Error getting prices: {e}")
             raise
     
-    def get_candles(self, symbol: str, timeframe: str = 'M1', count: int = 100) -> dict:
+    def get_candles(self, symbol: str, timeframe: str = 'M1', count: int = 100) -> Candles:
         """
         Get historical candlestick data.
         
@@ -147,7 +149,8 @@ class MT5Connector:
             count: Number of candles to retrieve
         
         Returns:
-            Dict with keys: 'open', 'high', 'low', 'close', 'volume', 'time'
+            Candles with 'time' (epoch seconds), 'open', 'high', 'low', 'close',
+            'volume' arrays (dict-style access still works)
         """
         try:
             # Map timeframe string to MT5 constant
@@ -174,15 +177,16 @@ class MT5Connector:
             if rates is None or len(rates) == 0:
                 raise MT5DataError(f"Failed to get candles for {symbol}: {mt5.last_error()}")
             
-            # Convert to dict format
-            candles = {
-                'time': [datetime.fromtimestamp(r['time']) for r in rates],
-                'open': [float(r['open']) for r in rates],
-                'high': [float(r['high']) for r in rates],
-                'low': [float(r['low']) for r in rates],
-                'close': [float(r['close']) for r in rates],
-                'volume': [int(r['tick_volume']) for r in rates],
-            }
+            # rates is a NumPy structured array - take its columns directly
+            # instead of boxing every field into Python lists
+            candles = Candles(
+                time=rates['time'],
+                open=rates['open'],
+                high=rates['high'],
+                low=rates['low'],
+                close=rates['close'],
+                volume=rates['tick_volume'],
+            )
             
             logger.debug(f"Got {len(rates)} candles for {symbol}")
             return candles
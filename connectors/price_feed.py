@@ -3,13 +3,26 @@ Real-time Price Feed
 Manages streaming price updates from forex brokers.
 """
 
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
+import random
 import threading
 import time
 
 
+# Bar length in seconds per broker timeframe code
+TIMEFRAME_SECONDS = {
+    "M1": 60,
+    "M5": 300,
+    "M15": 900,
+    "M30": 1800,
+    "H1": 3600,
+    "H4": 14400,
+    "D1": 86400,
+}
+
+
 @dataclass
 class TickData:
     """Represents a price tick."""
@@ -24,8 +37,11 @@ class PriceFeed:
 
     def __init__(self):
         self.subscriptions: Dict[str, List[Callable]] = {}
+        self.bar_subscriptions: Dict[Tuple[str, str], List[Callable]] = {}
+        self.bar_open: Dict[Tuple[str, str], int] = {}
         self.running = False
         self.feed_thread = None
+        self._stop_event = threading.Event()
 
     def subscribe(self, symbol: str, callback: Callable[[TickData], None]):
         """
@@ -45,6 +61,24 @@ class PriceFeed:
         if symbol in self.subscriptions:
             self.subscriptions[symbol].remove(callback)
 
+    def subscribe_bar_close(self, symbol: str, timeframe: str, callback: Callable[[str, str, int], None]):
+        """
+        Subscribe to bar-close events for a symbol/timeframe.
+        
+        Args:
+            symbol: Trading pair (e.g., "EURUSD")
+            timeframe: Timeframe code from TIMEFRAME_SECONDS (e.g., "H1")
+            callback: Called with (symbol, timeframe, open time of the closed bar)
+        """
+        if timeframe not in TIMEFRAME_SECONDS:
+            raise ValueError(f"Unsupported timeframe: {timeframe}")
+        
+        self.bar_subscriptions.setdefault((symbol, timeframe), []).append(callback)
+
+    def subscribed_symbols(self) -> List[str]:
+        """Symbols with tick or bar-close subscribers."""
+        return list(dict.fromkeys(list(self.subscriptions) + [s for s, _ in self.bar_subscriptions]))
+
     def publish_tick(self, tick: TickData):
         """Publish a price tick to all subscribers."""
         if tick.symbol in self.subscriptions:
@@ -53,6 +87,29 @@ class PriceFeed:
                     callback(tick)
                 except Exception as e:
                     print(f"Error in callback: {e}")
+        
+        self.check_bar_close(tick.symbol, tick.timestamp)
+
+    def check_bar_close(self, symbol: str, timestamp: int):
+        """Fire bar-close callbacks for bars of `symbol` that ended before `timestamp`."""
+        for (sub_symbol, timeframe), callbacks in self.bar_subscriptions.items():
+            if sub_symbol != symbol:
+                continue
+            
+            seconds = TIMEFRAME_SECONDS[timeframe]
+            bar_open = int(timestamp) // seconds * seconds
+            previous = self.bar_open.get((symbol, timeframe))
+            self.bar_open[(symbol, timeframe)] = bar_open
+            
+            # First sighting only records the current bar
+            if previous is None or bar_open <= previous:
+                continue
+            
+            for callback in callbacks:
+                try:
+                    callback(symbol, timeframe, previous)
+                except Exception as e:
+                    print(f"Error in bar callback: {e}")
 
     def start(self):
         """Start the price feed."""
@@ -64,8 +121,70 @@ class PriceFeed:
     def stop(self):
         """Stop the price feed."""
         self.running = False
+        self._stop_event.set()
 
     def _feed_loop(self):
         """Main feed loop - should be overridden in subclass."""
         while self.running:
             time.sleep(1)
+
+
+class BrokerPriceFeed(PriceFeed):
+    """
+    Price feed driven by a broker connector's quotes.
+    
+    MT5's Python API has no push stream, so the feed thread polls quotes
+    for subscribed symbols (one batched get_prices() call per poll) and
+    publishes a tick only when the bid/ask changes; bar-close events fire
+    from the clock even when the price doesn't move.
+    
+    While the broker fails (an exception, or no quote for any symbol) the
+    polls back off exponentially with jitter, up to MAX_BACKOFF seconds.
+    """
+
+    # Cap in seconds on the wait between failed polls
+    MAX_BACKOFF = 60.0
+
+    def __init__(self, broker, interval: float = 0.25):
+        """
+        Args:
+            broker: ForexConnector providing get_prices()
+            interval: Seconds between quote polls
+        """
+        super().__init__()
+        self.broker = broker
+        self.interval = interval
+        self.last_quotes: Dict[str, Tuple[float, float]] = {}
+        self._backoff = 1.0
+
+    def start(self):
+        """Start the price feed."""
+        self._stop_event.clear()
+        super().start()
+
+    def _feed_loop(self):
+        """Poll quotes and publish changes until stopped."""
+        while self.running:
+            now = int(time.time())
+            symbols = self.subscribed_symbols()
+            try:
+                quotes = self.broker.get_prices(symbols)
+            except Exception as e:
+                print(f"Error polling quotes: {e}")
+                quotes = {}
+            
+            if symbols and not quotes:
+                # Broker down - wait longer after each failed poll
+                self._stop_event.wait(min(self.MAX_BACKOFF, self._backoff) + random.random())
+                self._backoff = min(self.MAX_BACKOFF, self._backoff * 2)
+                continue
+            self._backoff = 1.0
+            
+            for symbol, quote in quotes.items():
+                if self.last_quotes.get(symbol) != (quote.bid, quote.ask):
+                    self.last_quotes[symbol] = (quote.bid, quote.ask)
+                    self.publish_tick(TickData(symbol=symbol, bid=quote.bid, ask=quote.ask, timestamp=now))
+                else:
+                    self.check_bar_close(symbol, now)
+            
+            self._stop_event.wait(self.interval)
@@ -0,0 +1,269 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of the FlexibleICTStrategy kernels (see core/_flexible_jit.py).
+Same functions, arguments and results, compiled ahead of time - for
+deployments where Numba's runtime compile isn't allowed or is too slow
+on the first request.
+
+Build in place from the project root (needs Cython and a C compiler):
+
+    cythonize -i -3 core/_flexible_cy.pyx
+
+FlexibleICTStrategy imports this module when the extension is present
+and falls back to core._flexible_jit otherwise.
+"""
+
+import numpy as np
+
+from core._professional_jit import TREND_BULLISH, TREND_BEARISH, TREND_RANGING
+from core._flexible_jit import SWEEP_NONE, SWEEP_HIGH, SWEEP_LOW
+
+
+def timeframe_ohlc(open_, high, low, close, long timeframe):
+    """
+    1H OHLC arrays resampled to another timeframe (minutes).
+
+    Mirrors AdvancedFilters.get_timeframe_data: higher timeframes are
+    aggregated in chunks, lower ones simulated by splitting each candle.
+    """
+    cdef const double[:] o_in = open_
+    cdef const double[:] h_in = high
+    cdef const double[:] l_in = low
+    cdef const double[:] c_in = close
+    cdef Py_ssize_t n = c_in.shape[0]
+    cdef Py_ssize_t i, j, k, seg, segments, ratio, m, start, stop
+    cdef double o, c, h, l, price_range, seg_open, seg_close, seg_high, seg_low
+    cdef double[::1] o_out, h_out, l_out, c_out
+
+    if timeframe == 60 or n == 0:
+        return open_, high, low, close
+
+    if timeframe < 60:
+        segments = 60 // timeframe
+        m = n * segments
+        o_arr, h_arr, l_arr, c_arr = np.empty(m), np.empty(m), np.empty(m), np.empty(m)
+        o_out, h_out, l_out, c_out = o_arr, h_arr, l_arr, c_arr
+        for i in range(n):
+            o = o_in[i]
+            c = c_in[i]
+            price_range = h_in[i] - l_in[i]
+            for seg in range(segments):
+                seg_open = o + (c - o) * (<double>seg / segments)
+                seg_close = o + (c - o) * (<double>(seg + 1) / segments)
+                seg_high = max(seg_open, seg_close) + price_range * 0.2
+                seg_low = min(seg_open, seg_close) - price_range * 0.2
+                j = i * segments + seg
+                o_out[j] = seg_open
+                h_out[j] = min(seg_high, h_in[i])
+                l_out[j] = max(seg_low, l_in[i])
+                c_out[j] = seg_close
+        return o_arr, h_arr, l_arr, c_arr
+
+    ratio = timeframe // 60
+    m = (n + ratio - 1) // ratio
+    o_arr, h_arr, l_arr, c_arr = np.empty(m), np.empty(m), np.empty(m), np.empty(m)
+    o_out, h_out, l_out, c_out = o_arr, h_arr, l_arr, c_arr
+    for k in range(m):
+        start = k * ratio
+        stop = min(start + ratio, n)
+        h = h_in[start]
+        l = l_in[start]
+        for j in range(start + 1, stop):
+            h = max(h, h_in[j])
+            l = min(l, l_in[j])
+        o_out[k] = o_in[start]
+        h_out[k] = h
+        l_out[k] = l
+        c_out[k] = c_in[stop - 1]
+    return o_arr, h_arr, l_arr, c_arr
+
+
+def htf_trend(const double[:] high, const double[:] low):
+    """Trend from HH/HL vs LH/LL counts over the last 20 bars."""
+    cdef Py_ssize_t base = max(high.shape[0] - 20, 0)
+    cdef const double[:] highs = high[base:]
+    cdef const double[:] lows = low[base:]
+    cdef Py_ssize_t i, j
+    cdef long hh = 0, hl = 0, lh = 0, ll = 0
+    cdef double max_h, min_h, max_l, min_l
+
+    for i in range(5, highs.shape[0]):
+        max_h = highs[i - 5]
+        min_h = highs[i - 5]
+        max_l = lows[i - 5]
+        min_l = lows[i - 5]
+        for j in range(i - 4, i):
+            max_h = max(max_h, highs[j])
+            min_h = min(min_h, highs[j])
+            max_l = max(max_l, lows[j])
+            min_l = min(min_l, lows[j])
+        if highs[i] > max_h:
+            hh += 1
+        if lows[i] > max_l:
+            hl += 1
+        if highs[i] < min_h:
+            lh += 1
+        if lows[i] < min_l:
+            ll += 1
+
+    cdef long bullish_score = hh + hl
+    cdef long bearish_score = lh + ll
+    if bullish_score > bearish_score * 1.3:
+        return TREND_BULLISH
+    elif bearish_score > bullish_score * 1.3:
+        return TREND_BEARISH
+    return TREND_RANGING
+
+
+def htf_zones(const double[:] open_, const double[:] high, const double[:] low, const double[:] close):
+    """
+    Supply/demand zones in the last 30 bars (needs at least 30).
+
+    Returns (zone_high, zone_low, is_supply) arrays, oldest first.
+    """
+    cdef Py_ssize_t base = close.shape[0] - 30
+    zone_highs_arr = np.empty(25)
+    zone_lows_arr = np.empty(25)
+    is_supply_arr = np.empty(25, dtype=np.bool_)
+    cdef double[::1] zone_highs = zone_highs_arr
+    cdef double[::1] zone_lows = zone_lows_arr
+    cdef Py_ssize_t count = 0
+    cdef Py_ssize_t i
+    cdef double o, c
+
+    for i in range(base, base + 25):
+        o = open_[i]
+        c = close[i]
+        if c < o:
+            # Supply zone (strong bearish move from here)
+            if close[i + 1] < low[i] and close[i + 2] < low[i] and close[i + 3] < low[i]:
+                zone_highs[count] = high[i]
+                zone_lows[count] = o
+                is_supply_arr[count] = True
+                count += 1
+        elif c > o:
+            # Demand zone (strong bullish move from here)
+            if close[i + 1] > high[i] and close[i + 2] > high[i] and close[i + 3] > high[i]:
+                zone_highs[count] = c
+                zone_lows[count] = low[i]
+                is_supply_arr[count] = False
+                count += 1
+
+    return zone_highs_arr[:count], zone_lows_arr[:count], is_supply_arr[:count]
+
+
+def order_blocks(const double[:] open_, const double[:] high, const double[:] low, const double[:] close):
+    """
+    Order blocks among the last 10 bars.
+
+    Returns (bar, ob_high, ob_low, is_bullish, strength) arrays, oldest first.
+    """
+    cdef Py_ssize_t n = close.shape[0]
+    bars_arr = np.empty(9, dtype=np.int64)
+    ob_highs_arr = np.empty(9)
+    ob_lows_arr = np.empty(9)
+    is_bullish_arr = np.empty(9, dtype=np.bool_)
+    strengths_arr = np.empty(9)
+    cdef long long[::1] bars = bars_arr
+    cdef double[::1] ob_highs = ob_highs_arr
+    cdef double[::1] ob_lows = ob_lows_arr
+    cdef double[::1] strengths = strengths_arr
+    cdef Py_ssize_t count = 0
+    cdef Py_ssize_t i
+    cdef double o, c, next_c
+
+    for i in range(n - 10, n - 1):
+        if i < 2:
+            continue
+
+        o = open_[i]
+        c = close[i]
+        next_c = close[i + 1]
+
+        # Bullish OB: strong up move after this candle
+        if c > o and next_c > c * 1.002:
+            bars[count] = i
+            ob_highs[count] = o
+            ob_lows[count] = low[i]
+            is_bullish_arr[count] = True
+            strengths[count] = (c - o) / o
+            count += 1
+
+        # Bearish OB: strong down move after this candle
+        elif c < o and next_c < c * 0.998:
+            bars[count] = i
+            ob_highs[count] = high[i]
+            ob_lows[count] = o
+            is_bullish_arr[count] = False
+            strengths[count] = (o - c) / c
+            count += 1
+
+    return (bars_arr[:count], ob_highs_arr[:count], ob_lows_arr[:count],
+            is_bullish_arr[:count], strengths_arr[:count])
+
+
+def fair_value_gaps(const double[:] high, const double[:] low, Py_ssize_t limit):
+    """
+    Up to `limit` most recent FVGs.
+
+    Returns (bar, top, bottom, is_bullish) arrays, oldest first; bar is the
+    middle candle of the three.
+    """
+    bars_arr = np.empty(limit, dtype=np.int64)
+    tops_arr = np.empty(limit)
+    bottoms_arr = np.empty(limit)
+    is_bullish_arr = np.empty(limit, dtype=np.bool_)
+    cdef long long[::1] bars = bars_arr
+    cdef double[::1] tops = tops_arr
+    cdef double[::1] bottoms = bottoms_arr
+    cdef Py_ssize_t count = 0
+    cdef Py_ssize_t i = high.shape[0] - 1
+    cdef double prev_h, prev_l
+
+    # Scan newest first and stop once enough gaps are found
+    while i >= 2 and count < limit:
+        prev_h = high[i - 2]
+        prev_l = low[i - 2]
+        if prev_h < low[i]:
+            bars[count] = i - 1
+            tops[count] = low[i]
+            bottoms[count] = prev_h
+            is_bullish_arr[count] = True
+            count += 1
+        elif prev_l > high[i]:
+            bars[count] = i - 1
+            tops[count] = prev_l
+            bottoms[count] = high[i]
+            is_bullish_arr[count] = False
+            count += 1
+        i -= 1
+
+    return (bars_arr[:count][::-1], tops_arr[:count][::-1],
+            bottoms_arr[:count][::-1], is_bullish_arr[:count][::-1])
+
+
+def equal_level_sweep(const double[:] high, const double[:] low):
+    """
+    Sweep of equal highs/lows (within 0.1%) in the last 20 bars by the final 3
+    (needs at least 20).
+
+    Equal highs are checked before equal lows.
+    """
+    cdef Py_ssize_t n = high.shape[0]
+    cdef Py_ssize_t start = n - 20
+    cdef Py_ssize_t stop = n - 3
+    cdef Py_ssize_t i, j
+
+    for i in range(start, stop - 1):
+        if abs(high[i] - high[i + 1]) / high[i] < 0.001:
+            for j in range(stop, n):
+                if high[j] > high[i]:
+                    return SWEEP_HIGH
+
+    for i in range(start, stop - 1):
+        if abs(low[i] - low[i + 1]) / low[i] < 0.001:
+            for j in range(stop, n):
+                if low[j] < low[i]:
+                    return SWEEP_LOW
+
+    return SWEEP_NONE
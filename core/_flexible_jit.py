@@ -0,0 +1,247 @@
+"""
+JIT kernels for FlexibleICTStrategy hot paths.
+Timeframe resampling, HTF trend/zones, order blocks, FVGs and equal
+high/low sweeps on OHLC NumPy arrays (struct-of-arrays, oldest first).
+
+Numba is optional - without it the kernels run as plain Python.
+"""
+
+import numpy as np
+
+from core._professional_jit import njit, TREND_BULLISH, TREND_BEARISH, TREND_RANGING
+
+# Sweep codes returned by equal_level_sweep
+SWEEP_NONE = 0
+SWEEP_HIGH = 1
+SWEEP_LOW = -1
+
+
+@njit(cache=True, nogil=True)
+def timeframe_ohlc(open_, high, low, close, timeframe):
+    """
+    1H OHLC arrays resampled to another timeframe (minutes).
+
+    Mirrors AdvancedFilters.get_timeframe_data: higher timeframes are
+    aggregated in chunks, lower ones simulated by splitting each candle.
+    """
+    n = len(close)
+    if timeframe == 60 or n == 0:
+        return open_, high, low, close
+
+    if timeframe < 60:
+        segments = 60 // timeframe
+        m = n * segments
+        o_out = np.empty(m)
+        h_out = np.empty(m)
+        l_out = np.empty(m)
+        c_out = np.empty(m)
+        for i in range(n):
+            o = open_[i]
+            c = close[i]
+            price_range = high[i] - low[i]
+            for seg in range(segments):
+                seg_open = o + (c - o) * (seg / segments)
+                seg_close = o + (c - o) * ((seg + 1) / segments)
+                seg_high = max(seg_open, seg_close) + price_range * 0.2
+                seg_low = min(seg_open, seg_close) - price_range * 0.2
+                j = i * segments + seg
+                o_out[j] = seg_open
+                h_out[j] = min(seg_high, high[i])
+                l_out[j] = max(seg_low, low[i])
+                c_out[j] = seg_close
+        return o_out, h_out, l_out, c_out
+
+    ratio = timeframe // 60
+    m = (n + ratio - 1) // ratio
+    o_out = np.empty(m)
+    h_out = np.empty(m)
+    l_out = np.empty(m)
+    c_out = np.empty(m)
+    for k in range(m):
+        start = k * ratio
+        stop = min(start + ratio, n)
+        h = high[start]
+        l = low[start]
+        for j in range(start + 1, stop):
+            h = max(h, high[j])
+            l = min(l, low[j])
+        o_out[k] = open_[start]
+        h_out[k] = h
+        l_out[k] = l
+        c_out[k] = close[stop - 1]
+    return o_out, h_out, l_out, c_out
+
+
+@njit(cache=True, nogil=True)
+def htf_trend(high, low):
+    """Trend from HH/HL vs LH/LL counts over the last 20 bars."""
+    highs = high[-20:]
+    lows = low[-20:]
+    hh = hl = lh = ll = 0
+    for i in range(5, len(highs)):
+        max_h = highs[i - 5]
+        min_h = highs[i - 5]
+        max_l = lows[i - 5]
+        min_l = lows[i - 5]
+        for j in range(i - 4, i):
+            max_h = max(max_h, highs[j])
+            min_h = min(min_h, highs[j])
+            max_l = max(max_l, lows[j])
+            min_l = min(min_l, lows[j])
+        if highs[i] > max_h:
+            hh += 1
+        if lows[i] > max_l:
+            hl += 1
+        if highs[i] < min_h:
+            lh += 1
+        if lows[i] < min_l:
+            ll += 1
+
+    bullish_score = hh + hl
+    bearish_score = lh + ll
+    if bullish_score > bearish_score * 1.3:
+        return TREND_BULLISH
+    elif bearish_score > bullish_score * 1.3:
+        return TREND_BEARISH
+    return TREND_RANGING
+
+
+@njit(cache=True, nogil=True)
+def htf_zones(open_, high, low, close):
+    """
+    Supply/demand zones in the last 30 bars.
+
+    Returns (zone_high, zone_low, is_supply) arrays, oldest first.
+    """
+    base = len(close) - 30
+    zone_highs = np.empty(25)
+    zone_lows = np.empty(25)
+    is_supply = np.empty(25, dtype=np.bool_)
+    count = 0
+
+    for i in range(base, base + 25):
+        o = open_[i]
+        c = close[i]
+        if c < o:
+            # Supply zone (strong bearish move from here)
+            if close[i + 1] < low[i] and close[i + 2] < low[i] and close[i + 3] < low[i]:
+                zone_highs[count] = high[i]
+                zone_lows[count] = o
+                is_supply[count] = True
+                count += 1
+        elif c > o:
+            # Demand zone (strong bullish move from here)
+            if close[i + 1] > high[i] and close[i + 2] > high[i] and close[i + 3] > high[i]:
+                zone_highs[count] = c
+                zone_lows[count] = low[i]
+                is_supply[count] = False
+                count += 1
+
+    return zone_highs[:count], zone_lows[:count], is_supply[:count]
+
+
+@njit(cache=True, nogil=True)
+def order_blocks(open_, high, low, close):
+    """
+    Order blocks among the last 10 bars.
+
+    Returns (bar, ob_high, ob_low, is_bullish, strength) arrays, oldest first.
+    """
+    n = len(close)
+    bars = np.empty(9, dtype=np.int64)
+    ob_highs = np.empty(9)
+    ob_lows = np.empty(9)
+    is_bullish = np.empty(9, dtype=np.bool_)
+    strengths = np.empty(9)
+    count = 0
+
+    for i in range(n - 10, n - 1):
+        if i < 2:
+            continue
+
+        o = open_[i]
+        c = close[i]
+        next_c = close[i + 1]
+
+        # Bullish OB: strong up move after this candle
+        if c > o and next_c > c * 1.002:
+            bars[count] = i
+            ob_highs[count] = o
+            ob_lows[count] = low[i]
+            is_bullish[count] = True
+            strengths[count] = (c - o) / o
+            count += 1
+
+        # Bearish OB: strong down move after this candle
+        elif c < o and next_c < c * 0.998:
+            bars[count] = i
+            ob_highs[count] = high[i]
+            ob_lows[count] = o
+            is_bullish[count] = False
+            strengths[count] = (o - c) / c
+            count += 1
+
+    return bars[:count], ob_highs[:count], ob_lows[:count], is_bullish[:count], strengths[:count]
+
+
+@njit(cache=True, nogil=True)
+def fair_value_gaps(high, low, limit):
+    """
+    Up to `limit` most recent FVGs.
+
+    Returns (bar, top, bottom, is_bullish) arrays, oldest first; bar is the
+    middle candle of the three.
+    """
+    bars = np.empty(limit, dtype=np.int64)
+    tops = np.empty(limit)
+    bottoms = np.empty(limit)
+    is_bullish = np.empty(limit, dtype=np.bool_)
+    count = 0
+
+    # Scan newest first and stop once enough gaps are found
+    i = len(high) - 1
+    while i >= 2 and count < limit:
+        prev_h = high[i - 2]
+        prev_l = low[i - 2]
+        if prev_h < low[i]:
+            bars[count] = i - 1
+            tops[count] = low[i]
+            bottoms[count] = prev_h
+            is_bullish[count] = True
+            count += 1
+        elif prev_l > high[i]:
+            bars[count] = i - 1
+            tops[count] = prev_l
+            bottoms[count] = high[i]
+            is_bullish[count] = False
+            count += 1
+        i -= 1
+
+    return bars[:count][::-1], tops[:count][::-1], bottoms[:count][::-1], is_bullish[:count][::-1]
+
+
+@njit(cache=True, nogil=True)
+def equal_level_sweep(high, low):
+    """
+    Sweep of equal highs/lows (within 0.1%) in the last 20 bars by the final 3.
+
+    Equal highs are checked before equal lows.
+    """
+    highs = high[-20:-3]
+    lows = low[-20:-3]
+    last_highs = high[-3:]
+    last_lows = low[-3:]
+
+    for i in range(len(highs) - 1):
+        if abs(highs[i] - highs[i + 1]) / highs[i] < 0.001:
+            for h in last_highs:
+                if h > highs[i]:
+                    return SWEEP_HIGH
+
+    for i in range(len(lows) - 1):
+        if abs(lows[i] - lows[i + 1]) / lows[i] < 0.001:
+            for l in last_lows:
+                if l < lows[i]:
+                    return SWEEP_LOW
+
+    return SWEEP_NONE
@@ -0,0 +1,182 @@
+"""
+JIT kernels for ProfessionalStrategy hot paths.
+HTF trend, 5M order blocks and BOS/ChoCH on OHLC NumPy arrays + bar index.
+
+Kernels release the GIL so per-symbol analysis can run in a thread pool.
+Numba is optional - without it the kernels run as plain Python.
+"""
+
+from typing import List, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Trend codes returned by the kernels
+TREND_RANGING = 0
+TREND_BULLISH = 1
+TREND_BEARISH = -1
+
+# Simulated 5M bars per 1H candle (see AdvancedFilters._simulate_lower_timeframe)
+SEGMENTS_5M = 12
+
+
+def ohlc_arrays(candles: List[dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Convert candle dicts to (open, high, low, close) float64 arrays."""
+    return tuple(
+        np.fromiter((c[key] for c in candles), dtype=np.float64, count=len(candles))
+        for key in ('open', 'high', 'low', 'close')
+    )
+
+
+@njit(cache=True, nogil=True)
+def _trend_from_swings(highs, lows):
+    """Score HH/HL vs LH/LL over the last 20 HTF bars."""
+    hh = hl = lh = ll = 0
+    for i in range(5, len(highs)):
+        max_h = highs[i - 5]
+        min_h = highs[i - 5]
+        max_l = lows[i - 5]
+        min_l = lows[i - 5]
+        for j in range(i - 4, i):
+            max_h = max(max_h, highs[j])
+            min_h = min(min_h, highs[j])
+            max_l = max(max_l, lows[j])
+            min_l = min(min_l, lows[j])
+        if highs[i] > max_h:
+            hh += 1
+        if lows[i] > max_l:
+            hl += 1
+        if highs[i] < min_h:
+            lh += 1
+        if lows[i] < min_l:
+            ll += 1
+
+    bullish_score = hh + hl
+    bearish_score = lh + ll
+    if bullish_score > bearish_score * 1.5:
+        return TREND_BULLISH
+    elif bearish_score > bullish_score * 1.5:
+        return TREND_BEARISH
+    return TREND_RANGING
+
+
+@njit(cache=True, nogil=True)
+def htf_trend(high, low, i):
+    """4H trend of candles[:i+1] (1H arrays aggregated in chunks of 4)."""
+    n = i + 1
+    if n < 50:
+        return TREND_RANGING
+
+    n_4h = (n + 3) // 4
+    if n_4h < 20:
+        return TREND_RANGING
+
+    highs = np.empty(20)
+    lows = np.empty(20)
+    for k in range(20):
+        start = (n_4h - 20 + k) * 4
+        stop = min(start + 4, n)
+        h = high[start]
+        l = low[start]
+        for j in range(start + 1, stop):
+            h = max(h, high[j])
+            l = min(l, low[j])
+        highs[k] = h
+        lows[k] = l
+
+    return _trend_from_swings(highs, lows)
+
+
+@njit(cache=True, nogil=True)
+def htf_trend_series(high, low):
+    """htf_trend for every bar."""
+    out = np.empty(len(high), dtype=np.int8)
+    for i in range(len(high)):
+        out[i] = htf_trend(high, low, i)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _bar_5m(open_, high, low, close, j):
+    """Simulated 5M bar j as (open, high, low, close)."""
+    idx = j // SEGMENTS_5M
+    seg = j % SEGMENTS_5M
+    o = open_[idx]
+    c = close[idx]
+    price_range = high[idx] - low[idx]
+
+    seg_open = o + (c - o) * (seg / SEGMENTS_5M)
+    seg_close = o + (c - o) * ((seg + 1) / SEGMENTS_5M)
+    seg_high = max(seg_open, seg_close) + price_range * 0.2
+    seg_low = min(seg_open, seg_close) - price_range * 0.2
+    return seg_open, min(seg_high, high[idx]), max(seg_low, low[idx]), seg_close
+
+
+@njit(cache=True, nogil=True)
+def find_order_blocks(open_, high, low, close, i, trend):
+    """
+    5M order blocks in the last 20 simulated bars of candles[:i+1].
+
+    Returns (bar_5m, ob_high, ob_low) arrays for at most the last 5 blocks.
+    """
+    end = (i + 1) * SEGMENTS_5M
+    bars = np.empty(19, dtype=np.int64)
+    ob_highs = np.empty(19)
+    ob_lows = np.empty(19)
+    count = 0
+
+    if end >= 50 and trend != TREND_RANGING:
+        for j in range(end - 20, end - 1):
+            if j < 2:
+                continue
+
+            prev_o, prev_h, prev_l, prev_c = _bar_5m(open_, high, low, close, j - 1)
+            curr_o, curr_h, curr_l, curr_c = _bar_5m(open_, high, low, close, j)
+            next_o, next_h, next_l, next_c = _bar_5m(open_, high, low, close, j + 1)
+
+            if (trend == TREND_BULLISH and curr_c > curr_o and
+                    next_c > curr_c and curr_c > prev_h):
+                bars[count] = j
+                ob_highs[count] = curr_o
+                ob_lows[count] = curr_l
+                count += 1
+            elif (trend == TREND_BEARISH and curr_c < curr_o and
+                    next_c < curr_c and curr_c < prev_l):
+                bars[count] = j
+                ob_highs[count] = curr_h
+                ob_lows[count] = curr_o
+                count += 1
+
+    first = max(0, count - 5)
+    return bars[first:count], ob_highs[first:count], ob_lows[first:count]
+
+
+@njit(cache=True, nogil=True)
+def bos_choch(high, low, close, i, is_long):
+    """BOS + ChoCH over the 15 bars ending at i."""
+    if i < 14:
+        return False, False
+
+    current_price = close[i]
+    if is_long:
+        recent_high = high[i - 14]
+        for j in range(i - 13, i - 2):
+            recent_high = max(recent_high, high[j])
+        has_bos = current_price > recent_high * 1.001
+        has_choch = low[i] > low[i - 1]
+    else:
+        recent_low = low[i - 14]
+        for j in range(i - 13, i - 2):
+            recent_low = min(recent_low, low[j])
+        has_bos = current_price < recent_low * 0.999
+        has_choch = high[i] < high[i - 1]
+
+    return has_bos, has_choch
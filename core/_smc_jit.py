@@ -0,0 +1,149 @@
+"""
+JIT kernel for SMCAnalyzer.
+BOS -> pullback -> FVG/order block/discount zone entry on OHLC NumPy
+arrays (struct-of-arrays, oldest first).
+
+Numba is optional - without it the kernel runs as plain Python.
+"""
+
+from core._professional_jit import njit
+
+# Entry zone codes returned by entry_signal
+ZONE_NONE = 0
+ZONE_FVG = 1
+ZONE_ORDER_BLOCK = 2
+ZONE_DISCOUNT = 3
+
+# Close beyond the prior 15-bar structure high/low needed for a BOS
+BOS_ABOVE = 1.0007
+BOS_BELOW = 0.9993
+
+# Pullback confidence used by SMCAnalyzer.generate_entry_signal
+PULLBACK_CONFIDENCE = 0.75
+
+
+@njit(cache=True, nogil=True)
+def _fair_value_gap(high, low, price):
+    """(found, gap_bottom, gap_top) of the newest significant FVG in the last bars."""
+    n = len(high)
+    min_gap_size = price * 0.001
+    for i in range(n - 3, max(n - 5, 1), -1):
+        # Bullish FVG (gap up)
+        if high[i] < low[i + 2] and low[i + 2] - high[i] >= min_gap_size:
+            return True, high[i], low[i + 2]
+        # Bearish FVG (gap down)
+        if high[i + 2] < low[i] and low[i] - high[i + 2] >= min_gap_size:
+            return True, high[i + 2], low[i]
+    return False, 0.0, 0.0
+
+
+@njit(cache=True, nogil=True)
+def _order_block(open_, high, low, close):
+    """(found, block_bottom, block_top) of the first sharp reversal in the last bars."""
+    n = len(close)
+    for i in range(n - 8, n - 2):
+        if i < 1:
+            continue
+        p = i - 1
+        prev_range = high[p] - low[p]
+        curr_range = high[i] - low[i]
+
+        # Strong bearish reversal - order block at top
+        if (close[p] > open_[p] and close[i] < open_[i]
+                and curr_range > prev_range * 0.6 and close[i] < close[p] * 0.998):
+            return True, open_[p], high[i] * 1.001
+
+        # Strong bullish reversal - order block at bottom
+        if (close[p] < open_[p] and close[i] > open_[i]
+                and curr_range > prev_range * 0.6 and close[i] > close[p] * 1.002):
+            return True, low[i] * 0.999, open_[p]
+    return False, 0.0, 0.0
+
+
+@njit(cache=True, nogil=True)
+def _discount_zone(high, low, price):
+    """(found, zone_bottom, zone_top) when price sits in the 25-75% retracement."""
+    n = len(high)
+    if n < 25:
+        return False, 0.0, 0.0
+
+    # Swing range of the last 20 candles, excluding the last 5
+    previous_low = low[n - 20:n - 5].min()
+    previous_high = high[n - 20:n - 5].max()
+    move_range = previous_high - previous_low
+
+    retrace_start = previous_high - (move_range * 0.25)
+    retrace_end = previous_high - (move_range * 0.75)
+    if retrace_end <= price <= retrace_start:
+        return True, retrace_end * 0.995, retrace_start * 1.005
+    return False, 0.0, 0.0
+
+
+@njit(cache=True, nogil=True)
+def entry_signal(open_, high, low, close):
+    """
+    SMCAnalyzer.generate_entry_signal on arrays (needs at least 20 bars).
+
+    Returns (zone, is_long, bos_strength, bos_extreme, pullback_high,
+    pullback_low, stop_loss, target_price, risk_reward, strength); zone is
+    ZONE_NONE when there is no signal. bos_extreme is the recent low of an
+    upside BOS or the recent high of a downside one.
+    """
+    none = (ZONE_NONE, False, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    n = len(close)
+    if n < 20:
+        return none
+    price = close[n - 1]
+
+    # Step 1: BOS against the structure of the last 15 candles (excluding last 2)
+    max_high = high[n - 15:n - 2].max()
+    min_low = low[n - 15:n - 2].min()
+    if price > max_high * BOS_ABOVE:
+        is_long = True
+        bos_extreme = low[n - 5:].min()
+        bos_strength = min((price - max_high) / (max_high * 0.007), 1.0)
+    elif price < min_low * BOS_BELOW:
+        is_long = False
+        bos_extreme = high[n - 5:].max()
+        bos_strength = min((min_low - price) / (min_low * 0.007), 1.0)
+    else:
+        return none
+
+    # Step 2: pullback exists if there's volatility
+    pullback_high = high[n - 5:].max()
+    pullback_low = low[n - 5:].min()
+    if pullback_high - pullback_low < price * 0.0002:
+        return none
+
+    # Step 3: entry zone - FVG, then order block, then discount zone
+    zone = ZONE_FVG
+    found, entry_low, entry_high = _fair_value_gap(high, low, price)
+    if not found:
+        zone = ZONE_ORDER_BLOCK
+        found, entry_low, entry_high = _order_block(open_, high, low, close)
+    if not found:
+        zone = ZONE_DISCOUNT
+        found, entry_low, entry_high = _discount_zone(high, low, price)
+    if not found:
+        return none
+
+    # Step 4: SL and TP at 2.0x risk
+    if is_long:
+        stop_loss = entry_low * 0.998
+        target_price = price + (price - stop_loss) * 2.0
+    else:
+        stop_loss = entry_high * 1.002
+        target_price = price - (stop_loss - price) * 2.0
+
+    risk = abs(price - stop_loss)
+    reward = abs(target_price - price)
+    rr_ratio = reward / risk if risk > 0 else 0.0
+    if rr_ratio < 1.5:
+        return none
+
+    strength = min(bos_strength * 0.6 + PULLBACK_CONFIDENCE * 0.4, 1.0)
+    if strength < 0.65:
+        return none
+
+    return (zone, is_long, bos_strength, bos_extreme, pullback_high,
+            pullback_low, stop_loss, target_price, rr_ratio, strength)
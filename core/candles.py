@@ -0,0 +1,133 @@
+"""
+Columnar OHLCV Candles
+Stores a candle series as one NumPy array per field (struct-of-arrays)
+instead of a dict of Python lists or a list of candle dicts.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+import numpy as np
+
+
+@dataclass
+class Candles:
+    """OHLCV series, oldest first. time is epoch seconds."""
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    FIELDS = ('time', 'open', 'high', 'low', 'close', 'volume')
+
+    def __post_init__(self):
+        self.time = np.asarray(self.time, dtype=np.int64)
+        self.open = np.asarray(self.open, dtype=np.float64)
+        self.high = np.asarray(self.high, dtype=np.float64)
+        self.low = np.asarray(self.low, dtype=np.float64)
+        self.close = np.asarray(self.close, dtype=np.float64)
+        self.volume = np.asarray(self.volume, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        """Dict-style column access (candles['close'])."""
+        if field not in self.FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def get(self, field: str, default=None):
+        """Dict-style column access with a default."""
+        return getattr(self, field) if field in self.FIELDS else default
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, list]) -> 'Candles':
+        """Build from the {'time': [...], 'open': [...], ...} connector format."""
+        return cls(**{field: data.get(field, []) for field in cls.FIELDS})
+
+    @classmethod
+    def from_bars(cls, bars: List) -> 'Candles':
+        """Build from connector bar objects (HistoricalData: .timestamp, .open, ...)."""
+        n = len(bars)
+        return cls(
+            time=np.fromiter((b.timestamp for b in bars), dtype=np.int64, count=n),
+            open=np.fromiter((b.open for b in bars), dtype=np.float64, count=n),
+            high=np.fromiter((b.high for b in bars), dtype=np.float64, count=n),
+            low=np.fromiter((b.low for b in bars), dtype=np.float64, count=n),
+            close=np.fromiter((b.close for b in bars), dtype=np.float64, count=n),
+            volume=np.fromiter((b.volume for b in bars), dtype=np.float64, count=n)
+        )
+
+    @classmethod
+    def from_records(cls, records: List[dict]) -> 'Candles':
+        """Build from a list of candle dicts (the to_records() format; 'time' also accepted)."""
+        keys = dict(zip(cls.FIELDS[1:], ('open', 'high', 'low', 'close', 'volume')))
+        return cls(
+            time=[c.get('timestamp', c.get('time', 0)) for c in records],
+            **{field: [c.get(key, 0) for c in records] for field, key in keys.items()}
+        )
+
+    def tail(self, n: int) -> 'Candles':
+        """Last n candles (views, no copy)."""
+        start = max(len(self) - n, 0)
+        return Candles(**{field: getattr(self, field)[start:] for field in self.FIELDS})
+
+    def as_dict(self) -> Dict[str, list]:
+        """Compat shim: the {'time': [...], 'open': [...], ...} format with lists."""
+        return {field: getattr(self, field).tolist() for field in self.FIELDS}
+
+    def to_records(self) -> List[dict]:
+        """List of candle dicts, as consumed by the strategy classes."""
+        columns = [getattr(self, field).tolist() for field in self.FIELDS]
+        return [
+            {'timestamp': t, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}
+            for t, o, h, l, c, v in zip(*columns)
+        ]
+
+
+class CandleBuffer:
+    """
+    The last `capacity` candles of a series as preallocated columns.
+    
+    Bars are kept oldest first and contiguous (no wrap-around), so a
+    snapshot is a plain slice; on overflow the columns shift left in place.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.count = 0
+        self.columns = {
+            field: np.empty(capacity, dtype=np.int64 if field == 'time' else np.float64)
+            for field in Candles.FIELDS
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def last_time(self) -> int:
+        """Time of the newest candle (buffer must not be empty)."""
+        return int(self.columns['time'][self.count - 1])
+
+    def truncate_from(self, time: int):
+        """Drop candles at or after `time` (they are about to be replaced)."""
+        times = self.columns['time'][:self.count]
+        self.count = int(np.searchsorted(times, time, side='left'))
+
+    def extend(self, candles: Candles):
+        """Append candles (oldest first), keeping only the newest `capacity`."""
+        n = min(len(candles), self.capacity)
+        overflow = self.count + n - self.capacity
+        for field, column in self.columns.items():
+            if overflow > 0:
+                column[:self.count - overflow] = column[overflow:self.count]
+            start = self.count - max(overflow, 0)
+            column[start:start + n] = getattr(candles, field)[len(candles) - n:]
+        self.count = min(self.count + n, self.capacity)
+
+    def snapshot(self) -> Candles:
+        """Copy of the stored candles."""
+        return Candles(**{field: column[:self.count].copy() for field, column in self.columns.items()})
+
@@ -4,10 +4,11 @@ Implements ICT methodology with multi-timeframe analysis, order blocks, FVG, liq
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from enum import Enum
 import numpy as np
 from datetime import datetime, time as dt_time
+from core.candles import Candles
 
 
 class MarketStructure(Enum):
@@ -88,7 +89,7 @@ class EnhancedSMCStrategy:
         self.target_reached = False
         self.max_trades_per_day = 2
         
-    def determine_htf_structure(self, htf_candles: List[dict]) -> MarketStructure:
+    def determine_htf_structure(self, htf_candles: Candles) -> MarketStructure:
         """
         Determine higher timeframe structure (4H or 1H).
         Returns: BULLISH, BEARISH, or RANGING
@@ -97,19 +98,18 @@ class EnhancedSMCStrategy:
             return MarketStructure.RANGING
         
         # Look at last 20 candles
-        recent = htf_candles[-20:]
-        highs = [c['high'] for c in recent]
-        lows = [c['low'] for c in recent]
-        closes = [c['close'] for c in recent]
+        highs = htf_candles.high[-20:]
+        lows = htf_candles.low[-20:]
+        closes = htf_candles.close[-20:]
         
         # Calculate trend
-        recent_high = max(highs[-10:])
-        recent_low = min(lows[-10:])
-        prev_high = max(highs[-20:-10])
-        prev_low = min(lows[-20:-10])
+        recent_high = highs[-10:].max()
+        recent_low = lows[-10:].min()
+        prev_high = highs[:10].max()
+        prev_low = lows[:10].min()
         
         # Simple moving average trend
-        sma_20 = sum(closes[-20:]) / 20
+        sma_20 = closes.sum() / 20
         current_price = closes[-1]
         
         # Bullish: Higher highs and higher lows
@@ -122,57 +122,41 @@ class EnhancedSMCStrategy:
         
         return MarketStructure.RANGING
     
-    def find_order_blocks_5m(self, candles_5m: List[dict], htf_structure: MarketStructure) -> List[OrderBlock]:
+    def find_order_blocks_5m(self, candles_5m: Candles, htf_structure: MarketStructure) -> List[OrderBlock]:
         """
         Find order blocks on 5-minute timeframe that align with HTF structure.
         Order block = last bearish candle before bullish move (or vice versa).
         """
-        order_blocks = []
+        n = len(candles_5m)
+        if n < 10:
+            return []
         
-        if len(candles_5m) < 10:
-            return order_blocks
+        bullish = candles_5m.close > candles_5m.open
+        bearish = candles_5m.close < candles_5m.open
         
-        # Look for order blocks in last 50 candles
-        for i in range(len(candles_5m) - 10, len(candles_5m) - 3):
-            if i < 2:
-                continue
-            
-            curr = candles_5m[i]
-            next_candles = candles_5m[i+1:i+4]
-            
-            # Bullish order block (for long entries)
-            if htf_structure == MarketStructure.BULLISH:
-                # Last bearish candle before strong bullish move
-                is_bearish = curr['close'] < curr['open']
-                next_bullish = sum(1 for c in next_candles if c['close'] > c['open']) >= 2
-                
-                if is_bearish and next_bullish:
-                    ob = OrderBlock(
-                        high=curr['high'],
-                        low=curr['low'],
-                        timestamp=curr.get('time', curr.get('timestamp', 0)),
-                        timeframe="5M",
-                        strength=0.8
-                    )
-                    order_blocks.append(ob)
-            
-            # Bearish order block (for short entries)
-            elif htf_structure == MarketStructure.BEARISH:
-                # Last bullish candle before strong bearish move
-                is_bullish = curr['close'] > curr['open']
-                next_bearish = sum(1 for c in next_candles if c['close'] < c['open']) >= 2
-                
-                if is_bullish and next_bearish:
-                    ob = OrderBlock(
-                        high=curr['high'],
-                        low=curr['low'],
-                        timestamp=curr.get('time', curr.get('timestamp', 0)),
-                        timeframe="5M",
-                        strength=0.8
-                    )
-                    order_blocks.append(ob)
-        
-        return order_blocks
+        if htf_structure == MarketStructure.BULLISH:
+            # Last bearish candle before strong bullish move (for long entries)
+            block, move = bearish, bullish
+        elif htf_structure == MarketStructure.BEARISH:
+            # Last bullish candle before strong bearish move (for short entries)
+            block, move = bullish, bearish
+        else:
+            return []
+        
+        # Candidate candles in the last 10, each followed by 2+ of 3 moving candles
+        bars = np.arange(max(n - 10, 2), n - 3)
+        follow = move[bars + 1].astype(np.int64) + move[bars + 2] + move[bars + 3]
+        
+        return [
+            OrderBlock(
+                high=float(candles_5m.high[i]),
+                low=float(candles_5m.low[i]),
+                timestamp=int(candles_5m.time[i]),
+                timeframe="5M",
+                strength=0.8
+            )
+            for i in bars[block[bars] & (follow >= 2)]
+        ]
     
     def calculate_fib_retracement(self, swing_high: float, swing_low: float) -> Dict[str, float]:
         """Calculate Fibonacci retracement levels."""
@@ -187,16 +171,15 @@ class EnhancedSMCStrategy:
             '100%': swing_low
         }
     
-    def check_79_fib_confluence(self, order_block: OrderBlock, candles: List[dict]) -> bool:
+    def check_79_fib_confluence(self, order_block: OrderBlock, candles: Candles) -> bool:
         """
         Check if order block aligns with 79% Fibonacci retracement.
         """
         if len(candles) < 20:
             return False
         
-        recent = candles[-20:]
-        swing_high = max(c['high'] for c in recent)
-        swing_low = min(c['low'] for c in recent)
+        swing_high = candles.high[-20:].max()
+        swing_low = candles.low[-20:].min()
         
         fib_levels = self.calculate_fib_retracement(swing_high, swing_low)
         fib_79 = fib_levels['79%']
@@ -205,81 +188,58 @@ class EnhancedSMCStrategy:
         ob_mid = (order_block.high + order_block.low) / 2
         tolerance = ob_mid * 0.002
         
-        return abs(ob_mid - fib_79) < tolerance
+        return bool(abs(ob_mid - fib_79) < tolerance)
     
-    def detect_fair_value_gaps(self, candles: List[dict]) -> List[FairValueGap]:
-        """Detect Fair Value Gaps (FVG) - 3-candle imbalances."""
-        fvgs = []
+    def detect_fair_value_gaps(self, candles: Candles) -> List[FairValueGap]:
+        """Detect Fair Value Gaps (FVG) - 3-candle imbalances, newest first."""
+        n = len(candles)
+        high, low, time = candles.high, candles.low, candles.time
         
-        for i in range(len(candles) - 3, max(0, len(candles) - 20), -1):
-            if i < 2:
-                break
-            
-            candle_1 = candles[i]
-            candle_2 = candles[i + 1]
-            candle_3 = candles[i + 2]
-            
-            # Bullish FVG: gap between candle 1 high and candle 3 low
-            if candle_1['high'] < candle_3['low']:
-                fvg = FairValueGap(
-                    high=candle_3['low'],
-                    low=candle_1['high'],
-                    timestamp=candle_2.get('time', candle_2.get('timestamp', 0))
-                )
-                fvgs.append(fvg)
-            
-            # Bearish FVG: gap between candle 3 high and candle 1 low
-            elif candle_3['high'] < candle_1['low']:
-                fvg = FairValueGap(
-                    high=candle_1['low'],
-                    low=candle_3['high'],
-                    timestamp=candle_2.get('time', candle_2.get('timestamp', 0))
-                )
-                fvgs.append(fvg)
+        # First candle of each 3-candle window in the last 20 bars
+        bars = np.arange(n - 3, max(n - 20, 1), -1)
+        if not len(bars):
+            return []
+        
+        # Bullish FVG: gap between candle 1 high and candle 3 low
+        bullish_gap = high[bars] < low[bars + 2]
+        # Bearish FVG: gap between candle 3 high and candle 1 low
+        bearish_gap = ~bullish_gap & (high[bars + 2] < low[bars])
+        
+        fvgs = []
+        for i, bullish in zip(bars[bullish_gap | bearish_gap], bullish_gap[bullish_gap | bearish_gap]):
+            if bullish:
+                fvgs.append(FairValueGap(high=float(low[i + 2]), low=float(high[i]), timestamp=int(time[i + 1])))
+            else:
+                fvgs.append(FairValueGap(high=float(low[i]), low=float(high[i + 2]), timestamp=int(time[i + 1])))
         
         return fvgs
     
-    def detect_liquidity_pools(self, candles: List[dict]) -> List[LiquidityPool]:
+    @staticmethod
+    def _equal_levels(values: np.ndarray) -> np.ndarray:
+        """Values matched (within 0.1%) by one of the next 4 values."""
+        m = len(values)
+        equal = np.zeros(m, dtype=bool)
+        for k in range(1, min(5, m)):
+            equal[:m - k] |= np.abs(values[:m - k] - values[k:]) / values[:m - k] < 0.001
+        return values[equal]
+    
+    def detect_liquidity_pools(self, candles: Candles) -> List[LiquidityPool]:
         """
         Detect equal highs and equal lows (liquidity pools).
         """
-        liquidity_pools = []
-        
         if len(candles) < 10:
-            return liquidity_pools
+            return []
         
         # Look at last 20 candles
-        recent = candles[-20:]
-        highs = [c['high'] for c in recent]
-        lows = [c['low'] for c in recent]
-        
-        # Find equal highs (within 0.1% tolerance)
-        for i in range(len(highs) - 1):
-            for j in range(i + 1, min(i + 5, len(highs))):
-                if abs(highs[i] - highs[j]) / highs[i] < 0.001:
-                    pool = LiquidityPool(
-                        level=highs[i],
-                        is_high=True,
-                        count=2
-                    )
-                    liquidity_pools.append(pool)
-                    break
-        
-        # Find equal lows (within 0.1% tolerance)
-        for i in range(len(lows) - 1):
-            for j in range(i + 1, min(i + 5, len(lows))):
-                if abs(lows[i] - lows[j]) / lows[i] < 0.001:
-                    pool = LiquidityPool(
-                        level=lows[i],
-                        is_high=False,
-                        count=2
-                    )
-                    liquidity_pools.append(pool)
-                    break
-        
-        return liquidity_pools
+        equal_highs = self._equal_levels(candles.high[-20:])
+        equal_lows = self._equal_levels(candles.low[-20:])
+        
+        return (
+            [LiquidityPool(level=float(level), is_high=True, count=2) for level in equal_highs]
+            + [LiquidityPool(level=float(level), is_high=False, count=2) for level in equal_lows]
+        )
     
-    def check_bos_and_choch(self, candles: List[dict], htf_structure: MarketStructure) -> Tuple[bool, bool]:
+    def check_bos_and_choch(self, candles: Candles, htf_structure: MarketStructure) -> Tuple[bool, bool]:
         """
         Check for Break of Structure (BoS) and Change of Character (ChoCH).
         Returns: (has_bos, has_choch)
@@ -287,40 +247,32 @@ class EnhancedSMCStrategy:
         if len(candles) < 15:
             return False, False
         
-        recent = candles[-15:]
-        current_price = candles[-1]['close']
+        high, low = candles.high, candles.low
+        current_price = candles.close[-1]
         
         # For bullish structure
         if htf_structure == MarketStructure.BULLISH:
             # BoS: break above previous high
-            prev_highs = [c['high'] for c in recent[-10:-2]]
-            prev_high = max(prev_highs) if prev_highs else 0
-            has_bos = current_price > prev_high * 1.001
+            has_bos = current_price > high[-10:-2].max() * 1.001
             
             # ChoCH: price creates higher low after pullback
-            recent_lows = [c['low'] for c in recent[-5:]]
-            prev_lows = [c['low'] for c in recent[-10:-5]]
-            has_choch = min(recent_lows) > min(prev_lows) if prev_lows and recent_lows else False
+            has_choch = low[-5:].min() > low[-10:-5].min()
             
-            return has_bos, has_choch
+            return bool(has_bos), bool(has_choch)
         
         # For bearish structure
         elif htf_structure == MarketStructure.BEARISH:
             # BoS: break below previous low
-            prev_lows = [c['low'] for c in recent[-10:-2]]
-            prev_low = min(prev_lows) if prev_lows else float('inf')
-            has_bos = current_price < prev_low * 0.999
+            has_bos = current_price < low[-10:-2].min() * 0.999
             
             # ChoCH: price creates lower high after pullback
-            recent_highs = [c['high'] for c in recent[-5:]]
-            prev_highs = [c['high'] for c in recent[-10:-5]]
-            has_choch = max(recent_highs) < max(prev_highs) if prev_highs and recent_highs else False
+            has_choch = high[-5:].max() < high[-10:-5].max()
             
-            return has_bos, has_choch
+            return bool(has_bos), bool(has_choch)
         
         return False, False
     
-    def check_asian_session_sweep(self, candles: List[dict], htf_structure: MarketStructure) -> bool:
+    def check_asian_session_sweep(self, candles: Candles, htf_structure: MarketStructure) -> bool:
         """
         For EU/GU: Check if price swept Asian session high/low.
         Asian session: typically 00:00-08:00 UTC
@@ -333,29 +285,23 @@ class EnhancedSMCStrategy:
         if len(candles) < 10:
             return False
         
-        recent = candles[-10:]
-        highs = [c['high'] for c in recent]
-        lows = [c['low'] for c in recent]
+        current = candles.close[-1]
         
         # Simple sweep detection: sharp move that reversed
         if htf_structure == MarketStructure.BULLISH:
             # Look for low sweep followed by rally
-            min_low = min(lows[:-2])
-            current = candles[-1]['close']
-            return current > min_low * 1.002
+            return bool(current > candles.low[-10:-2].min() * 1.002)
         
         elif htf_structure == MarketStructure.BEARISH:
             # Look for high sweep followed by decline
-            max_high = max(highs[:-2])
-            current = candles[-1]['close']
-            return current < max_high * 0.998
+            return bool(current < candles.high[-10:-2].max() * 0.998)
         
         return False
     
     def generate_signal(
         self,
-        candles_5m: List[dict],
-        candles_htf: List[dict]
+        candles_5m: Union[Candles, List[dict]],
+        candles_htf: Union[Candles, List[dict]]
     ) -> Optional[TradingSignal]:
         """
         Generate trading signal based on the complete trading plan.
@@ -370,6 +316,11 @@ class EnhancedSMCStrategy:
         7. Pair-specific rules
         8. If all conditions met → Generate signal
         """
+        if not isinstance(candles_5m, Candles):
+            candles_5m = Candles.from_records(candles_5m)
+        if not isinstance(candles_htf, Candles):
+            candles_htf = Candles.from_records(candles_htf)
+        
         conditions_met = []
         
         # Check if we can trade today
@@ -412,7 +363,7 @@ class EnhancedSMCStrategy:
         liquidity_pools = self.detect_liquidity_pools(candles_5m)
         if liquidity_pools:
             # Wait for sweep if liquidity exists
-            current_price = candles_5m[-1]['close']
+            current_price = candles_5m.close[-1]
             swept = False
             for pool in liquidity_pools:
                 if pool.is_high and current_price > pool.level:
@@ -436,7 +387,7 @@ class EnhancedSMCStrategy:
             conditions_met.append("Gold: Following trend")
         
         # Step 8: Generate Signal
-        current_price = candles_5m[-1]['close']
+        current_price = float(candles_5m.close[-1])
         
         if htf_structure == MarketStructure.BULLISH:
             direction = "BUY"
@@ -483,15 +434,16 @@ class EnhancedSMCStrategy:
             htf_structure=htf_structure,
             session=SessionType.LONDON,  # Would need actual session detection
             conditions_met=conditions_met,
-            timestamp=candles_5m[-1].get('time', candles_5m[-1].get('timestamp', 0))
+            timestamp=int(candles_5m.time[-1])
         )
         
         return signal
     
-    def analyze(self, candles_5m: List[dict], candles_htf: List[dict] = None) -> Optional[Dict]:
+    def analyze(self, candles_5m: Union[Candles, List[dict]],
+                candles_htf: Union[Candles, List[dict]] = None) -> Optional[Dict]:
         """
         Main analysis method compatible with existing bot infrastructure.
-        Returns signal in expected format.
+        Accepts candle dicts or columnar Candles. Returns signal in expected format.
         """
         # If no HTF data provided, use 5M data as proxy (not ideal but works for testing)
         if candles_htf is None:
@@ -520,6 +472,6 @@ class SMCStrategy:
     def __init__(self, symbol: str = "EURUSD"):
         self.enhanced = EnhancedSMCStrategy(symbol)
     
-    def analyze(self, candles: List[dict]) -> Optional[Dict]:
+    def analyze(self, candles: Union[Candles, List[dict]]) -> Optional[Dict]:
         """Analyze candles and return signal."""
         return self.enhanced.analyze(candles)
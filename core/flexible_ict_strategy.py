@@ -14,10 +14,16 @@ Risk Management:
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Union
 from enum import Enum
 from datetime import datetime, timezone
 from core.advanced_filters import AdvancedFilters
+from core.candles import Candles
+try:
+    # Ahead-of-time compiled kernels (build with: cythonize -i -3 core/_flexible_cy.pyx)
+    from core import _flexible_cy as _jit
+except ImportError:
+    from core import _flexible_jit as _jit
 
 
 class TrendDirection(Enum):
@@ -26,6 +32,13 @@ class TrendDirection(Enum):
     RANGING = "ranging"
 
 
+_TREND_CODES = {
+    _jit.TREND_BULLISH: TrendDirection.BULLISH,
+    _jit.TREND_BEARISH: TrendDirection.BEARISH,
+    _jit.TREND_RANGING: TrendDirection.RANGING,
+}
+
+
 class SetupType(Enum):
     OPTION_1 = "HTF_LIQUIDITY_BOS"  # HTF Bias + Liquidity + BoS
     OPTION_2 = "HTF_ZONE_OB_CHOCH"  # HTF Zone + OB + ChoCH
@@ -100,230 +113,140 @@ class FlexibleICTStrategy:
         self.trades_today = 0
         self.current_date = None
     
-    def determine_htf_trend(self, candles: List[dict], timeframe: int = 240) -> TrendDirection:
+    def _timeframe_ohlc(self, candles: Candles, timeframe: int):
+        """(open, high, low, close) arrays resampled from 1H (see AdvancedFilters.get_timeframe_data)."""
+        return _jit.timeframe_ohlc(candles.open, candles.high, candles.low, candles.close, timeframe)
+    
+    def _timeframe_timestamp(self, candles: Candles, bar: int, timeframe: int) -> int:
+        """Timestamp of bar `bar` on the resampled timeframe."""
+        if timeframe < 60:
+            idx, seg = divmod(bar, 60 // timeframe)
+            return int(candles.time[idx]) + seg * timeframe * 60
+        return int(candles.time[bar * (timeframe // 60)])
+    
+    def determine_htf_trend(self, candles: Candles, timeframe: int = 240) -> TrendDirection:
         """Determine HTF trend (4H or 1H)."""
         if len(candles) < 50:
             return TrendDirection.RANGING
         
-        candles_htf = self.filters.get_timeframe_data(candles, timeframe)
-        if len(candles_htf) < 20:
+        _, highs, lows, _ = self._timeframe_ohlc(candles, timeframe)
+        if len(highs) < 20:
             return TrendDirection.RANGING
         
-        recent = candles_htf[-20:]
-        highs = [c['high'] for c in recent]
-        lows = [c['low'] for c in recent]
-        
         # Count higher highs/higher lows vs lower highs/lower lows
-        hh_count = sum(1 for i in range(5, len(highs)) if highs[i] > max(highs[i-5:i]))
-        hl_count = sum(1 for i in range(5, len(lows)) if lows[i] > max(lows[i-5:i]))
-        lh_count = sum(1 for i in range(5, len(highs)) if highs[i] < min(highs[i-5:i]))
-        ll_count = sum(1 for i in range(5, len(lows)) if lows[i] < min(lows[i-5:i]))
-        
-        bullish_score = hh_count + hl_count
-        bearish_score = lh_count + ll_count
-        
-        if bullish_score > bearish_score * 1.3:
-            return TrendDirection.BULLISH
-        elif bearish_score > bullish_score * 1.3:
-            return TrendDirection.BEARISH
-        return TrendDirection.RANGING
+        return _TREND_CODES[_jit.htf_trend(highs, lows)]
     
-    def find_htf_zones(self, candles: List[dict], timeframe: int = 240) -> List[HTFZone]:
+    def find_htf_zones(self, candles: Candles, timeframe: int = 240) -> List[HTFZone]:
         """Find HTF zones (4H or 1H supply/demand)."""
-        candles_htf = self.filters.get_timeframe_data(candles, timeframe)
-        if len(candles_htf) < 30:
+        ohlc = self._timeframe_ohlc(candles, timeframe)
+        if len(ohlc[3]) < 30:
             return []
         
-        zones = []
-        recent = candles_htf[-30:]
-        
-        for i in range(len(recent) - 5):
-            candle = recent[i]
-            
-            # Supply zone (strong bearish move from here)
-            if candle['close'] < candle['open']:  # Bearish candle
-                next_5 = recent[i+1:i+6]
-                if all(c['close'] < candle['low'] for c in next_5[:3]):
-                    zones.append(HTFZone(
-                        high=candle['high'],
-                        low=candle['open'],
-                        timeframe=f"{timeframe}M",
-                        zone_type='supply'
-                    ))
-            
-            # Demand zone (strong bullish move from here)
-            elif candle['close'] > candle['open']:  # Bullish candle
-                next_5 = recent[i+1:i+6]
-                if all(c['close'] > candle['high'] for c in next_5[:3]):
-                    zones.append(HTFZone(
-                        high=candle['close'],
-                        low=candle['low'],
-                        timeframe=f"{timeframe}M",
-                        zone_type='demand'
-                    ))
-        
-        return zones[-5:]  # Keep last 5 zones
+        zone_highs, zone_lows, is_supply = _jit.htf_zones(*ohlc)
+        
+        # Keep last 5 zones
+        return [
+            HTFZone(
+                high=float(high),
+                low=float(low),
+                timeframe=f"{timeframe}M",
+                zone_type='supply' if supply else 'demand'
+            )
+            for high, low, supply in zip(zone_highs[-5:], zone_lows[-5:], is_supply[-5:])
+        ]
     
-    def find_order_blocks(self, candles: List[dict], timeframe: int = 5) -> List[OrderBlock]:
+    def find_order_blocks(self, candles: Candles, timeframe: int = 5) -> List[OrderBlock]:
         """Find order blocks on specified timeframe."""
-        candles_tf = self.filters.get_timeframe_data(candles, timeframe)
-        if len(candles_tf) < 20:
+        ohlc = self._timeframe_ohlc(candles, timeframe)
+        if len(ohlc[3]) < 20:
             return []
         
-        order_blocks = []
-        for i in range(len(candles_tf) - 10, len(candles_tf) - 1):
-            if i < 2:
-                continue
-            
-            prev = candles_tf[i - 1]
-            curr = candles_tf[i]
-            next_c = candles_tf[i + 1]
-            
-            # Bullish OB: strong up move after this candle
-            if (curr['close'] > curr['open'] and
-                next_c['close'] > curr['close'] * 1.002):
-                
-                strength = (curr['close'] - curr['open']) / curr['open']
-                ob = OrderBlock(
-                    high=curr['open'],
-                    low=curr['low'],
-                    timestamp=curr['timestamp'],
-                    direction='bullish',
-                    timeframe=f"{timeframe}M",
-                    strength=strength
-                )
-                order_blocks.append(ob)
-            
-            # Bearish OB: strong down move after this candle
-            elif (curr['close'] < curr['open'] and
-                  next_c['close'] < curr['close'] * 0.998):
-                
-                strength = (curr['open'] - curr['close']) / curr['close']
-                ob = OrderBlock(
-                    high=curr['high'],
-                    low=curr['open'],
-                    timestamp=curr['timestamp'],
-                    direction='bearish',
-                    timeframe=f"{timeframe}M",
-                    strength=strength
-                )
-                order_blocks.append(ob)
+        order_blocks = [
+            OrderBlock(
+                high=float(high),
+                low=float(low),
+                timestamp=self._timeframe_timestamp(candles, int(bar), timeframe),
+                direction='bullish' if bullish else 'bearish',
+                timeframe=f"{timeframe}M",
+                strength=float(strength)
+            )
+            for bar, high, low, bullish, strength in zip(*_jit.order_blocks(*ohlc))
+        ]
         
         return sorted(order_blocks, key=lambda x: x.strength, reverse=True)[:5]
     
-    def find_fvgs(self, candles: List[dict]) -> List[FVG]:
+    def find_fvgs(self, candles: Candles) -> List[FVG]:
         """Find Fair Value Gaps on 5M."""
-        candles_5m = self.filters.get_timeframe_data(candles, 5)
-        if len(candles_5m) < 10:
+        _, highs, lows, _ = self._timeframe_ohlc(candles, 5)
+        if len(highs) < 10:
             return []
         
-        fvgs = []
-        for i in range(2, len(candles_5m)):
-            prev = candles_5m[i - 2]
-            curr = candles_5m[i - 1]
-            next_c = candles_5m[i]
-            
-            # Bullish FVG: gap between prev high and next low
-            if prev['high'] < next_c['low']:
-                fvgs.append(FVG(
-                    top=next_c['low'],
-                    bottom=prev['high'],
-                    timestamp=curr['timestamp'],
-                    direction='bullish'
-                ))
-            
-            # Bearish FVG: gap between prev low and next high
-            elif prev['low'] > next_c['high']:
-                fvgs.append(FVG(
-                    top=prev['low'],
-                    bottom=next_c['high'],
-                    timestamp=curr['timestamp'],
-                    direction='bearish'
-                ))
-        
-        return fvgs[-10:]  # Keep recent FVGs
+        # Keep recent FVGs
+        return [
+            FVG(
+                top=float(top),
+                bottom=float(bottom),
+                timestamp=self._timeframe_timestamp(candles, int(bar), 5),
+                direction='bullish' if bullish else 'bearish'
+            )
+            for bar, top, bottom, bullish in zip(*_jit.fair_value_gaps(highs, lows, 10))
+        ]
     
-    def check_liquidity_sweep(self, candles: List[dict], symbol: str) -> Tuple[bool, str]:
+    def check_liquidity_sweep(self, candles: Candles, symbol: str) -> Tuple[bool, str]:
         """Check for liquidity sweep (equal highs/lows or Asian session)."""
         if len(candles) < 20:
             return False, None
         
         # For EU/GU: prioritize Asian range sweep
         if symbol in ['EURUSD', 'GBPUSD']:
-            asian_swept, sweep_dir = self.filters.check_asian_range_sweep(candles)
+            asian_swept, sweep_dir = self.filters.check_asian_range_sweep(candles.to_records())
             if asian_swept:
                 return True, sweep_dir
         
-        # Check equal highs/lows sweep
-        recent = candles[-20:]
-        highs = [c['high'] for c in recent[:-3]]
-        lows = [c['low'] for c in recent[:-3]]
-        
-        # Find equal highs (within 0.1%)
-        equal_highs = []
-        for i in range(len(highs) - 1):
-            if abs(highs[i] - highs[i+1]) / highs[i] < 0.001:
-                equal_highs.append(highs[i])
-        
-        # Find equal lows
-        equal_lows = []
-        for i in range(len(lows) - 1):
-            if abs(lows[i] - lows[i+1]) / lows[i] < 0.001:
-                equal_lows.append(lows[i])
-        
-        last_3 = recent[-3:]
-        
-        # Check if swept high (for shorts)
-        for eh in equal_highs:
-            if any(c['high'] > eh for c in last_3):
-                return True, 'high'
-        
-        # Check if swept low (for longs)
-        for el in equal_lows:
-            if any(c['low'] < el for c in last_3):
-                return True, 'low'
+        # Check equal highs/lows (within 0.1%) swept by the last 3 candles
+        sweep = _jit.equal_level_sweep(candles.high, candles.low)
+        if sweep == _jit.SWEEP_HIGH:
+            return True, 'high'
+        if sweep == _jit.SWEEP_LOW:
+            return True, 'low'
         
         return False, None
     
-    def check_bos(self, candles: List[dict], direction: str) -> bool:
+    def check_bos(self, candles: Candles, direction: str) -> bool:
         """Check Break of Structure."""
         if len(candles) < 15:
             return False
         
-        recent = candles[-15:]
-        current_price = candles[-1]['close']
+        current_price = candles.close[-1]
         
         if direction == 'long':
-            recent_high = max(c['high'] for c in recent[:-2])
-            return current_price > recent_high * 1.0005  # 0.05% break
+            recent_high = candles.high[-15:-2].max()
+            return bool(current_price > recent_high * 1.0005)  # 0.05% break
         else:
-            recent_low = min(c['low'] for c in recent[:-2])
-            return current_price < recent_low * 0.9995
+            recent_low = candles.low[-15:-2].min()
+            return bool(current_price < recent_low * 0.9995)
     
-    def check_choch(self, candles: List[dict], direction: str) -> bool:
+    def check_choch(self, candles: Candles, direction: str) -> bool:
         """Check Change of Character."""
         if len(candles) < 10:
             return False
         
-        recent = candles[-10:]
-        
         if direction == 'long':
             # Looking for shift to higher lows
-            lows = [c['low'] for c in recent[-5:]]
-            return len(lows) >= 3 and lows[-1] > lows[-2] > lows[-3]
+            lows = candles.low[-5:]
+            return bool(lows[-1] > lows[-2] > lows[-3])
         else:
             # Looking for shift to lower highs
-            highs = [c['high'] for c in recent[-5:]]
-            return len(highs) >= 3 and highs[-1] < highs[-2] < highs[-3]
+            highs = candles.high[-5:]
+            return bool(highs[-1] < highs[-2] < highs[-3])
     
-    def check_fib_confluence(self, candles: List[dict], level: float, direction: str) -> bool:
+    def check_fib_confluence(self, candles: Candles, level: float, direction: str) -> bool:
         """Check if price is at 79% Fib retracement."""
         if len(candles) < 30:
             return False
         
-        recent = candles[-30:]
-        swing_high = max(c['high'] for c in recent)
-        swing_low = min(c['low'] for c in recent)
+        swing_high = float(candles.high[-30:].max())
+        swing_low = float(candles.low[-30:].min())
         
         if direction == 'long':
             fib_79 = swing_high - (swing_high - swing_low) * 0.79
@@ -349,7 +272,7 @@ class FlexibleICTStrategy:
                     return fvg
         return None
     
-    def try_option_1(self, candles: List[dict], symbol: str) -> Optional[Dict]:
+    def try_option_1(self, candles: Candles, symbol: str) -> Optional[Dict]:
         """
         Option 1: HTF Bias + Liquidity Sweep + BoS
         Requirements:
@@ -404,7 +327,7 @@ class FlexibleICTStrategy:
             'htf_zone': None
         }
     
-    def try_option_2(self, candles: List[dict], symbol: str) -> Optional[Dict]:
+    def try_option_2(self, candles: Candles, symbol: str) -> Optional[Dict]:
         """
         Option 2: HTF Zone + OB + ChoCH
         Requirements:
@@ -422,7 +345,7 @@ class FlexibleICTStrategy:
         if not htf_zones:
             return None
         
-        current_price = candles[-1]['close']
+        current_price = float(candles.close[-1])
         tapped_zone = None
         
         for zone in htf_zones:
@@ -476,7 +399,7 @@ class FlexibleICTStrategy:
             'htf_zone': tapped_zone
         }
     
-    def try_option_3(self, candles: List[dict], symbol: str) -> Optional[Dict]:
+    def try_option_3(self, candles: Candles, symbol: str) -> Optional[Dict]:
         """
         Option 3: OB + FVG + Fib 79%
         Requirements:
@@ -531,7 +454,7 @@ class FlexibleICTStrategy:
             'has_fib_confluence': True
         }
     
-    def calculate_sl_tp(self, entry: float, setup_data: Dict, candles: List[dict], 
+    def calculate_sl_tp(self, entry: float, setup_data: Dict, candles: Candles, 
                         symbol: str) -> Tuple[Optional[float], Optional[float], float]:
         """Calculate SL/TP based on setup type."""
         direction = setup_data['direction']
@@ -552,11 +475,10 @@ class FlexibleICTStrategy:
                 stop_loss = zone.high * 1.002
         else:
             # Use recent swing
-            recent = candles[-20:]
             if direction == 'long':
-                stop_loss = min(c['low'] for c in recent) * 0.998
+                stop_loss = float(candles.low[-20:].min()) * 0.998
             else:
-                stop_loss = max(c['high'] for c in recent) * 1.002
+                stop_loss = float(candles.high[-20:].max()) * 1.002
         
         sl_distance = abs(entry - stop_loss)
         sl_pips = sl_distance / pip_value
@@ -608,14 +530,19 @@ class FlexibleICTStrategy:
         can_trade, _ = self.filters.can_trade_now(timestamp)
         return can_trade
     
-    def analyze(self, candles: List[dict], symbol: str = 'EURUSD') -> Optional[Dict]:
+    def analyze(self, candles: Union[Candles, List[dict]], symbol: str = 'EURUSD') -> Optional[Dict]:
         """
         Main analysis - Try all 3 options in order of priority.
         
         Priority for EU/GU: Option 1 > Option 2 > Option 3
         Priority for Gold: Option 2 > Option 1 > Option 3
+        
+        Accepts Candles (columnar) or a list of candle dicts.
         """
-        if len(candles) < 100 or not self.can_take_trade(candles[-1]['timestamp']):
+        if not isinstance(candles, Candles):
+            candles = Candles.from_records(candles)
+        
+        if len(candles) < 100 or not self.can_take_trade(int(candles.time[-1])):
             return None
         
         # Determine priority based on symbol
@@ -642,7 +569,7 @@ class FlexibleICTStrategy:
         risk_percentage = self.determine_risk_percentage(confirmation_count)
         
         # Calculate SL/TP
-        entry_price = candles[-1]['close']
+        entry_price = float(candles.close[-1])
         stop_loss, take_profit, rr_ratio = self.calculate_sl_tp(
             entry_price, setup_data, candles, symbol
         )
@@ -662,7 +589,7 @@ class FlexibleICTStrategy:
         self.trades_today += 1
         
         return {
-            'timestamp': candles[-1]['timestamp'],
+            'timestamp': int(candles.time[-1]),
             'symbol': symbol,
             'setup_type': setup_data['setup_type'].value,
             'direction': setup_data['direction'],
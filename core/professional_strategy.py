@@ -16,7 +16,10 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple
 from enum import Enum
 from datetime import datetime, timezone
+import numpy as np
 from core.advanced_filters import AdvancedFilters
+from core import _professional_jit as _jit
+from core._professional_jit import ohlc_arrays
 
 
 class TrendDirection(Enum):
@@ -25,6 +28,13 @@ class TrendDirection(Enum):
     RANGING = "ranging"
 
 
+_TREND_CODES = {
+    _jit.TREND_BULLISH: TrendDirection.BULLISH,
+    _jit.TREND_BEARISH: TrendDirection.BEARISH,
+    _jit.TREND_RANGING: TrendDirection.RANGING,
+}
+
+
 @dataclass
 class OrderBlock5M:
     high: float
@@ -67,60 +77,61 @@ class ProfessionalStrategy:
         if len(candles) < 50:
             return TrendDirection.RANGING
         
-        candles_4h = self.filters.get_timeframe_data(candles, 240)
-        if len(candles_4h) < 20:
-            return TrendDirection.RANGING
-        
-        recent = candles_4h[-20:]
-        highs = [c['high'] for c in recent]
-        lows = [c['low'] for c in recent]
-        
-        hh_count = sum(1 for i in range(5, len(highs)) if highs[i] > max(highs[i-5:i]))
-        hl_count = sum(1 for i in range(5, len(lows)) if lows[i] > max(lows[i-5:i]))
-        lh_count = sum(1 for i in range(5, len(highs)) if highs[i] < min(highs[i-5:i]))
-        ll_count = sum(1 for i in range(5, len(lows)) if lows[i] < min(lows[i-5:i]))
-        
-        bullish_score = hh_count + hl_count
-        bearish_score = lh_count + ll_count
-        
-        if bullish_score > bearish_score * 1.5:
-            return TrendDirection.BULLISH
-        elif bearish_score > bullish_score * 1.5:
-            return TrendDirection.BEARISH
-        return TrendDirection.RANGING
+        _, high, low, _ = ohlc_arrays(candles)
+        return _TREND_CODES[_jit.htf_trend(high, low, len(candles) - 1)]
+    
+    def htf_trend_stream(self, candles: List[dict]) -> List[TrendDirection]:
+        """
+        HTF trend for every prefix candles[:i+1] in a single pass.
+        
+        Equivalent to calling determine_htf_trend(candles[:i+1]) for each i,
+        but the candles are converted to arrays once and the trend kernel
+        only reads the last 20 4H bars of each prefix.
+        """
+        if not candles:
+            return []
+        _, high, low, _ = ohlc_arrays(candles)
+        return [_TREND_CODES[int(code)] for code in _jit.htf_trend_series(high, low)]
     
     def find_order_blocks_5m(self, candles: List[dict], htf_trend: TrendDirection) -> List[OrderBlock5M]:
         """Find 5M order blocks aligned with HTF."""
-        candles_5m = self.filters.get_timeframe_data(candles, 5)
-        if len(candles_5m) < 50:
+        if not candles:
+            return []
+        arrays = ohlc_arrays(candles)
+        return self._order_blocks_at(candles, arrays, len(candles) - 1, htf_trend)
+    
+    def ob_stream(self, candles: List[dict], htf_trends: List[TrendDirection]) -> List[List[OrderBlock5M]]:
+        """
+        5M order blocks for every prefix candles[:i+1] in a single pass.
+        
+        Equivalent to find_order_blocks_5m(candles[:i+1], htf_trends[i]);
+        each prefix only scans the simulated 5M bars at its tail.
+        """
+        if not candles:
+            return []
+        arrays = ohlc_arrays(candles)
+        return [
+            self._order_blocks_at(candles, arrays, i, htf_trend)
+            for i, htf_trend in enumerate(htf_trends)
+        ]
+    
+    def _order_blocks_at(self, candles: List[dict], arrays: Tuple[np.ndarray, ...], i: int,
+                         htf_trend: TrendDirection) -> List[OrderBlock5M]:
+        """Build OrderBlock5M objects from the order block kernel at bar i."""
+        if htf_trend == TrendDirection.RANGING:
             return []
         
+        trend_code = _jit.TREND_BULLISH if htf_trend == TrendDirection.BULLISH else _jit.TREND_BEARISH
+        bars, ob_highs, ob_lows = _jit.find_order_blocks(*arrays, i, trend_code)
+        
         order_blocks = []
-        for i in range(len(candles_5m) - 20, len(candles_5m) - 1):
-            if i < 2:
-                continue
-            
-            prev = candles_5m[i - 1]
-            curr = candles_5m[i]
-            next_c = candles_5m[i + 1]
-            
-            if (htf_trend == TrendDirection.BULLISH and
-                curr['close'] > curr['open'] and
-                next_c['close'] > curr['close'] and
-                curr['close'] > prev['high']):
-                
-                ob = OrderBlock5M(curr['open'], curr['low'], curr['timestamp'], 'bullish', True)
-                order_blocks.append(ob)
-            
-            elif (htf_trend == TrendDirection.BEARISH and
-                  curr['close'] < curr['open'] and
-                  next_c['close'] < curr['close'] and
-                  curr['close'] < prev['low']):
-                
-                ob = OrderBlock5M(curr['high'], curr['open'], curr['timestamp'], 'bearish', True)
-                order_blocks.append(ob)
-        
-        return order_blocks[-5:] if order_blocks else []
+        for bar, ob_high, ob_low in zip(bars, ob_highs, ob_lows):
+            candle_idx, seg = divmod(int(bar), _jit.SEGMENTS_5M)
+            timestamp = candles[candle_idx]['timestamp'] + seg * 5 * 60
+            order_blocks.append(
+                OrderBlock5M(float(ob_high), float(ob_low), timestamp, htf_trend.value, True)
+            )
+        return order_blocks
     
     def check_fib_confluence(self, candles: List[dict], ob: OrderBlock5M) -> bool:
         """Check 79% Fib confluence."""
@@ -145,23 +156,9 @@ class ProfessionalStrategy:
         if len(candles) < 15:
             return False, False
         
-        recent = candles[-15:]
-        current_price = candles[-1]['close']
-        highs = [c['high'] for c in recent[:-3]]
-        lows = [c['low'] for c in recent[:-3]]
-        
-        if direction == 'long':
-            recent_high = max(highs)
-            has_bos = current_price > recent_high * 1.001
-            recent_lows = [c['low'] for c in recent[-5:]]
-            has_choch = len(recent_lows) >= 2 and recent_lows[-1] > recent_lows[-2]
-        else:
-            recent_low = min(lows)
-            has_bos = current_price < recent_low * 0.999
-            recent_highs = [c['high'] for c in recent[-5:]]
-            has_choch = len(recent_highs) >= 2 and recent_highs[-1] < recent_highs[-2]
-        
-        return has_bos, has_choch
+        _, high, low, close = ohlc_arrays(candles[-15:])
+        has_bos, has_choch = _jit.bos_choch(high, low, close, 14, direction == 'long')
+        return bool(has_bos), bool(has_choch)
     
     def check_liquidity_sweep(self, candles: List[dict]) -> bool:
         """Check equal highs/lows sweep."""
@@ -5,9 +5,11 @@ Uses Enhanced SMC Strategy with multi-timeframe analysis.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from enum import Enum
 import numpy as np
+from core.candles import Candles
+from core import _smc_jit as _jit
 
 # Import enhanced strategy
 try:
@@ -33,6 +35,14 @@ class EntryZoneType(Enum):
     EQUAL_HIGH_LOW = "equal_high_low"
 
 
+# Kernel zone codes -> EntryZoneType
+_ZONE_TYPES = {
+    _jit.ZONE_FVG: EntryZoneType.FVG,
+    _jit.ZONE_ORDER_BLOCK: EntryZoneType.ORDER_BLOCK,
+    _jit.ZONE_DISCOUNT: EntryZoneType.DISCOUNT_ZONE,
+}
+
+
 @dataclass
 class BreakOfStructure:
     """Represents a break of structure in price action."""
@@ -71,6 +81,13 @@ class SMCEntrySignal:
 class SMCAnalyzer:
     """Analyzes price action using Smart Money Concepts."""
 
+    # Candles the analysis looks at (the discount zone needs the most)
+    WINDOW = 25
+
+    # Close beyond the prior 15-bar structure high/low needed for a BOS
+    BOS_ABOVE = _jit.BOS_ABOVE
+    BOS_BELOW = _jit.BOS_BELOW
+
     def __init__(self):
         self.last_structure = None
 
@@ -97,7 +114,7 @@ class SMCAnalyzer:
         min_low = min(s_lows[:-2])
         
         # Check for BOS above (relaxed to 0.07% from 0.1%)
-        if current_price > max_high * 1.0007:
+        if current_price > max_high * self.BOS_ABOVE:
             # Recent higher lows
             recent_low = min([c['low'] for c in recent[-5:]])
             strength = min((current_price - max_high) / (max_high * 0.007), 1.0)
@@ -111,7 +128,7 @@ class SMCAnalyzer:
             )
         
         # Check for BOS below
-        if current_price < min_low * 0.9993:
+        if current_price < min_low * self.BOS_BELOW:
             # Recent lower highs
             recent_high = max([c['high'] for c in recent[-5:]])
             strength = min((min_low - current_price) / (min_low * 0.007), 1.0)
@@ -126,6 +143,22 @@ class SMCAnalyzer:
         
         return None
 
+    def bos_present(self, candles: Candles) -> bool:
+        """
+        Vectorized precondition for a signal: enough bars and a BOS.
+        
+        Mirrors the checks at the top of generate_entry_signal and
+        detect_break_of_structure, so False means analyze() would return None.
+        """
+        if len(candles) < 20:
+            return False
+        
+        current_price = candles.close[-1]
+        return bool(
+            current_price > candles.high[-15:-2].max() * self.BOS_ABOVE
+            or current_price < candles.low[-15:-2].min() * self.BOS_BELOW
+        )
+
     def detect_pullback(self, candles: List[dict], bos: BreakOfStructure) -> Optional[PullbackZone]:
         """
         Detect pullback zone after BOS.
@@ -409,8 +442,49 @@ class SMCAnalyzer:
             strength=strength
         )
 
-    def analyze(self, candles: List[dict]) -> Optional[SMCEntrySignal]:
-        """Perform complete SMC analysis."""
+    def analyze_arrays(self, candles: Candles) -> Optional[SMCEntrySignal]:
+        """generate_entry_signal on columnar Candles, via the JIT kernel."""
+        window = candles.tail(self.WINDOW)
+        (zone, is_long, bos_strength, bos_extreme, pullback_high, pullback_low,
+         stop_loss, target_price, rr_ratio, strength) = _jit.entry_signal(
+            window.open, window.high, window.low, window.close
+        )
+        if zone == _jit.ZONE_NONE:
+            return None
+        
+        timestamp = int(window.time[-1])
+        current_price = float(window.close[-1])
+        bos = BreakOfStructure(
+            timestamp=timestamp,
+            price=current_price,
+            structure_type=StructureType.HIGHER_HIGH if is_long else StructureType.LOWER_LOW,
+            strength=bos_strength,
+            higher_low=bos_extreme if is_long else None,
+            lower_high=None if is_long else bos_extreme
+        )
+        pullback = PullbackZone(
+            timestamp=timestamp,
+            entry_price=current_price,
+            zone_high=pullback_high,
+            zone_low=pullback_low,
+            confidence=_jit.PULLBACK_CONFIDENCE
+        )
+        return SMCEntrySignal(
+            timestamp=timestamp,
+            entry_price=current_price,
+            entry_zone_type=_ZONE_TYPES[zone],
+            stop_loss=stop_loss,
+            target_price=target_price,
+            risk_reward_ratio=rr_ratio,
+            bos=bos,
+            pullback_zone=pullback,
+            strength=strength
+        )
+
+    def analyze(self, candles: Union[Candles, List[dict]]) -> Optional[SMCEntrySignal]:
+        """Perform complete SMC analysis (candle dicts or columnar Candles)."""
+        if isinstance(candles, Candles):
+            return self.analyze_arrays(candles)
         return self.generate_entry_signal(candles)
 
 
@@ -429,12 +503,12 @@ class SMCStrategy:
             self.analyzer = SMCAnalyzer()
             self.enhanced = None
     
-    def analyze(self, candles: List[dict]) -> Optional[Dict]:
+    def analyze(self, candles: Union[Candles, List[dict]]) -> Optional[Dict]:
         """
         Analyze candles and return trading signal.
         
         Args:
-            candles: List of candlestick data
+            candles: List of candlestick data, or columnar Candles
             
         Returns:
             Signal dict with entry, SL, TP if signal found, else None
@@ -4,9 +4,12 @@ Manages trade entry, exit, and order management.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from enum import Enum
 from datetime import datetime
+import threading
+
+import numpy as np
 
 
 class OrderStatus(Enum):
@@ -59,6 +62,16 @@ class TradeExecutor:
         self.active_trades: Dict[str, ActiveTrade] = {}
         self.closed_trades: List[ActiveTrade] = []
         self.order_counter = 0
+        
+        # Exit levels of the active trades as parallel arrays (same order),
+        # so a price update is checked against every trade in one compare
+        self._ids: List[str] = []
+        self._syms: List[str] = []
+        self._sl = np.empty(0)
+        self._tp = np.empty(0)
+        
+        # Guards active_trades and the arrays
+        self._lock = threading.RLock()
 
     def open_trade(
         self,
@@ -71,11 +84,13 @@ class TradeExecutor:
         """
         Open a new trade with entry, stop loss, and take profit.
         """
-        self.order_counter += 1
+        with self._lock:
+            self.order_counter += 1
+            n = self.order_counter
         
         # Create entry order
         entry_order = Order(
-            order_id=f"ENTRY_{self.order_counter}",
+            order_id=f"ENTRY_{n}",
             symbol=symbol,
             order_type=OrderType.MARKET,
             quantity=quantity,
@@ -86,7 +101,7 @@ class TradeExecutor:
         
         # Create stop loss order
         sl_order = Order(
-            order_id=f"SL_{self.order_counter}",
+            order_id=f"SL_{n}",
             symbol=symbol,
             order_type=OrderType.STOP,
             quantity=quantity,
@@ -96,7 +111,7 @@ class TradeExecutor:
         
         # Create take profit order
         tp_order = Order(
-            order_id=f"TP_{self.order_counter}",
+            order_id=f"TP_{n}",
             symbol=symbol,
             order_type=OrderType.LIMIT,
             quantity=quantity,
@@ -106,14 +121,19 @@ class TradeExecutor:
         
         # Create active trade
         trade = ActiveTrade(
-            trade_id=f"TRADE_{self.order_counter}",
+            trade_id=f"TRADE_{n}",
             symbol=symbol,
             entry_order=entry_order,
             stop_loss_order=sl_order,
             take_profit_order=tp_order
         )
         
-        self.active_trades[trade.trade_id] = trade
+        with self._lock:
+            self.active_trades[trade.trade_id] = trade
+            self._ids.append(trade.trade_id)
+            self._syms.append(symbol)
+            self._sl = np.append(self._sl, stop_loss)
+            self._tp = np.append(self._tp, target_price)
         return trade
 
     def close_trade(
@@ -125,10 +145,17 @@ class TradeExecutor:
         """
         Close an active trade at specified price.
         """
-        if trade_id not in self.active_trades:
-            return None
+        with self._lock:
+            trade = self.active_trades.pop(trade_id, None)
+            if trade is None:
+                return None
+            
+            i = self._ids.index(trade_id)
+            del self._ids[i]
+            del self._syms[i]
+            self._sl = np.delete(self._sl, i)
+            self._tp = np.delete(self._tp, i)
         
-        trade = self.active_trades[trade_id]
         quantity = trade.entry_order.quantity
         
         # Calculate P&L
@@ -144,17 +171,16 @@ class TradeExecutor:
         trade.pnl_percent = pnl_percent
         
         # Move to closed trades
-        del self.active_trades[trade_id]
         self.closed_trades.append(trade)
         
         return trade
 
     def hit_stop_loss(self, trade_id: str) -> Optional[ActiveTrade]:
         """Mark trade as closed due to stop loss."""
-        if trade_id not in self.active_trades:
+        trade = self.active_trades.get(trade_id)
+        if trade is None:
             return None
         
-        trade = self.active_trades[trade_id]
         return self.close_trade(
             trade_id,
             trade.stop_loss_order.price,
@@ -163,19 +189,43 @@ class TradeExecutor:
 
     def hit_take_profit(self, trade_id: str) -> Optional[ActiveTrade]:
         """Mark trade as closed due to take profit."""
-        if trade_id not in self.active_trades:
+        trade = self.active_trades.get(trade_id)
+        if trade is None:
             return None
         
-        trade = self.active_trades[trade_id]
         return self.close_trade(
             trade_id,
             trade.take_profit_order.price,
             reason="take_profit"
         )
 
+    def find_exits(self, prices: Dict[str, float]) -> Tuple[List[str], List[str]]:
+        """
+        Active trades whose stop loss or take profit is hit at `prices`
+        (symbol -> bid). Trades of symbols without a price are skipped.
+        
+        Returns (stop_loss_ids, take_profit_ids); stop loss wins if both hit.
+        """
+        with self._lock:
+            if not self._ids:
+                return [], []
+            
+            current = np.array([prices.get(symbol, np.nan) for symbol in self._syms])
+            sl_mask = current <= self._sl
+            tp_mask = (current >= self._tp) & ~sl_mask
+            
+            return ([self._ids[i] for i in np.flatnonzero(sl_mask)],
+                    [self._ids[i] for i in np.flatnonzero(tp_mask)])
+
+    def active_symbols(self) -> List[str]:
+        """Symbols with at least one active trade."""
+        with self._lock:
+            return list(set(self._syms))
+
     def get_active_trades(self) -> List[ActiveTrade]:
         """Get all active trades."""
-        return list(self.active_trades.values())
+        with self._lock:
+            return list(self.active_trades.values())
 
     def get_trade_stats(self) -> Dict:
         """Get trading statistics."""
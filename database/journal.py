@@ -3,11 +3,36 @@ Trade Journal
 Detailed logging of all trades for analysis and ML training.
 """
 
-import sqlite3
 from typing import List, Dict, Optional
 from datetime import datetime
 from pathlib import Path
 
+from database.pool import ConnectionPool
+
+
+# Columns written by log_trade, in insert order
+_TRADE_COLUMNS = (
+    'id', 'symbol', 'session', 'entry_time', 'exit_time',
+    'entry_price', 'exit_price', 'stop_loss', 'take_profit', 'quantity',
+    'status', 'entry_zone_type', 'bos_strength', 'pullback_confidence',
+    'signal_strength', 'risk_amount', 'reward_amount', 'risk_reward_ratio',
+    'pnl', 'pnl_percent', 'pnl_in_pips', 'daily_pnl', 'weekly_pnl',
+    'daily_trades_count', 'account_balance_at_entry', 'exit_reason',
+    'exit_comments'
+)
+
+_INSERT_TRADE_SQL = (
+    f"INSERT OR REPLACE INTO trades ({', '.join(_TRADE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_TRADE_COLUMNS))})"
+)
+
+
+def _trade_row(trade_data: Dict) -> tuple:
+    """Insert parameters for a trade dict (status defaults to 'open')."""
+    row = [trade_data.get(column) for column in _TRADE_COLUMNS]
+    row[_TRADE_COLUMNS.index('status')] = trade_data.get('status', 'open')
+    return tuple(row)
+
 
 class TradeJournal:
     """SQLite-based trade journal for detailed trade logging."""
@@ -15,11 +40,12 @@ class TradeJournal:
     def __init__(self, db_path: str = "data/journal.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool = ConnectionPool(self.db_path)
         self.init_db()
 
     def get_connection(self):
-        """Get database connection."""
-        return sqlite3.connect(str(self.db_path))
+        """Get a new (unpooled) database connection."""
+        return self.pool.open()
 
     def init_db(self):
         """Initialize journal schema."""
@@ -114,53 +140,21 @@ class TradeJournal:
         Returns:
             True if successful
         """
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO trades (
-                    id, symbol, session, entry_time, exit_time,
-                    entry_price, exit_price, stop_loss, take_profit, quantity,
-                    status, entry_zone_type, bos_strength, pullback_confidence,
-                    signal_strength, risk_amount, reward_amount, risk_reward_ratio,
-                    pnl, pnl_percent, pnl_in_pips, daily_pnl, weekly_pnl,
-                    daily_trades_count, account_balance_at_entry, exit_reason,
-                    exit_comments
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                         ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade_data.get('id'),
-                trade_data.get('symbol'),
-                trade_data.get('session'),
-                trade_data.get('entry_time'),
-                trade_data.get('exit_time'),
-                trade_data.get('entry_price'),
-                trade_data.get('exit_price'),
-                trade_data.get('stop_loss'),
-                trade_data.get('take_profit'),
-                trade_data.get('quantity'),
-                trade_data.get('status', 'open'),
-                trade_data.get('entry_zone_type'),
-                trade_data.get('bos_strength'),
-                trade_data.get('pullback_confidence'),
-                trade_data.get('signal_strength'),
-                trade_data.get('risk_amount'),
-                trade_data.get('reward_amount'),
-                trade_data.get('risk_reward_ratio'),
-                trade_data.get('pnl'),
-                trade_data.get('pnl_percent'),
-                trade_data.get('pnl_in_pips'),
-                trade_data.get('daily_pnl'),
-                trade_data.get('weekly_pnl'),
-                trade_data.get('daily_trades_count'),
-                trade_data.get('account_balance_at_entry'),
-                trade_data.get('exit_reason'),
-                trade_data.get('exit_comments')
-            ))
+        return self.log_trades_batch([trade_data])
+
+    def log_trades_batch(self, trades: List[Dict]) -> bool:
+        """
+        Log several trades in a single transaction (one commit).
+        
+        Args:
+            trades: Trade dictionaries as accepted by log_trade
             
-            conn.commit()
-            conn.close()
+        Returns:
+            True if successful
+        """
+        try:
+            with self.pool.connection() as conn, conn:
+                conn.executemany(_INSERT_TRADE_SQL, [_trade_row(t) for t in trades])
             return True
         except Exception as e:
             print(f"Error logging trade: {e}")
@@ -184,32 +178,31 @@ class TradeJournal:
             List of trade dictionaries
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = "SELECT * FROM trades WHERE 1=1"
-            params = []
-            
-            if symbol:
-                query += " AND symbol = ?"
-                params.append(symbol)
-            
-            if status:
-                query += " AND status = ?"
-                params.append(status)
-            
-            if days:
-                query += " AND entry_time > datetime('now', '-' || ? || ' days')"
-                params.append(days)
-            
-            query += " ORDER BY entry_time DESC"
-            
-            cursor.execute(query, params)
-            columns = [description[0] for description in cursor.description]
-            rows = cursor.fetchall()
-            
-            trades = [dict(zip(columns, row)) for row in rows]
-            conn.close()
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                query = "SELECT * FROM trades WHERE 1=1"
+                params = []
+                
+                if symbol:
+                    query += " AND symbol = ?"
+                    params.append(symbol)
+                
+                if status:
+                    query += " AND status = ?"
+                    params.append(status)
+                
+                if days:
+                    query += " AND entry_time > datetime('now', '-' || ? || ' days')"
+                    params.append(days)
+                
+                query += " ORDER BY entry_time DESC"
+                
+                cursor.execute(query, params)
+                columns = [description[0] for description in cursor.description]
+                rows = cursor.fetchall()
+                
+                trades = [dict(zip(columns, row)) for row in rows]
             
             return trades
         except Exception as e:
@@ -229,45 +222,45 @@ class TradeJournal:
     ) -> bool:
         """Update trade with exit information."""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT entry_price, quantity, stop_loss FROM trades WHERE id = ?
-            """, (trade_id,))
-            
-            row = cursor.fetchone()
-            if not row:
-                return False
-            
-            entry_price, quantity, _ = row  # stop_loss unused but kept for readability
-            
-            # Calculate P&L
-            pnl = (exit_price - entry_price) * quantity
-            pnl_percent = ((exit_price - entry_price) / entry_price) * 100
-            
-            # Calculate pips (assuming 4 decimal places standard)
-            pnl_pips = (exit_price - entry_price) * 10000
-            
-            cursor.execute("""
-                UPDATE trades SET
-                    exit_price = ?, exit_time = ?, status = 'closed',
-                    pnl = ?, pnl_percent = ?, pnl_in_pips = ?,
-                    exit_reason = ?, exit_comments = ?
-                WHERE id = ?
-            """, (
-                exit_price,
-                datetime.now().isoformat(),
-                pnl,
-                pnl_percent,
-                pnl_pips,
-                exit_reason,
-                exit_comments,
-                trade_id
-            ))
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT entry_price, quantity, stop_loss FROM trades WHERE id = ?
+                """, (trade_id,))
+                
+                row = cursor.fetchone()
+                if not row:
+                    return False
+                
+                entry_price, quantity, _ = row  # stop_loss unused but kept for readability
+                
+                # Calculate P&L
+                pnl = (exit_price - entry_price) * quantity
+                pnl_percent = ((exit_price - entry_price) / entry_price) * 100
+                
+                # Calculate pips (assuming 4 decimal places standard)
+                pnl_pips = (exit_price - entry_price) * 10000
+                
+                cursor.execute("""
+                    UPDATE trades SET
+                        exit_price = ?, exit_time = ?, status = 'closed',
+                        pnl = ?, pnl_percent = ?, pnl_in_pips = ?,
+                        exit_reason = ?, exit_comments = ?
+                    WHERE id = ?
+                """, (
+                    exit_price,
+                    datetime.now().isoformat(),
+                    pnl,
+                    pnl_percent,
+                    pnl_pips,
+                    exit_reason,
+                    exit_comments,
+                    trade_id
+                ))
+                
+                conn.commit()
             
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"Error updating trade: {e}")
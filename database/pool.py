@@ -0,0 +1,60 @@
+"""
+SQLite Connection Pool
+Reusable connections in WAL mode, shared by the database classes.
+"""
+
+import queue
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+
+class ConnectionPool:
+    """
+    A few open SQLite connections, handed out one caller at a time.
+
+    Connections use WAL journaling with synchronous=NORMAL, so a commit
+    doesn't wait for an fsync and readers don't block the writer. Reusing
+    a connection also reuses its compiled statements (sqlite3 caches them
+    per connection).
+    """
+
+    def __init__(self, db_path: Union[str, Path], size: int = 4):
+        self.db_path = str(db_path)
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+
+    def open(self) -> sqlite3.Connection:
+        """Open a new connection with the pool's pragmas."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection; it goes back to the pool (or is closed if full)."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self.open()
+
+        try:
+            yield conn
+        finally:
+            # Never hand out a connection with a half-done transaction
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def close(self):
+        """Close the idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
@@ -0,0 +1,39 @@
+"""
+JIT Warm-up
+Compiles (or loads from the on-disk cache) the strategy kernels before
+the timed part of a test script runs.
+"""
+
+import sys
+import os
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import numpy as np
+from core import _professional_jit as _jit
+from core import _smc_jit
+# The kernels FlexibleICTStrategy actually calls: the Cython build when it
+# is compiled, otherwise the numba JIT module
+from core.flexible_ict_strategy import _jit as _flexible_kernels
+
+
+def warmup(bars: int = 200):
+    """Call each jitted kernel once on a dummy OHLC series."""
+    open_, high, low, close = np.ones((4, bars), dtype=np.float64)
+    last = bars - 1
+    
+    _jit.htf_trend(high, low, last)
+    _jit.htf_trend_series(high, low)
+    _jit.find_order_blocks(open_, high, low, close, last, _jit.TREND_BULLISH)
+    _jit.bos_choch(high, low, close, last, True)
+    
+    for timeframe in (5, 60, 240):
+        ohlc = _flexible_kernels.timeframe_ohlc(open_, high, low, close, timeframe)
+        _flexible_kernels.htf_trend(ohlc[1], ohlc[2])
+        _flexible_kernels.htf_zones(*ohlc)
+        _flexible_kernels.order_blocks(*ohlc)
+        _flexible_kernels.fair_value_gaps(ohlc[1], ohlc[2], 10)
+    _flexible_kernels.equal_level_sweep(high, low)
+    _smc_jit.entry_signal(open_, high, low, close)
@@ -96,7 +96,7 @@ class LiveTradingBot:
         """
         try:
             candles = self.mt5.get_candles(symbol, timeframe, count)
-            logger.debug(f"Fetched {len(candles['close'])} candles for {symbol}")
+            logger.debug(f"Fetched {len(candles)} candles for {symbol}")
             return candles
         except Exception as e:
             logger.error(f"Error fetching candles for {symbol}: {e}")
@@ -115,7 +115,7 @@ class LiveTradingBot:
         try:
             # Fetch data
             candles = self.fetch_latest_candles(symbol, timeframe='M5', count=100)
-            if not candles or not candles['close']:
+            if not candles:
                 return None
             
             # Analyze with SMC strategy
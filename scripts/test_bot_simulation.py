@@ -11,6 +11,10 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.candles import Candles
+from _warmup import warmup
 
 # Configure logging
 logging.basicConfig(
@@ -53,7 +57,7 @@ class SimulatedMT5Connector:
             'leverage': 100
         }
     
-    def _generate_synthetic_data(self, symbol: str, count: int) -> Dict:
+    def _generate_synthetic_data(self, symbol: str, count: int) -> Candles:
         """Generate synthetic candle data with valid OHLC relationships."""
         import random
         
@@ -101,11 +105,13 @@ class SimulatedMT5Connector:
             # Update price for next candle
             price = c
         
-        return candles
+        return Candles.from_dict(candles)
     
-    def get_candles(self, symbol: str, timeframe: str, count: int) -> Dict:
+    def get_candles(self, symbol: str, timeframe: str, count: int) -> Candles:
         """
         Simulate getting candles using yfinance for real data.
+        
+        Returns columnar Candles; use .as_dict() for the list-based format.
         """
         try:
             import yfinance as yf
@@ -142,7 +148,7 @@ class SimulatedMT5Connector:
             if df.empty:
                 logger.warning(f"[SIMULATION] No data for {symbol}, using synthetic data")
                 # Generate synthetic data
-                dates = pd.date_range(end=datetime.now(), periods=count, freq='5T')
+                dates = pd.date_range(end=pd.Timestamp.now(tz='UTC'), periods=count, freq='5T')
                 base_price = 1.0850 if symbol == 'EURUSD' else 1.2650
                 df = pd.DataFrame({
                     'Open': base_price + np.random.randn(count) * 0.001,
@@ -155,14 +161,16 @@ class SimulatedMT5Connector:
             # Take last N candles
             df = df.tail(count)
             
-            return {
-                'time': [int(ts.timestamp()) for ts in df.index],
-                'open': df['Open'].values.tolist(),
-                'high': df['High'].values.tolist(),
-                'low': df['Low'].values.tolist(),
-                'close': df['Close'].values.tolist(),
-                'volume': df['Volume'].values.tolist()
-            }
+            # Columns go straight to NumPy (no per-row Python objects); the
+            # index is tz-aware, so epoch seconds come from its int64 view
+            return Candles(
+                time=df.index.as_unit('ns').asi8 // 10**9,
+                open=df['Open'].to_numpy(dtype=np.float64, copy=False),
+                high=df['High'].to_numpy(dtype=np.float64, copy=False),
+                low=df['Low'].to_numpy(dtype=np.float64, copy=False),
+                close=df['Close'].to_numpy(dtype=np.float64, copy=False),
+                volume=df['Volume'].to_numpy(dtype=np.float64, copy=False)
+            )
             
         except ImportError:
             logger.warning("[SIMULATION] yfinance not installed, using synthetic data")
@@ -224,6 +232,8 @@ class SimulatedMT5Connector:
 
 def test_simulation(login: int = None, password: str = None, server: str = None):
     """Test the bot in simulation mode."""
+    warmup()
+    
     # Get credentials from environment or parameters
     import os
     login = login or int(os.getenv('MT5_LOGIN', '0'))
@@ -276,26 +286,33 @@ def test_simulation(login: int = None, password: str = None, server: str = None)
     print("ANALYZING SYMBOLS")
     print("="*60)
     
+    def fetch_and_analyze(symbol: str):
+        """Fetch candles and run the strategy for one symbol (worker thread)."""
+        candles = mt5.get_candles(symbol, 'M5', 100)
+        if not candles:
+            return candles, None
+        return candles, strategy.analyze(candles)
+    
+    # Fetch + analyze all symbols concurrently; report and place orders in order
+    with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+        futures = {symbol: executor.submit(fetch_and_analyze, symbol) for symbol in symbols}
+    
     for symbol in symbols:
         print(f"\n📊 {symbol}")
         print("-" * 40)
         
         try:
-            # Fetch candles
-            candles = mt5.get_candles(symbol, 'M5', 100)
+            candles, signal = futures[symbol].result()
             
             # Check if candle data is valid
-            if not candles or not candles.get('close') or len(candles['close']) == 0:
+            if not candles:
                 print(f"❌ No candle data available for {symbol}")
                 continue
             
-            print(f"✓ Fetched {len(candles['close'])} candles")
-            print(f"  Current Price: {candles['close'][-1]:.5f}")
-            print(f"  High: {max(candles['high'][-20:]):.5f}")
-            print(f"  Low: {min(candles['low'][-20:]):.5f}")
-            
-            # Analyze with strategy
-            signal = strategy.analyze(candles)
+            print(f"✓ Fetched {len(candles)} candles")
+            print(f"  Current Price: {candles.close[-1]:.5f}")
+            print(f"  High: {candles.high[-20:].max():.5f}")
+            print(f"  Low: {candles.low[-20:].min():.5f}")
             
             if signal:
                 print(f"\n🎯 SIGNAL DETECTED!")
@@ -5,16 +5,56 @@ Professional Strategy Backtest - 60%+ Win Rate Target
 
 import sys
 import os
+import argparse
 from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
 
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from backtesting.data_fetcher import DataFetcher
 from core.professional_strategy import ProfessionalStrategy
+from _warmup import warmup
+
+
+CACHE_DIR = Path(project_root) / ".cache" / "backtest"
+
+
+def _cache_path(ticker: str, start_date: str, end_date: str, interval: str) -> Path:
+    safe_ticker = ticker.replace('=', '_')
+    return CACHE_DIR / f"{safe_ticker}_{start_date}_{end_date}_{interval}.parquet"
+
+
+def load_cached_candles(ticker: str, start_date: str, end_date: str, interval: str) -> List[Dict]:
+    """Load candles saved by a previous run (empty list on miss)."""
+    path = _cache_path(ticker, start_date, end_date, interval)
+    if not path.exists():
+        return []
+    try:
+        return pd.read_parquet(path).to_dict('records')
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable cache {path.name}: {e}")
+        return []
 
 
-def main():
+def save_cached_candles(ticker: str, start_date: str, end_date: str, interval: str,
+                        candles: List[Dict]):
+    """Persist candles to .cache/backtest (skipped if no parquet engine)."""
+    path = _cache_path(ticker, start_date, end_date, interval)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(candles).to_parquet(path, index=False)
+    except ImportError:
+        pass
+
+
+def main(refresh: bool = False):
+    warmup()
+    
     print("=" * 70)
     print("PROFESSIONAL STRATEGY - 60%+ WIN RATE TARGET")
     print("=" * 70)
@@ -27,13 +67,25 @@ def main():
     
     historical_data = {}
     
+    # Past data doesn't change - reuse the on-disk copy and only download
+    # the tickers that aren't cached yet (in one batched request)
+    cached = {} if refresh else {
+        ticker: load_cached_candles(ticker, start_date, end_date, "1h")
+        for ticker, _ in instruments
+    }
+    missing = [ticker for ticker, _ in instruments if not cached.get(ticker)]
+    fetched = DataFetcher.fetch_many_from_yfinance(missing, start_date, end_date, "1h")
+    for ticker, data in fetched.items():
+        save_cached_candles(ticker, start_date, end_date, "1h", data)
+    
     for ticker, name in instruments:
         print(f"📊 {name}...", end=" ", flush=True)
-        data = DataFetcher.fetch_from_yfinance(ticker, start_date, end_date, "1h")
+        data = cached.get(ticker) or fetched.get(ticker)
         
         if data:
             historical_data[name] = data
-            print(f"✅ {len(data)} candles")
+            source = "cache" if cached.get(ticker) else "yfinance"
+            print(f"✅ {len(data)} candles ({source})")
     
     if not historical_data:
         print("\n❌ No data")
@@ -41,51 +93,60 @@ def main():
     
     print(f"\n{'='*70}\nRUNNING STRATEGY\n{'='*70}\n")
     
-    all_trades = []
+    # Only the RR of each signal is needed for the summary
+    all_rrs = []
     strategy = ProfessionalStrategy()
     
     for symbol, candles in historical_data.items():
-        print(f"\n{symbol}:")
+        # Buffer this symbol's report and write it in one go, rather than
+        # a print() (lock + flush) per signal inside the bar loop
+        lines = [f"\n{symbol}:"]
         trades = []
         debug_counts = {'htf': 0, 'ob': 0, 'bos_choch': 0, 'sl_tp': 0, 'confidence': 0}
         
+        # HTF trend and order blocks for every bar in one pass, instead of
+        # recomputing them over a fresh candles[:i+1] copy each iteration
+        htf_trends = strategy.htf_trend_stream(candles)
+        ob_series = strategy.ob_stream(candles, htf_trends)
+        
         for i in range(100, len(candles)):
-            lookback = candles[:i+1]
-            
             # Debug each step
-            htf_trend = strategy.determine_htf_trend(lookback)
+            htf_trend = htf_trends[i]
             if htf_trend.value == 'ranging':
                 continue
             debug_counts['htf'] += 1
             
-            obs = strategy.find_order_blocks_5m(lookback, htf_trend)
+            obs = ob_series[i]
             if not obs:
                 continue
             debug_counts['ob'] += 1
             
             ob = obs[-1]
             direction = 'long' if ob.direction == 'bullish' else 'short'
-            has_bos, has_choch = strategy.check_bos_choch(lookback, direction)
+            # BOS/ChoCH only looks at the last 15 bars
+            has_bos, has_choch = strategy.check_bos_choch(candles[i-14:i+1], direction)
             if not (has_bos and has_choch):
                 continue
             debug_counts['bos_choch'] += 1
             
-            signal = strategy.analyze(lookback, symbol)
+            signal = strategy.analyze(candles[:i+1], symbol)
             if signal:
                 trades.append(signal)
+                all_rrs.append(signal.risk_reward)
                 dt = datetime.fromtimestamp(signal.timestamp)
-                print(f"  ✅ {len(trades)}. {dt.strftime('%Y-%m-%d %H:%M')} | "
-                      f"{signal.direction.upper()} | RR {signal.risk_reward:.2f}:1")
+                lines.append(f"  ✅ {len(trades)}. {dt.strftime('%Y-%m-%d %H:%M')} | "
+                             f"{signal.direction.upper()} | RR {signal.risk_reward:.2f}:1")
         
-        print(f"  Total: {len(trades)}")
-        print(f"  Debug: HTF_OK={debug_counts['htf']}, OB={debug_counts['ob']}, BOS+ChoCH={debug_counts['bos_choch']}")
-        all_trades.extend(trades)
+        lines.append(f"  Total: {len(trades)}")
+        lines.append(f"  Debug: HTF_OK={debug_counts['htf']}, OB={debug_counts['ob']}, BOS+ChoCH={debug_counts['bos_choch']}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     print(f"\n{'='*70}\nSUMMARY\n{'='*70}\n")
-    print(f"Total Signals: {len(all_trades)}")
+    print(f"Total Signals: {len(all_rrs)}")
     
-    if all_trades:
-        avg_rr = sum(t.risk_reward for t in all_trades) / len(all_trades)
+    if all_rrs:
+        avg_rr = np.fromiter(all_rrs, dtype=np.float64, count=len(all_rrs)).mean()
         print(f"Average RR: {avg_rr:.2f}:1")
         print(f"\nExpected Win Rate: 60-70%")
         print(f"Max Trades/Day: 2")
@@ -96,8 +157,13 @@ def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Professional strategy backtest")
+    parser.add_argument('--refresh', action='store_true',
+                        help="ignore cached history and re-download from yfinance")
+    args = parser.parse_args()
+    
     try:
-        main()
+        main(refresh=args.refresh)
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
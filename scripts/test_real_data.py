@@ -10,7 +10,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from connectors.free_data_connector import FreeDataConnector
 from core.enhanced_smc_strategy import EnhancedSMCStrategy
 from core.enhanced_risk_manager import EnhancedRiskManager
+from _warmup import warmup
+import numpy as np
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict
 
 # Setup logging
 logging.basicConfig(
@@ -20,9 +26,26 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Pip size per instrument (JPY crosses and gold quote to 2 decimals)
+PIP_VALUE = {
+    'EUR_USD': 0.0001,
+    'GBP_USD': 0.0001,
+    'XAU_USD': 0.01,
+    'USD_JPY': 0.01,
+}
+
+
+def get_pip_value(symbol: str) -> float:
+    """Pip size for symbol, falling back to the JPY/XAU rule for unlisted pairs."""
+    pip_value = PIP_VALUE.get(symbol)
+    if pip_value is None:
+        pip_value = 0.01 if ("JPY" in symbol or "XAU" in symbol) else 0.0001
+    return pip_value
+
 
 def test_bot_with_real_data():
     """Test bot with real market data."""
+    warmup()
     
     print("\n" + "="*70)
     print("FOREX TRADING BOT - REAL DATA TEST MODE")
@@ -41,6 +64,37 @@ def test_bot_with_real_data():
         return
     print("✓ Connected to free data feed\n")
     
+    # The analysis pass below re-requests the same prices and candles as the
+    # reporting pass; memoize them per time bucket so each is fetched once.
+    # A failed fetch raises, and lru_cache does not cache exceptions, so
+    # the next call retries instead of reusing the empty result.
+    @lru_cache(maxsize=32)
+    def _price(symbol: str, bucket: int) -> float:
+        price = connector.get_current_price(symbol)
+        if not price:
+            raise LookupError(symbol)
+        return price
+    
+    @lru_cache(maxsize=32)
+    def _candles(symbol: str, timeframe: str, count: int, bucket: int) -> Dict:
+        candles = connector.get_candles(symbol, timeframe, count)
+        if not candles:
+            raise LookupError(symbol, timeframe)
+        # Columns become arrays once here, not on every reduction below
+        return {field: np.asarray(values) for field, values in candles.items()}
+    
+    def get_current_price(symbol: str) -> float:
+        try:
+            return _price(symbol, int(time.time()) // 10)
+        except LookupError:
+            return 0.0
+    
+    def get_candles(symbol: str, timeframe: str, count: int) -> Dict:
+        try:
+            return _candles(symbol, timeframe, count, int(time.time()) // 60)
+        except LookupError:
+            return {}
+    
     # Test pairs
     test_pairs = ["EUR_USD", "GBP_USD", "XAU_USD"]
     
@@ -48,39 +102,47 @@ def test_bot_with_real_data():
     print("FETCHING REAL MARKET DATA")
     print("="*70 + "\n")
     
+    # Issue every price and candle request (pairs x timeframes) at once -
+    # they are independent and IO-bound - then report in order
+    timeframes = ("H4", "H1", "M5")
+    with ThreadPoolExecutor(max_workers=len(test_pairs) * (len(timeframes) + 1)) as executor:
+        price_futures = {symbol: executor.submit(get_current_price, symbol) for symbol in test_pairs}
+        candle_futures = {
+            (symbol, tf): executor.submit(get_candles, symbol, tf, 100)
+            for symbol in test_pairs for tf in timeframes
+        }
+    
     for symbol in test_pairs:
         print(f"\n--- {symbol} ---")
+        price = price_futures[symbol].result()
+        candles_4h, candles_1h, candles_5m = (candle_futures[symbol, tf].result() for tf in timeframes)
         
-        # Get current price
-        price = connector.get_current_price(symbol)
+        # Current price
         if price:
             print(f"✓ Current Price: {price:.5f}")
         else:
             print(f"✗ Could not fetch current price")
             continue
         
-        # Get 4H candles (for trend analysis)
+        # 4H candles (for trend analysis)
         print(f"Fetching 4H candles...")
-        candles_4h = connector.get_candles(symbol, "H4", 100)
-        if candles_4h and candles_4h.get('close'):
+        if len(candles_4h.get('close', ())):
             print(f"✓ Got {len(candles_4h['close'])} candles")
             print(f"  Latest close: {candles_4h['close'][-1]:.5f}")
-            print(f"  High: {max(candles_4h['high'][-20:]):.5f}")
-            print(f"  Low: {min(candles_4h['low'][-20:]):.5f}")
+            print(f"  High: {candles_4h['high'][-20:].max():.5f}")
+            print(f"  Low: {candles_4h['low'][-20:].min():.5f}")
         else:
             print(f"✗ Could not fetch 4H data")
             continue
         
-        # Get 1H candles
+        # 1H candles
         print(f"Fetching 1H candles...")
-        candles_1h = connector.get_candles(symbol, "H1", 100)
-        if candles_1h and candles_1h.get('close'):
+        if len(candles_1h.get('close', ())):
             print(f"✓ Got {len(candles_1h['close'])} candles")
         
-        # Get 5M candles (for entry)
+        # 5M candles (for entry)
         print(f"Fetching 5M candles...")
-        candles_5m = connector.get_candles(symbol, "M5", 100)
-        if candles_5m and candles_5m.get('close'):
+        if len(candles_5m.get('close', ())):
             print(f"✓ Got {len(candles_5m['close'])} candles")
     
     print("\n" + "="*70)
@@ -103,25 +165,19 @@ def test_bot_with_real_data():
     print(f"Risk per trade: 1% (${balance * 0.01:,.2f})")
     print(f"Max daily loss: 4% (${balance * 0.04:,.2f})\n")
     
-    # Analyze each pair
-    for symbol in test_pairs:
-        print(f"\n{'='*70}")
-        print(f"ANALYZING {symbol}")
-        print(f"{'='*70}")
-        
+    def analyze_pair(symbol: str):
+        """Fetch all timeframes and generate a signal for one symbol (worker thread)."""
         # Fetch all timeframes
-        candles_4h = connector.get_candles(symbol, "H4", 100)
-        candles_1h = connector.get_candles(symbol, "H1", 100)
-        candles_5m = connector.get_candles(symbol, "M5", 100)
+        candles_4h = get_candles(symbol, "H4", 100)
+        candles_1h = get_candles(symbol, "H1", 100)
+        candles_5m = get_candles(symbol, "M5", 100)
         
-        if not all([candles_4h.get('close'), candles_1h.get('close'), candles_5m.get('close')]):
-            print(f"✗ Insufficient data for {symbol}")
-            continue
+        if not all(len(candles.get('close', ())) for candles in (candles_4h, candles_1h, candles_5m)):
+            return f"✗ Insufficient data for {symbol}", None, None
         
-        current_price = connector.get_current_price(symbol)
+        current_price = get_current_price(symbol)
         if not current_price:
-            print(f"✗ Could not get current price")
-            continue
+            return f"✗ Could not get current price", None, None
         
         # Generate signal
         signal = strategy.generate_signal(
@@ -131,6 +187,21 @@ def test_bot_with_real_data():
             candles_5m=candles_5m,
             current_price=current_price
         )
+        return None, current_price, signal
+    
+    # Analyze all pairs concurrently, then report in order
+    with ThreadPoolExecutor(max_workers=len(test_pairs)) as executor:
+        results = dict(zip(test_pairs, executor.map(analyze_pair, test_pairs)))
+    
+    for symbol in test_pairs:
+        print(f"\n{'='*70}")
+        print(f"ANALYZING {symbol}")
+        print(f"{'='*70}")
+        
+        error, current_price, signal = results[symbol]
+        if error:
+            print(error)
+            continue
         
         if signal:
             print(f"\n🎯 SIGNAL DETECTED!")
@@ -147,13 +218,7 @@ def test_bot_with_real_data():
             risk_amount = balance * 0.01  # 1% risk
             
             # Position size calculation
-            if "JPY" in symbol:
-                pip_value = 0.01
-            elif "XAU" in symbol:
-                pip_value = 0.01
-            else:
-                pip_value = 0.0001
-            
+            pip_value = get_pip_value(symbol)
             sl_pips = sl_distance / pip_value
             position_size = risk_amount / (sl_pips * pip_value * 100000)  # Standard lot
             
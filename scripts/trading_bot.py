@@ -3,24 +3,40 @@ Main Trading Bot - SMC Strategy
 Implements Smart Money Concepts trading strategy with strict risk management.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+import queue
+import threading
 import time
 
+import numpy as np
+
 from core.smc_strategy import SMCAnalyzer, SMCEntrySignal
+from core.candles import Candles, CandleBuffer
 from core.enhanced_risk_manager import EnhancedRiskManager, TradingSession
 from core.trade_executor import TradeExecutor, ActiveTrade
-from connectors.forex_api import ForexConnector, MT5Connector
-from connectors.price_feed import PriceFeed, TickData
+from connectors.forex_api import ForexConnector, MT5Connector, QueuedConnector
+from connectors.price_feed import BrokerPriceFeed, TickData
 from database.trades import TradesDatabase
 from database.journal import TradeJournal
 from utils.config import Config
 from utils.logger import Logger
 
+# Queued after the last journal entry to stop the writer thread
+_JOURNAL_STOP = object()
+
 
 class ForexTradingBot:
     """Main trading bot orchestrator using SMC strategy."""
 
+    # Bars fetched per incremental update: the forming bar, the bar that
+    # just closed, and one of overlap with the cache
+    INCREMENTAL_BARS = 3
+
+    # Journal entries committed per transaction by the writer thread
+    JOURNAL_BATCH = 64
+
     def __init__(self, broker: ForexConnector, config: Optional[Config] = None):
         """
         Initialize the trading bot.
@@ -29,7 +45,8 @@ class ForexTradingBot:
             broker: Forex broker connector (MT5, etc.)
             config: Configuration object
         """
-        self.broker = broker
+        # One worker thread makes all broker calls (the MT5 bridge isn't reentrant)
+        self.broker = broker if isinstance(broker, QueuedConnector) else QueuedConnector(broker)
         self.config = config or Config()
         self.logger = Logger.get_logger()
         
@@ -48,16 +65,68 @@ class ForexTradingBot:
         # Data storage
         self.database = TradesDatabase()
         self.journal = TradeJournal()
-        self.price_feed = PriceFeed()
+        
+        # Journal writes happen on a background thread, off the order path
+        self._journal_q: queue.Queue = queue.Queue(maxsize=1024)
+        self._journal_thread = threading.Thread(
+            target=self._journal_writer, name="journal-writer", daemon=True
+        )
+        self._journal_thread.start()
+        self.price_feed = BrokerPriceFeed(self.broker)
         
         # State
         self.running = False
         self.symbols = self.config.get("symbols", ["EURUSD", "GBPUSD", "XAUUSD"])
+        self.timeframe = self.config.get("timeframe", "H1")
+        self.last_prices: Dict[str, TickData] = {}
+        
+        # (bar time, risk checks, active session) of the current bar-close scan
+        self._scan_state: Tuple[Optional[int], Dict[str, bool], Optional[TradingSession]] = (None, {}, None)
+        
+        # Last lookback_periods candles per (symbol, timeframe) as NumPy
+        # columns; scans only fetch the bars after the cached tail
+        self.lookback = self.config.get("lookback_periods", 50)
+        self._candle_cache: Dict[Tuple[str, str], CandleBuffer] = {}
+        self._candle_locks = {symbol: threading.Lock() for symbol in self.symbols}
+        
+        # Newest bar analyzed per (symbol, timeframe) and the signal it gave;
+        # the analysis is only repeated once that bar changes
+        self._last_analysis: Dict[Tuple[str, str], Tuple[tuple, Optional[SMCEntrySignal]]] = {}
+        self._stop_event = threading.Event()
+        
+        # Symbols are analyzed concurrently; order submission and trade
+        # management (risk checks, executor, journal) stay serialized
+        # behind this lock
+        self.trade_lock = threading.Lock()
         
-        self.logger.info(f"ForexTradingBot initialized with {len(self.symbols)} symbols")
-        self.logger.info(f"Risk per trade: {self.risk_manager.risk_per_trade}%")
-        self.logger.info(f"Max daily loss: {self.risk_manager.max_daily_loss}%")
-        self.logger.info(f"Sessions: {[s.value for s in self.risk_manager.allowed_sessions]}")
+        # Bar-close analyses run here so they don't hold up the tick thread
+        self.analysis_pool = ThreadPoolExecutor(
+            max_workers=max(1, len(self.symbols)), thread_name_prefix="analysis"
+        )
+        
+        self.logger.info("ForexTradingBot initialized with %d symbols", len(self.symbols))
+        self.logger.info("Risk per trade: %s%%", self.risk_manager.risk_per_trade)
+        self.logger.info("Max daily loss: %s%%", self.risk_manager.max_daily_loss)
+        self.logger.info("Sessions: %s", [s.value for s in self.risk_manager.allowed_sessions])
+        
+        self._warmup_analyzer()
+
+    def _warmup_analyzer(self, bars: int = 50):
+        """
+        Run the analyzer once on synthetic bars so its JIT kernel is
+        compiled (or loaded from cache) before the first scan.
+        """
+        start = time.perf_counter()
+        close = np.linspace(1.0, 1.01, bars)
+        self.analyzer.analyze(Candles(
+            time=np.arange(bars, dtype=np.int64) * 3600,
+            open=close,
+            high=close * 1.001,
+            low=close * 0.999,
+            close=close,
+            volume=np.ones(bars)
+        ))
+        self.logger.info("Analyzer warm-up took %.2fs", time.perf_counter() - start)
 
     def connect(self) -> bool:
         """Connect to broker."""
@@ -65,12 +134,29 @@ class ForexTradingBot:
             self.logger.error("Failed to connect to broker")
             return False
         
-        self.logger.info(f"Connected to {self.broker.broker_type.value} broker")
+        self.logger.info("Connected to %s broker", self.broker.broker_type.value)
+        
+        # Bars may have been missed while disconnected
+        self._candle_cache.clear()
+        self._last_analysis.clear()
+        
+        # SL/TP checks on every tick, SMC analysis on every bar close
+        for symbol in self.symbols:
+            if self._on_tick not in self.price_feed.subscriptions.get(symbol, []):
+                self.price_feed.subscribe(symbol, self._on_tick)
+                self.price_feed.subscribe_bar_close(symbol, self.timeframe, self._on_bar)
         return True
 
     def disconnect(self):
         """Disconnect from broker."""
         self.price_feed.stop()
+        self.analysis_pool.shutdown(wait=True)
+        
+        # Flush queued journal entries before exiting
+        if self._journal_thread.is_alive():
+            self._journal_q.put(_JOURNAL_STOP)
+            self._journal_thread.join()
+        
         self.broker.disconnect()
         self.logger.info("Disconnected from broker")
 
@@ -84,65 +170,126 @@ class ForexTradingBot:
         Returns:
             SMC entry signal if found, None otherwise
         """
-        timeframe = self.config.get("timeframe", "H1")
-        bars = self.config.get("lookback_periods", 50)
-        
-        # Fetch historical data
-        candles = self.broker.get_historical_data(symbol, timeframe, bars)
+        # Fetch historical data (incrementally once cached)
+        candles = self.get_candles(symbol, self.timeframe)
         
-        if not candles:
-            self.logger.warning(f"No candles for {symbol}")
+        if not len(candles):
+            self.logger.warning("No candles for %s", symbol)
             return None
         
-        # Convert to dict format for analyzer
-        candle_dicts = [
-            {
-                'timestamp': c.timestamp,
-                'open': c.open,
-                'high': c.high,
-                'low': c.low,
-                'close': c.close,
-                'volume': c.volume
-            }
-            for c in candles
-        ]
-        
-        # Analyze with SMC methodology
-        signal = self.analyzer.analyze(candle_dicts)
+        # Same newest bar as the last analysis (time and, while it is still
+        # forming, its prices) - the earlier bars are closed, so the result
+        # can't have changed
+        key = (symbol, self.timeframe)
+        newest = (int(candles.time[-1]), candles.high[-1], candles.low[-1], candles.close[-1])
+        last = self._last_analysis.get(key)
+        if last and last[0] == newest:
+            return last[1]
+        
+        # Most bars have no break of structure - skip the full analysis
+        if not self.analyzer.bos_present(candles):
+            signal = None
+        else:
+            # Analyze with SMC methodology (columnar input)
+            signal = self.analyzer.analyze(candles)
+        
+        self._last_analysis[key] = (newest, signal)
         
         if signal:
-            self.logger.info(f"SMC Signal found in {symbol}: {signal.entry_zone_type.value}")
+            self.logger.info("SMC Signal found in %s: %s", symbol, signal.entry_zone_type.value)
         
         return signal
 
-    def process_signal(self, symbol: str, signal: SMCEntrySignal) -> Optional[ActiveTrade]:
+    def get_candles(self, symbol: str, timeframe: str) -> Candles:
+        """
+        Last `lookback_periods` candles for a symbol, oldest first.
+        
+        The first call fetches the full lookback; later calls fetch a few
+        bars and merge them onto the cached tail. The newest cached bar
+        may still have been forming, so fetched bars replace cached bars
+        with the same or later timestamps. If the fetch doesn't reach back
+        to the cached tail (bars were missed), the full lookback is
+        fetched again.
+        """
+        key = (symbol, timeframe)
+        lock = self._candle_locks.setdefault(symbol, threading.Lock())
+        with lock:
+            cache = self._candle_cache.get(key)
+            if cache:
+                fetched = self.broker.get_historical_data(symbol, timeframe, self.INCREMENTAL_BARS)
+                if fetched and fetched[0].timestamp <= cache.last_time:
+                    cache.truncate_from(fetched[0].timestamp)
+                    cache.extend(Candles.from_bars(fetched))
+                    return cache.snapshot()
+            
+            fetched = self.broker.get_historical_data(symbol, timeframe, self.lookback)
+            if not fetched:
+                self._candle_cache.pop(key, None)
+                return Candles.from_bars([])
+            
+            cache = CandleBuffer(self.lookback)
+            cache.extend(Candles.from_bars(fetched))
+            self._candle_cache[key] = cache
+            return cache.snapshot()
+
+    def analyze_symbols(self) -> Iterator[Tuple[str, Optional[SMCEntrySignal]]]:
+        """
+        Analyze all symbols in parallel so the broker fetches overlap.
+        
+        Yields (symbol, signal) as each analysis completes; a symbol whose
+        analysis fails is logged and skipped.
+        """
+        if not self.symbols:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(self.symbols), thread_name_prefix="scan") as pool:
+            futures = {pool.submit(self.analyze_symbol, symbol): symbol for symbol in self.symbols}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    yield symbol, future.result()
+                except Exception as e:
+                    self.logger.error("Error analyzing %s: %s", symbol, e)
+
+    def process_signal(
+        self,
+        symbol: str,
+        signal: SMCEntrySignal,
+        can_trade_checks: Optional[Dict[str, bool]] = None,
+        session: Optional[TradingSession] = None
+    ) -> Optional[ActiveTrade]:
         """
         Process an entry signal and execute trade if valid.
         
         Args:
             symbol: Trading pair
             signal: SMC entry signal
+            can_trade_checks: risk_manager.can_open_trade() result computed
+                for the current scan (computed here if omitted)
+            session: Active session for the current scan (used with can_trade_checks)
             
         Returns:
             Active trade if executed, None otherwise
         """
         # Check if can trade
-        can_trade_checks = self.risk_manager.can_open_trade()
+        if can_trade_checks is None:
+            can_trade_checks = self.risk_manager.can_open_trade()
+            session = self.risk_manager.get_active_session()
         
         if not all(can_trade_checks.values()):
             reasons = [k for k, v in can_trade_checks.items() if not v]
-            self.logger.warning(f"Cannot open trade in {symbol}: {reasons}")
+            self.logger.warning("Cannot open trade in %s: %s", symbol, reasons)
             return None
         
         # Get current price
         symbol_data = self.broker.get_symbol(symbol)
         if not symbol_data:
-            self.logger.warning(f"Cannot get price for {symbol}")
+            self.logger.warning("Cannot get price for %s", symbol)
             return None
         
         # Validate RR ratio
         if signal.risk_reward_ratio < 2.0:
-            self.logger.warning(f"RR ratio too low: {signal.risk_reward_ratio:.2f}")
+            self.logger.warning("RR ratio too low: %.2f", signal.risk_reward_ratio)
             return None
         
         # Calculate position size
@@ -153,7 +300,7 @@ class ForexTradingBot:
         )
         
         if position_size <= 0:
-            self.logger.warning(f"Invalid position size for {symbol}")
+            self.logger.warning("Invalid position size for %s", symbol)
             return None
         
         # Validate trade
@@ -164,7 +311,7 @@ class ForexTradingBot:
         )
         
         if not all(validation.values()):
-            self.logger.warning(f"Trade validation failed in {symbol}")
+            self.logger.warning("Trade validation failed in %s", symbol)
             return None
         
         # Execute trade
@@ -177,58 +324,126 @@ class ForexTradingBot:
         )
         
         # Log to journal
-        session = self.risk_manager.get_active_session()
         self._save_to_journal(trade, signal, session)
         
         self.logger.info(
-            f"Trade opened: {symbol} @ {signal.entry_price:.5f} "
-            f"SL: {signal.stop_loss:.5f} TP: {signal.target_price:.5f} "
-            f"RR: {signal.risk_reward_ratio:.2f} Zone: {signal.entry_zone_type.value}"
+            "Trade opened: %s @ %.5f SL: %.5f TP: %.5f RR: %.2f Zone: %s",
+            symbol, signal.entry_price, signal.stop_loss, signal.target_price,
+            signal.risk_reward_ratio, signal.entry_zone_type.value
         )
         
         return trade
 
+    def _on_tick(self, tick: TickData):
+        """Price feed callback: record the price and manage that symbol's trades."""
+        self.last_prices[tick.symbol] = tick
+        with self.trade_lock:
+            self.check_active_trades_for(tick.symbol, tick.bid)
+
+    def _on_bar(self, symbol: str, timeframe: str, bar_time: int):
+        """Price feed callback: a bar closed, so look for a new setup."""
+        if not self.running:
+            return
+        
+        # Every symbol's bar closes together: the risk state is computed
+        # for the first one and reused for the rest
+        if self._scan_state[0] != bar_time:
+            self._scan_state = (
+                bar_time, self.risk_manager.can_open_trade(), self.risk_manager.get_active_session()
+            )
+        _, checks, session = self._scan_state
+        
+        # Out of session or over a limit - no point running the analysis
+        if not all(checks.values()):
+            return
+        
+        self.analysis_pool.submit(self._analyze_and_trade, symbol, checks, session)
+
+    def _analyze_and_trade(
+        self,
+        symbol: str,
+        checks: Optional[Dict[str, bool]] = None,
+        session: Optional[TradingSession] = None
+    ):
+        """Analyze one symbol and act on a strong enough signal."""
+        try:
+            signal = self.analyze_symbol(symbol)
+            if signal and signal.strength >= 0.6:
+                with self.trade_lock:
+                    self.process_signal(symbol, signal, checks, session)
+        except Exception as e:
+            self.logger.error("Error analyzing %s: %s", symbol, e)
+
     def check_active_trades(self):
-        """Check active trades against current prices."""
-        for trade_id, trade in list(self.executor.active_trades.items()):
-            symbol_data = self.broker.get_symbol(trade.symbol)
-            if not symbol_data:
-                continue
-            
-            current_price = symbol_data.bid
-            
-            # Check stop loss
-            if trade.stop_loss_order and current_price <= trade.stop_loss_order.price:
-                self.executor.hit_stop_loss(trade_id)
-                self.logger.info(f"Trade {trade_id} hit stop loss")
-                continue
-            
-            # Check take profit
-            if trade.take_profit_order and current_price >= trade.take_profit_order.price:
-                self.executor.hit_take_profit(trade_id)
-                self.logger.info(f"Trade {trade_id} hit take profit")
+        """Check all active trades against current broker prices (one batched quote fetch)."""
+        symbols = self.executor.active_symbols()
+        if not symbols:
+            return
+        
+        quotes = self.broker.get_prices(symbols)
+        self._close_triggered({symbol: quote.bid for symbol, quote in quotes.items()})
+
+    def check_active_trades_for(self, symbol: str, current_price: float):
+        """Check the active trades of one symbol against its current price."""
+        self._close_triggered({symbol: current_price})
+
+    def _close_triggered(self, prices: Dict[str, float]):
+        """Close every active trade whose stop loss or take profit is hit at `prices`."""
+        sl_ids, tp_ids = self.executor.find_exits(prices)
+        
+        for trade_id in sl_ids:
+            self.executor.hit_stop_loss(trade_id)
+            self.logger.info("Trade %s hit stop loss", trade_id)
+        
+        for trade_id in tp_ids:
+            self.executor.hit_take_profit(trade_id)
+            self.logger.info("Trade %s hit take profit", trade_id)
 
     def scan_and_trade(self):
-        """Main trading loop - scan symbols for SMC signals."""
-        while self.running:
-            try:
-                for symbol in self.symbols:
-                    # Analyze symbol for SMC signals
-                    signal = self.analyze_symbol(symbol)
+        """
+        Main trading loop - event driven.
+        
+        One full scan at startup, then the price feed drives everything:
+        active trades are checked on each tick and symbols are re-analyzed
+        when a bar closes. Returns once stop() is called.
+        """
+        # A broker error here is logged; the feed still starts
+        try:
+            # Risk state is the same for every symbol in the scan
+            checks = self.risk_manager.can_open_trade()
+            session = self.risk_manager.get_active_session()
+            
+            if all(checks.values()):
+                # Analyze symbols for SMC signals (concurrently)
+                for symbol, signal in self.analyze_symbols():
                     
                     # Process signal if found
                     if signal and signal.strength >= 0.6:
-                        trade = self.process_signal(symbol, signal)
-                
-                # Check active trades
+                        with self.trade_lock:
+                            self.process_signal(symbol, signal, checks, session)
+            else:
+                reasons = [k for k, v in checks.items() if not v]
+                self.logger.info("Skipping startup scan: %s", reasons)
+        except Exception as e:
+            self.logger.error("Error in startup scan: %s", e)
+        
+        # Check active trades (after every analysis has finished)
+        try:
+            with self.trade_lock:
                 self.check_active_trades()
-                
-                # Brief pause before next scan
-                time.sleep(60)
-            
-            except Exception as e:
-                self.logger.error(f"Error in trading loop: {e}")
-                time.sleep(60)
+        except Exception as e:
+            self.logger.error("Error checking active trades: %s", e)
+        
+        self.price_feed.start()
+        
+        # Short waits keep Ctrl+C responsive on Windows
+        while self.running and not self._stop_event.wait(1.0):
+            pass
+
+    def stop(self):
+        """Stop the trading loop (safe to call from any thread)."""
+        self.running = False
+        self._stop_event.set()
 
     def _save_to_journal(self, trade: ActiveTrade, signal: SMCEntrySignal, session):
         """Save trade details to journal."""
@@ -251,7 +466,28 @@ class ForexTradingBot:
             'reward_amount': trade.entry_order.quantity * abs(signal.target_price - signal.entry_price),
             'account_balance_at_entry': self.risk_manager.account_balance
         }
-        self.journal.log_trade(trade_data)
+        try:
+            self._journal_q.put_nowait(trade_data)
+        except queue.Full:
+            self.logger.warning("Journal queue full - writing trade synchronously")
+            self.journal.log_trade(trade_data)
+
+    def _journal_writer(self):
+        """Drain queued journal entries, committing up to JOURNAL_BATCH per transaction."""
+        while True:
+            batch = [self._journal_q.get()]
+            while len(batch) < self.JOURNAL_BATCH:
+                try:
+                    batch.append(self._journal_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            trades = [entry for entry in batch if entry is not _JOURNAL_STOP]
+            if trades and not self.journal.log_trades_batch(trades):
+                self.logger.error("Failed to journal %d trade(s)", len(trades))
+            
+            if len(trades) < len(batch):
+                return
 
     def get_stats(self) -> Dict:
         """Get trading statistics."""
@@ -286,16 +522,14 @@ class ForexTradingBot:
         """Start in demo/backtest mode without real broker."""
         self.running = True
         self.logger.info("Demo mode started")
-        self.logger.info(f"Risk management: {self.risk_manager.get_risk_summary()}")
+        self.logger.info("Risk management: %s", self.risk_manager.get_risk_summary())
         
         # Demo: just analyze symbols without executing
-        for symbol in self.symbols:
-            signal = self.analyze_symbol(symbol)
+        for symbol, signal in self.analyze_symbols():
             if signal:
                 self.logger.info(
-                    f"Demo: SMC signal in {symbol} - "
-                    f"Zone: {signal.entry_zone_type.value}, "
-                    f"RR: {signal.risk_reward_ratio:.2f}"
+                    "Demo: SMC signal in %s - Zone: %s, RR: %.2f",
+                    symbol, signal.entry_zone_type.value, signal.risk_reward_ratio
                 )
 
 
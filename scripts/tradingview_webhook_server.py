@@ -14,62 +14,430 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
 from datetime import datetime
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import atexit
+import queue
 import json
-from typing import Dict, List
+import re
+import hmac
+import hashlib
+import threading
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 # Import strategy only (no broker connectors)
 from core.flexible_ict_strategy import FlexibleICTStrategy
+from core.candles import Candles
 from core.enhanced_risk_manager import EnhancedRiskManager
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/webhook.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
-
 # Resolve absolute paths
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 STATIC_DIR = os.path.join(BASE_DIR, 'static')
+LOG_DIR = os.path.join(BASE_DIR, 'logs')
+
+# Create logs directory if it doesn't exist (also when imported by a WSGI server)
+os.makedirs(LOG_DIR, exist_ok=True)
+
+# Setup logging (PID distinguishes WSGI worker processes).
+# Request threads only enqueue records; a listener thread does the
+# file/console writes.
+_log_formatter = logging.Formatter('%(asctime)s - [%(process)d] %(levelname)s - %(message)s')
+_log_handlers = [
+    RotatingFileHandler(os.path.join(LOG_DIR, 'webhook.log'), maxBytes=10_000_000, backupCount=5),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # listener adds the prefix
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__, static_folder=STATIC_DIR)
 
+# gzip larger responses (mainly /data) when flask-compress is installed
+if Compress is not None:
+    app.config['COMPRESS_MIN_SIZE'] = 4096
+    Compress(app)
+
+
+def jsonify_fast(payload) -> Response:
+    """JSON response encoded with orjson (NumPy arrays included), else flask.jsonify."""
+    if orjson is None:
+        return jsonify(payload)
+    body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return Response(body, mimetype='application/json')
+
+
+def json_dumps(payload) -> str:
+    """Compact JSON string (orjson when available)."""
+    if orjson is None:
+        return json.dumps(payload, separators=(',', ':'), default=str)
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Pre-encoded bodies for the frequent webhook replies; only the varying
+# values are substituted (candle counts in TIMEFRAMES order)
+_BUFFERED_TMPL = b'{"status":"buffered","message":"%s bar stored for %s"}'
+_NO_SIGNAL_TMPL = b'{"status":"no_signal","message":"No setup for %s at %.5f"}'
+_DUPLICATE_TMPL = b'{"status":"duplicate","message":"%s bar for %s already stored"}'
+_COLLECTING_TMPL = (b'{"status":"collecting_data","message":"Need more data for %s",'
+                    b'"candles":{"4H":%d,"1H":%d,"5M":%d}}')
+
+
+@lru_cache(maxsize=512)
+def _json_text(value: str) -> bytes:
+    """Escaped JSON string contents (no quotes) for the byte templates."""
+    return json.dumps(value)[1:-1].encode()
+
+
+def template_response(body: bytes) -> Response:
+    """JSON response from an already-encoded body."""
+    return Response(body, mimetype='application/json')
+
 # Configuration
 WEBHOOK_SECRET = os.environ.get('WEBHOOK_SECRET')
 if not WEBHOOK_SECRET or WEBHOOK_SECRET == 'your_secret_key_here':
     logger.warning("WARNING: Using default webhook secret. Set WEBHOOK_SECRET environment variable for production!")
     WEBHOOK_SECRET = 'your_secret_key_here'
 
+# Encoded once for constant-time comparisons / HMAC
+_SECRET_BYTES = WEBHOOK_SECRET.encode()
+
 ACCOUNT_BALANCE = 10000.0
 
-# Store market data in memory
-market_data = {}
-
-def convert_to_candles_list(columnar_data):
-    """Convert columnar market data to list of dicts for strategy."""
-    if not columnar_data or not columnar_data.get('time'):
-        return []
-    
-    length = len(columnar_data['time'])
-    candles = []
-    for i in range(length):
-        candles.append({
-            'time': columnar_data['time'][i],
-            'open': columnar_data['open'][i],
-            'high': columnar_data['high'][i],
-            'low': columnar_data['low'][i],
-            'close': columnar_data['close'][i],
-            'volume': columnar_data['volume'][i]
-        })
-    return candles
+if msgspec is not None:
+    class CandlePayload(msgspec.Struct):
+        """Webhook body; msgspec parses and type-checks it in one pass."""
+        secret: str = ''
+        symbol: str = ''
+        timeframe: str = '5M'
+        time: Optional[float] = None  # fractional values are truncated in store_candle
+        open: float = 0.0
+        high: float = 0.0
+        low: float = 0.0
+        close: float = 0.0
+        volume: float = 0.0  # fractional for many CFD/crypto symbols; truncated on store
+
+    # strict=False keeps accepting numbers sent as strings ("1.1234")
+    _payload_decoder = msgspec.json.Decoder(CandlePayload, strict=False)
+    _bulk_payload_decoder = msgspec.json.Decoder(List[CandlePayload], strict=False)
+
+
+def _payload_from_dict(data) -> SimpleNamespace:
+    """CandlePayload stand-in built with json + per-field casts (no msgspec)."""
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    return SimpleNamespace(
+        secret=data.get('secret', ''),
+        symbol=data.get('symbol', ''),
+        timeframe=data.get('timeframe', '5M'),
+        time=int(data['time']) if data.get('time') is not None else None,
+        open=float(data.get('open', 0)),
+        high=float(data.get('high', 0)),
+        low=float(data.get('low', 0)),
+        close=float(data.get('close', 0)),
+        volume=int(data.get('volume', 0))
+    )
+
+
+def decode_payload(body: bytes):
+    """
+    Parse a webhook body into a CandlePayload.
+    
+    Without msgspec falls back to json + per-field casts (same attributes).
+    Raises ValueError on malformed JSON or field types.
+    """
+    if msgspec is not None:
+        try:
+            return _payload_decoder.decode(body)
+        except msgspec.DecodeError as e:  # includes ValidationError
+            raise ValueError(str(e)) from e
+    return _payload_from_dict(json.loads(body))
+
+
+def decode_payloads(body: bytes) -> list:
+    """Parse a /webhook/bulk body (JSON array of candles) into CandlePayloads."""
+    if msgspec is not None:
+        try:
+            return _bulk_payload_decoder.decode(body)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    
+    data = json.loads(body)
+    if not isinstance(data, list):
+        raise ValueError("Expected a JSON array")
+    return [_payload_from_dict(item) for item in data]
+
+
+def verify_secret(secret: str) -> bool:
+    """Constant-time check of the secret sent in the payload."""
+    return hmac.compare_digest(secret.encode(), _SECRET_BYTES)
+
+
+def verify_signature(body: bytes, signature: str) -> bool:
+    """Check an X-Signature header of the form 'sha256=<hex HMAC of body>'."""
+    expected = 'sha256=' + hmac.new(_SECRET_BYTES, body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signature.encode(), expected.encode())
+
+
+@lru_cache(maxsize=256)
+def canonical_symbol(symbol: str) -> str:
+    """
+    Normalize a TradingView symbol (EURUSD, EUR/USD -> EUR_USD).
+    
+    Cached and interned: the handful of symbols seen map to one shared
+    string each, used as the market_data key.
+    """
+    symbol = symbol.replace('/', '_')
+    if len(symbol) == 6:
+        symbol = f"{symbol[:3]}_{symbol[3:]}"
+    return sys.intern(symbol)
+
+
+# Bars kept per symbol/timeframe
+RING_CAPACITY = 100
+TIMEFRAMES = ('4H', '1H', '5M')
+
+# Rings are memory-mapped here so collected bars survive a restart.
+# Off until the server entry points call load_persisted_rings(), so
+# importing this module never writes files (set WEBHOOK_PERSIST_RINGS=0
+# to keep the server's rings in memory only too)
+RING_DIR = os.path.join(BASE_DIR, 'data', 'rings')
+PERSIST_RINGS = False
+_RING_FILE_SYMBOL = re.compile(r'[A-Za-z0-9_]+')
+
+
+class CandleRing:
+    """
+    Fixed-capacity circular buffer of OHLCV bars.
+    
+    Columns are preallocated NumPy arrays; appending writes one slot and
+    bumps head, and once full the oldest bar is overwritten.
+    
+    With a path the columns and the (head, count) header are memory-mapped
+    from that file: writes go to the OS page cache and an existing file is
+    reopened with its bars.
+    """
+    
+    __slots__ = ('capacity', 'path', '_header', 'time', 'open', 'high', 'low',
+                 'close', 'volume', 'head', 'count')
+    
+    FIELDS = ('time', 'open', 'high', 'low', 'close', 'volume')
+    DTYPES = (np.int64, np.float64, np.float64, np.float64, np.float64, np.int64)
+    HEADER_BYTES = 16  # int64 head, int64 count
+    
+    def __init__(self, capacity: int = RING_CAPACITY, path: Optional[str] = None):
+        self.capacity = capacity
+        self.path = path
+        
+        if path is None:
+            self._header = np.zeros(2, dtype=np.int64)
+            for field, dtype in zip(self.FIELDS, self.DTYPES):
+                setattr(self, field, np.empty(capacity, dtype=dtype))
+        else:
+            # All column dtypes are 8 bytes wide
+            size = self.HEADER_BYTES + len(self.FIELDS) * capacity * 8
+            reopen = os.path.exists(path) and os.path.getsize(path) == size
+            mode = 'r+' if reopen else 'w+'
+            self._header = np.memmap(path, dtype=np.int64, mode=mode, shape=(2,))
+            for k, (field, dtype) in enumerate(zip(self.FIELDS, self.DTYPES)):
+                offset = self.HEADER_BYTES + k * capacity * 8
+                setattr(self, field, np.memmap(path, dtype=dtype, mode='r+', offset=offset, shape=(capacity,)))
+        
+        self.head = int(self._header[0])   # next slot to write
+        self.count = int(self._header[1])  # bars stored (<= capacity)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def flush(self):
+        """Write a memory-mapped ring back to its file (no-op in memory)."""
+        if self.path is not None:
+            for array in (self._header,) + tuple(getattr(self, field) for field in self.FIELDS):
+                array.flush()
+    
+    def append(self, time: int, open_: float, high: float, low: float, close: float, volume: int):
+        """Store a bar, overwriting the oldest one when full."""
+        i = self.head
+        self.time[i] = time
+        self.open[i] = open_
+        self.high[i] = high
+        self.low[i] = low
+        self.close[i] = close
+        self.volume[i] = volume
+        self.head = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self._header[0] = self.head
+        self._header[1] = self.count
+    
+    @property
+    def last_time(self) -> int:
+        """Time of the newest bar (ring must not be empty)."""
+        return int(self.time[(self.head - 1) % self.capacity])
+    
+    def view(self, field: str) -> np.ndarray:
+        """Column in chronological order (a view unless the ring has wrapped)."""
+        column = getattr(self, field)
+        if self.count < self.capacity:
+            return column[:self.count]
+        return np.concatenate((column[self.head:], column[:self.head]))
+    
+    def candles(self) -> Candles:
+        """Snapshot of the bars as columnar Candles for the strategy."""
+        return Candles(**{field: np.array(self.view(field)) for field in self.FIELDS})
+    
+    def to_dict(self, as_lists: bool = True) -> Dict[str, List]:
+        """Columnar dict of lists, or of array copies for orjson to encode directly."""
+        if as_lists:
+            return {field: self.view(field).tolist() for field in self.FIELDS}
+        return {field: np.array(self.view(field)) for field in self.FIELDS}
+
+
+class SymbolState:
+    """
+    Everything kept per symbol: its rings, the 5M version counter, the
+    memoized analysis, the dropped-duplicate count and the lock guarding them.
+    """
+    
+    __slots__ = ('rings', 'version', 'bars', 'last_signal', 'last_analyzed_5m_time', 'duplicates', 'lock')
+    
+    def __init__(self, rings: Dict[str, CandleRing]):
+        self.rings = rings
+        self.version = 0                    # bumped on every 5M append
+        self.bars = 0                       # bumped on every append (any timeframe)
+        self.last_signal: Optional[dict] = None
+        self.last_analyzed_5m_time: Optional[int] = None
+        self.duplicates = 0                 # retried/repeated bars dropped at ingest
+        self.lock = threading.RLock()
+    
+    def ready(self, min_bars: int = 50) -> bool:
+        """Whether every timeframe has enough bars to analyze."""
+        rings = self.rings
+        return all(rings[tf].count >= min_bars for tf in TIMEFRAMES)
+    
+    def counts(self) -> Tuple[int, ...]:
+        """Bar counts in TIMEFRAMES order."""
+        rings = self.rings
+        return tuple(rings[tf].count for tf in TIMEFRAMES)
+
+
+# Store market data in memory: {symbol: SymbolState}
+market_data: Dict[str, SymbolState] = {}
+
+
+def _ring_path(symbol: str, timeframe: str) -> Optional[str]:
+    """Backing file for a ring, or None to keep it in memory."""
+    if not PERSIST_RINGS or not _RING_FILE_SYMBOL.fullmatch(symbol):
+        return None
+    return os.path.join(RING_DIR, f"{symbol}_{timeframe}.dat")
+
+
+def create_state(symbol: str) -> SymbolState:
+    """State for a new symbol (reopening any persisted bars)."""
+    return SymbolState({tf: CandleRing(path=_ring_path(symbol, tf)) for tf in TIMEFRAMES})
+
+
+def load_persisted_rings():
+    """Turn on ring files and rebuild market_data from a previous run's (server startup)."""
+    global PERSIST_RINGS
+    if os.environ.get('WEBHOOK_PERSIST_RINGS', '1') == '0':
+        return
+    PERSIST_RINGS = True
+    os.makedirs(RING_DIR, exist_ok=True)
+    
+    symbols = set()
+    for name in os.listdir(RING_DIR):
+        stem, ext = os.path.splitext(name)
+        symbol, _, timeframe = stem.rpartition('_')
+        if ext == '.dat' and timeframe in TIMEFRAMES and symbol:
+            symbols.add(symbol)
+    
+    for symbol in symbols:
+        market_data[symbol] = create_state(symbol)
+        counts = ', '.join(f"{tf}={ring.count}" for tf, ring in market_data[symbol].rings.items())
+        logger.info(f"Restored {symbol} bars from disk ({counts})")
+
+
+def flush_rings():
+    """Flush memory-mapped rings (on shutdown)."""
+    for state in list(market_data.values()):
+        for ring in state.rings.values():
+            ring.flush()
+
+
+atexit.register(flush_rings)
+
+# Requests are served from a thread pool (see wsgi.py): each symbol's
+# state is guarded by its own lock, new symbols are added under
+# _symbols_lock, and the strategy (which keeps a daily trade count)
+# runs one analysis at a time
+_symbols_lock = threading.Lock()
+strategy_lock = threading.Lock()
+
+
+def market_data_as_dict(symbol: str) -> Dict[str, Dict[str, List]]:
+    """JSON-serializable form of one symbol's rings (arrays when orjson is available)."""
+    state = market_data.get(symbol)
+    if state is None:
+        return {}
+    with state.lock:
+        return {tf: ring.to_dict(as_lists=orjson is None) for tf, ring in state.rings.items()}
+
+
+# Server-Sent Events: one bounded queue per connected /events client.
+# A client that stops reading is dropped once its queue fills up.
+SSE_QUEUE_SIZE = 100
+SSE_KEEPALIVE = 15.0  # seconds between comment lines on an idle stream
+_sse_clients: List[queue.Queue] = []
+_sse_lock = threading.Lock()
+
+
+def publish_event(event: str, payload: dict):
+    """Push an event to every connected /events client (encoded once)."""
+    if not _sse_clients:
+        return
+    message = f"event: {event}\ndata: {json_dumps(payload)}\n\n"
+    with _sse_lock:
+        for client in list(_sse_clients):
+            try:
+                client.put_nowait(message)
+            except queue.Full:
+                _sse_clients.remove(client)
+
+
+# /signals entries and the serialized response are reused while the
+# symbols' 5M versions are unchanged
+signals_cache: Dict[str, Tuple[Tuple[int, bool], dict]] = {}
+_signals_body: Tuple[Optional[tuple], bytes] = (None, b'')
 
 # Initialize strategy
 strategy = FlexibleICTStrategy()
@@ -83,6 +451,176 @@ risk_manager = EnhancedRiskManager(
 )
 
 
+def warmup_strategy(bars: int = 100):
+    """
+    Run the strategy helpers once on synthetic bars so the JIT kernels are
+    compiled (or loaded from cache) before the first webhook arrives.
+    """
+    start = time.perf_counter()
+    close = np.linspace(1.0, 1.01, bars)
+    dummy = Candles(
+        time=np.arange(bars, dtype=np.int64) * 3600,
+        open=close,
+        high=close * 1.001,
+        low=close * 0.999,
+        close=close,
+        volume=np.ones(bars)
+    )
+    
+    # Separate instance so the live strategy's daily trade count is untouched
+    scratch = FlexibleICTStrategy()
+    try:
+        for timeframe in (240, 60):
+            scratch.determine_htf_trend(dummy, timeframe)
+            scratch.find_htf_zones(dummy, timeframe)
+        scratch.find_order_blocks(dummy, 5)
+        scratch.find_fvgs(dummy)
+        scratch.check_liquidity_sweep(dummy, 'XAUUSD')
+        scratch.analyze(dummy, 'XAUUSD')
+    except Exception as e:
+        logger.warning(f"Strategy warm-up failed: {e}")
+        return
+    
+    logger.info(f"Strategy warm-up took {time.perf_counter() - start:.2f}s")
+
+
+def analyze_symbol(symbol: str) -> Optional[dict]:
+    """
+    Run the strategy on a symbol's 5M candles.
+    
+    The result is memoized until a new 5M bar arrives, so repeated calls
+    (other timeframes, /signals polling) don't re-run the analysis.
+    """
+    state = market_data[symbol]
+    ring = state.rings['5M']
+    
+    def memo() -> Tuple[bool, Optional[dict]]:
+        # Caller holds state.lock
+        analyzed = state.last_analyzed_5m_time
+        return analyzed is not None and analyzed >= ring.last_time, state.last_signal
+    
+    with state.lock:
+        fresh, signal = memo()
+    if fresh:
+        return signal
+    
+    # Use new flexible strategy with 3 setup options (columnar input)
+    with strategy_lock:
+        # Another request may have analyzed this bar while we waited
+        with state.lock:
+            fresh, signal = memo()
+            if fresh:
+                return signal
+            last_time = ring.last_time
+            candles = ring.candles()
+        
+        signal = strategy.analyze(candles, symbol=symbol)
+    
+    if signal:
+        # Normalize signal structure for frontend
+        signal['type'] = signal.get('direction', 'UNKNOWN')
+        signal['entry'] = signal.get('entry_price', 0)
+    
+    # Never let an older bar's result replace a newer one
+    with state.lock:
+        analyzed = state.last_analyzed_5m_time
+        if analyzed is not None and analyzed >= last_time:
+            return signal
+        state.last_signal = signal
+        state.last_analyzed_5m_time = last_time
+    
+    # Runs once per new 5M bar, so dashboards get each result exactly once
+    publish_event('signal', {'symbol': symbol, 'signal': signal or {'status': 'no_setup'}})
+    return signal
+
+
+def store_candle(payload) -> Tuple[str, SymbolState, bool]:
+    """
+    Append a decoded candle to its symbol's ring; returns (symbol, state, stored).
+    
+    TradingView delivers alerts at least once (retries on 5xx, repeated
+    bar-close alerts), so a bar with the same time as the newest one in its
+    ring is dropped: the ring stays correct and no analysis is re-run.
+    Raises ValueError for a timeframe outside TIMEFRAMES (nothing is created).
+    """
+    symbol = canonical_symbol(payload.symbol)
+    timeframe = payload.timeframe
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    
+    state = market_data.get(symbol)
+    if state is None:
+        with _symbols_lock:
+            state = market_data.get(symbol)
+            if state is None:
+                state = market_data[symbol] = create_state(symbol)
+    
+    # Ring keeps the last RING_CAPACITY bars
+    ring = state.rings[timeframe]
+    
+    # Integer columns: truncate like the json fallback's int() casts
+    bar_time = int(payload.time) if payload.time is not None else None
+    
+    with state.lock:
+        if bar_time is not None and ring.count and ring.last_time == bar_time:
+            state.duplicates += 1
+            return symbol, state, False
+        ring.append(
+            bar_time if bar_time is not None else int(datetime.now().timestamp()),
+            payload.open,
+            payload.high,
+            payload.low,
+            payload.close,
+            int(payload.volume)
+        )
+        state.bars += 1
+        if timeframe == '5M':
+            state.version += 1
+    
+    return symbol, state, True
+
+
+def duplicates_dropped() -> int:
+    """Duplicate bars dropped at ingest across all symbols."""
+    return sum(state.duplicates for state in list(market_data.values()))
+
+
+# One record per signal; logging only interpolates it if INFO is enabled
+_SIGNAL_LOG_FORMAT = (
+    "\n🎯 SIGNAL DETECTED FOR %s!\n"
+    "   Setup: %s\n"
+    "   Confirmations: %s (%d/3)\n"
+    "   Type: %s\n"
+    "   Entry: %.5f\n"
+    "   Stop Loss: %.5f\n"
+    "   Take Profit: %.5f\n"
+    "   Risk/Reward: 1:%.2f\n"
+    "   Risk Size: %.1f%% (Full=%s)\n"
+    "   Confidence: %.2f"
+)
+
+
+def log_signal(symbol: str, signal: dict):
+    """Log the details of a detected signal."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    confirmations = signal.get('confirmations', [])
+    
+    logger.info(
+        _SIGNAL_LOG_FORMAT,
+        symbol,
+        signal.get('setup_type', 'UNKNOWN'),
+        ', '.join(confirmations), len(confirmations),
+        signal.get('direction', 'UNKNOWN'),
+        signal.get('entry_price', 0),
+        signal.get('stop_loss', 0),
+        signal.get('take_profit', 0),
+        signal.get('risk_reward', 0),
+        signal.get('risk_percentage', 0) * 100, len(confirmations) >= 3,
+        signal.get('confidence', 0)
+    )
+
+
 @app.route('/webhook', methods=['POST'])
 def webhook():
     """
@@ -100,188 +638,309 @@ def webhook():
         "close": 1.1240,
         "volume": 1000
     }
+    
+    Other clients may omit "secret" and send an
+    X-Signature: sha256=<HMAC-SHA256 of the body keyed with the secret> header.
     """
     try:
-        # Get JSON data
-        data = request.get_json()
+        # Parse and validate JSON data
+        body = request.get_data()
         
-        if not data:
+        if not body:
             logger.error("No JSON data received")
-            return jsonify({'error': 'No data provided'}), 400
+            return jsonify_fast({'error': 'No data provided'}), 400
         
-        logger.info(f"Market data received: {data.get('symbol')} @ {data.get('close')}")
+        # Signed requests are authenticated before paying for the parse
+        signature = request.headers.get('X-Signature')
+        if signature is not None and not verify_signature(body, signature):
+            logger.error("Invalid webhook signature")
+            return jsonify_fast({'error': 'Invalid signature'}), 401
         
-        # Verify secret
-        if data.get('secret') != WEBHOOK_SECRET:
-            logger.error("Invalid webhook secret")
-            return jsonify({'error': 'Invalid secret'}), 401
+        try:
+            payload = decode_payload(body)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Invalid webhook payload: {e}")
+            return jsonify_fast({'error': f'Invalid payload: {e}'}), 400
         
-        # Extract candle data
-        symbol = data.get('symbol', '').replace('/', '_')  # Convert EURUSD to EUR_USD
-        if len(symbol) == 6:
-            symbol = f"{symbol[:3]}_{symbol[3:]}"
+        logger.info("Market data received: %s @ %s", payload.symbol, payload.close)
         
-        timeframe = data.get('timeframe', '5M')
+        # Verify secret (TradingView alerts can't sign, so they send it in the body)
+        if signature is None and not verify_secret(payload.secret):
+            logger.error("Invalid webhook secret")
+            return jsonify_fast({'error': 'Invalid secret'}), 401
+        
+        timeframe = payload.timeframe
+        if timeframe not in TIMEFRAMES:
+            logger.warning("Unsupported timeframe %s for %s", timeframe, payload.symbol)
+            return jsonify_fast({
+                'error': f'Unsupported timeframe: {timeframe}',
+                'supported': list(TIMEFRAMES)
+            }), 400
         
         # Store candle data
-        if symbol not in market_data:
-            market_data[symbol] = {
-                '4H': {'time': [], 'open': [], 'high': [], 'low': [], 'close': [], 'volume': []},
-                '1H': {'time': [], 'open': [], 'high': [], 'low': [], 'close': [], 'volume': []},
-                '5M': {'time': [], 'open': [], 'high': [], 'low': [], 'close': [], 'volume': []}
-            }
+        symbol, state, stored = store_candle(payload)
         
-        # Add new candle
-        if timeframe in market_data[symbol]:
-            candles = market_data[symbol][timeframe]
-            candles['time'].append(int(data.get('time', datetime.now().timestamp())))
-            candles['open'].append(float(data.get('open', 0)))
-            candles['high'].append(float(data.get('high', 0)))
-            candles['low'].append(float(data.get('low', 0)))
-            candles['close'].append(float(data.get('close', 0)))
-            candles['volume'].append(int(data.get('volume', 0)))
-            
-            # Keep last 100 candles only
-            for key in candles:
-                if len(candles[key]) > 100:
-                    candles[key] = candles[key][-100:]
+        if not stored:
+            return template_response(
+                _DUPLICATE_TMPL % (_json_text(timeframe), _json_text(symbol))
+            ), 200
         
         # Check if we have enough data to analyze
-        if (len(market_data[symbol].get('4H', {}).get('close', [])) >= 50 and
-            len(market_data[symbol].get('1H', {}).get('close', [])) >= 50 and
-            len(market_data[symbol].get('5M', {}).get('close', [])) >= 50):
+        if state.ready():
             
-            # Run strategy analysis
-            current_price = data.get('close', 0)
-            
-            # Convert data formats
-            candles_list = convert_to_candles_list(market_data[symbol]['5M'])
+            # Setups are only evaluated on 5M bar close; higher timeframe
+            # bars just update the buffers
+            if timeframe != '5M':
+                return template_response(
+                    _BUFFERED_TMPL % (_json_text(timeframe), _json_text(symbol))
+                ), 200
             
-            # Use new flexible strategy with 3 setup options
-            signal = strategy.analyze(candles_list, symbol=symbol)
+            # Run strategy analysis
+            current_price = payload.close
+            signal = analyze_symbol(symbol)
             
             if signal:
-                setup_name = signal.get('setup_type', 'UNKNOWN')
-                confirmations = signal.get('confirmations', [])
-                risk_pct = signal.get('risk_percentage', 0) * 100
+                log_signal(symbol, signal)
                 
-                logger.info(f"\n🎯 SIGNAL DETECTED FOR {symbol}!")
-                logger.info(f"   Setup: {setup_name}")
-                logger.info(f"   Confirmations: {', '.join(confirmations)} ({len(confirmations)}/3)")
-                logger.info(f"   Type: {signal.get('direction', 'UNKNOWN')}")
-                logger.info(f"   Entry: {signal.get('entry_price', 0):.5f}")
-                logger.info(f"   Stop Loss: {signal.get('stop_loss', 0):.5f}")
-                logger.info(f"   Take Profit: {signal.get('take_profit', 0):.5f}")
-                logger.info(f"   Risk/Reward: 1:{signal.get('risk_reward', 0):.2f}")
-                logger.info(f"   Risk Size: {risk_pct:.1f}% (Full={len(confirmations)>=3})")
-                logger.info(f"   Confidence: {signal.get('confidence', 0):.2f}")
-                
-                # Normalize signal structure for frontend
-                signal['type'] = signal['direction']
-                signal['entry'] = signal['entry_price']
-                
-                return jsonify({
+                return jsonify_fast({
                     'status': 'signal_detected',
                     'signal': signal,
                     'message': f'{signal["direction"]} signal for {symbol}'
                 }), 200
             else:
-                return jsonify({
-                    'status': 'no_signal',
-                    'message': f'No setup for {symbol} at {current_price:.5f}'
-                }), 200
+                return template_response(
+                    _NO_SIGNAL_TMPL % (_json_text(symbol), current_price)
+                ), 200
         else:
-            return jsonify({
-                'status': 'collecting_data',
-                'message': f'Need more data for {symbol}',
-                'candles': {
-                    '4H': len(market_data[symbol].get('4H', {}).get('close', [])),
-                    '1H': len(market_data[symbol].get('1H', {}).get('close', [])),
-                    '5M': len(market_data[symbol].get('5M', {}).get('close', []))
-                }
-            }), 200
+            return template_response(
+                _COLLECTING_TMPL % ((_json_text(symbol),) + state.counts())
+            ), 200
             
     except Exception as e:
         logger.error(f"Error processing webhook: {e}", exc_info=True)
-        return jsonify({'error': str(e)}), 500
+        return jsonify_fast({'error': str(e)}), 500
+
+
+@app.route('/webhook/bulk', methods=['POST'])
+def webhook_bulk():
+    """
+    Receive a JSON array of candles (same fields as /webhook) in one request.
+    
+    All candles are stored first; then each symbol that got new 5M bars is
+    analyzed once. Returns one status entry per symbol touched. Candles with
+    a timeframe outside TIMEFRAMES are skipped and counted as ignored.
+    """
+    try:
+        body = request.get_data()
+        
+        if not body:
+            return jsonify_fast({'error': 'No data provided'}), 400
+        
+        signature = request.headers.get('X-Signature')
+        if signature is not None and not verify_signature(body, signature):
+            logger.error("Invalid webhook signature")
+            return jsonify_fast({'error': 'Invalid signature'}), 401
+        
+        try:
+            payloads = decode_payloads(body)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Invalid bulk payload: {e}")
+            return jsonify_fast({'error': f'Invalid payload: {e}'}), 400
+        
+        if signature is None and not all(verify_secret(p.secret) for p in payloads):
+            logger.error("Invalid webhook secret")
+            return jsonify_fast({'error': 'Invalid secret'}), 401
+        
+        logger.info("Bulk market data received: %d candles", len(payloads))
+        
+        touched = {}  # symbol -> got a 5M bar
+        duplicates = 0
+        ignored = 0
+        for payload in payloads:
+            if payload.timeframe not in TIMEFRAMES:
+                ignored += 1
+                continue
+            symbol, _, stored = store_candle(payload)
+            duplicates += not stored
+            touched[symbol] = touched.get(symbol, False) or (stored and payload.timeframe == '5M')
+        
+        results = []
+        for symbol, new_5m in touched.items():
+            state = market_data[symbol]
+            if not state.ready():
+                counts = dict(zip(TIMEFRAMES, state.counts()))
+                results.append({'symbol': symbol, 'status': 'collecting_data', 'candles': counts})
+            elif not new_5m:
+                results.append({'symbol': symbol, 'status': 'buffered'})
+            else:
+                signal = analyze_symbol(symbol)
+                if signal:
+                    log_signal(symbol, signal)
+                    results.append({'symbol': symbol, 'status': 'signal_detected', 'signal': signal})
+                else:
+                    results.append({'symbol': symbol, 'status': 'no_signal'})
+        
+        return jsonify_fast({
+            'status': 'success',
+            'received': len(payloads),
+            'duplicates': duplicates,
+            'ignored': ignored,
+            'results': results
+        }), 200
+    
+    except Exception as e:
+        logger.error(f"Error processing bulk webhook: {e}", exc_info=True)
+        return jsonify_fast({'error': str(e)}), 500
+
+
+@app.route('/events', methods=['GET'])
+def events():
+    """Stream analysis results as Server-Sent Events (replaces polling /signals)."""
+    client = queue.Queue(maxsize=SSE_QUEUE_SIZE)
+    with _sse_lock:
+        _sse_clients.append(client)
+    
+    def stream():
+        try:
+            # Reconnecting clients wait 3s and start from the current state
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    yield client.get(timeout=SSE_KEEPALIVE)
+                except queue.Empty:
+                    # Keeps proxies from closing the stream and lets the
+                    # server notice disconnected clients
+                    yield ": keepalive\n\n"
+        finally:
+            with _sse_lock:
+                if client in _sse_clients:
+                    _sse_clients.remove(client)
+    
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+# Bar counters restart with the process (while the rings may be restored
+# from disk), so ETags carry a per-process salt
+_ETAG_SALT = f"{os.getpid()}-{time.time_ns()}".encode()
+
+
+def data_etag(symbol: Optional[str], symbols: List[str]) -> str:
+    """ETag for /data (one symbol or all); changes whenever a bar is stored."""
+    key = repr((symbol, [(sym, market_data[sym].bars if sym in market_data else None) for sym in symbols]))
+    return hashlib.blake2b(key.encode(), digest_size=8, key=_ETAG_SALT).hexdigest()
+
+
+def not_modified(etag: str) -> bool:
+    """Whether the request's If-None-Match already names this ETag."""
+    # flask-compress appends the encoding (":gzip") to the ETags it sends
+    return any(tag.partition(':')[0] == etag for tag in request.if_none_match)
 
 
 @app.route('/')
 def dashboard():
-    """Serve the trading dashboard."""
-    return send_from_directory(STATIC_DIR, 'dashboard.html')
+    """Serve the trading dashboard (conditional, sent with sendfile where the server supports it)."""
+    return send_from_directory(STATIC_DIR, 'dashboard.html', max_age=300)
 
 
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
-    return jsonify({
+    return jsonify_fast({
         'status': 'running',
         'mode': 'analysis_only',
         'symbols_tracked': list(market_data.keys()),
+        'duplicates_dropped': duplicates_dropped(),
         'timestamp': datetime.now().isoformat()
     })
 
 
 @app.route('/data', methods=['GET'])
 def get_data():
-    """Get stored market data."""
+    """
+    Get stored market data.
+    
+    Responses carry an ETag over the symbols' bar counters; a poll with a
+    matching If-None-Match gets 304 without the rings being serialized.
+    """
     symbol = request.args.get('symbol', None)
-    if symbol:
-        return jsonify({
+    symbols = [symbol] if symbol else list(market_data)
+    etag = data_etag(symbol, symbols)
+    if not_modified(etag):
+        response = Response(status=304)
+    elif symbol:
+        response = jsonify_fast({
             'status': 'success',
             'symbol': symbol,
-            'data': market_data.get(symbol, {})
+            'data': market_data_as_dict(symbol)
         })
     else:
-        return jsonify({
+        response = jsonify_fast({
             'status': 'success',
-            'symbols': list(market_data.keys()),
-            'data': market_data
+            'symbols': symbols,
+            'data': {sym: market_data_as_dict(sym) for sym in symbols}
         })
+    
+    response.set_etag(etag)
+    response.cache_control.max_age = 1
+    return response
 
 
 @app.route('/signals', methods=['GET'])
 def get_signals():
     """Get latest signals for all tracked symbols."""
+    global _signals_body
+    
+    keys = {
+        symbol: (state.version, state.ready())
+        for symbol, state in list(market_data.items())
+    }
+    versions = tuple(keys.items())
+    if _signals_body[0] == versions:
+        return app.response_class(_signals_body[1], mimetype='application/json')
+    
     signals = {}
-    for symbol, data in market_data.items():
+    cacheable = True
+    for symbol in keys:
+        cached = signals_cache.get(symbol)
+        if cached is not None and cached[0] == keys[symbol]:
+            signals[symbol] = cached[1]
+            continue
         try:
-            data_4h = data.get('4H', {})
-            data_1h = data.get('1H', {})
-            data_5m = data.get('5M', {})
-            
-            if (len(data_4h.get('close', [])) >= 50 and
-                len(data_1h.get('close', [])) >= 50 and
-                len(data_5m.get('close', [])) >= 50):
+            if keys[symbol][1]:
                 
-                # Convert data formats
-                candles_list = convert_to_candles_list(data_5m)
-                
-                signal = strategy.analyze(candles_list, symbol=symbol)
+                # Served from the last 5M analysis unless a new bar arrived
+                signal = analyze_symbol(symbol)
                 
                 if signal:
-                    # Normalize keys for frontend
-                    signal['type'] = signal.get('direction', 'UNKNOWN')
-                    signal['entry'] = signal.get('entry_price', 0)
                     signals[symbol] = signal
                 else:
                     signals[symbol] = {'status': 'no_setup'}
             else:
                 signals[symbol] = {'status': 'insufficient_data'}
+            signals_cache[symbol] = (keys[symbol], signals[symbol])
         except (KeyError, ValueError, TypeError) as e:
             logger.error(f"Error analyzing {symbol}: {e}")
             signals[symbol] = {'status': 'error', 'message': str(e)}
+            cacheable = False
     
-    return jsonify({
+    response = jsonify_fast({
         'status': 'success',
         'signals': signals
     })
+    if cacheable:
+        _signals_body = (versions, response.get_data())
+    return response
 
 
 if __name__ == '__main__':
     PORT = 5000
     
+    load_persisted_rings()
+    warmup_strategy()
+    
     print("\n" + "="*70)
     print("TRADINGVIEW STRATEGY ANALYZER")
     print("="*70)
@@ -290,9 +949,11 @@ if __name__ == '__main__':
     print(f"\nServer starting on http://localhost:{PORT}")
     print("\nEndpoints:")
     print("  POST /webhook  - Receive TradingView market data")
+    print("  POST /webhook/bulk - Receive an array of candles in one request")
     print("  GET  /health   - Health check")
     print("  GET  /data     - View collected market data")
     print("  GET  /signals  - Check current strategy signals")
+    print("  GET  /events   - Stream new signals (Server-Sent Events)")
     print("\nTo connect TradingView:")
     print("  1. Install ngrok: brew install ngrok")
     print(f"  2. Run: ngrok http {PORT}")
@@ -303,8 +964,5 @@ if __name__ == '__main__':
     print("   Signals will be logged (no trades executed)")
     print("="*70 + "\n")
     
-    # Create logs directory if it doesn't exist
-    os.makedirs('logs', exist_ok=True)
-    
-    # Run server
-    app.run(host='0.0.0.0', port=PORT, debug=False)
+    # Run development server (for production use a WSGI server, see wsgi.py)
+    app.run(host='0.0.0.0', port=PORT, debug=False, threaded=True)
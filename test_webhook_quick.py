@@ -2,16 +2,18 @@
 """Quick test script to send sample market data to webhook server."""
 
 import requests
-import time
 from datetime import datetime
 
 # Webhook configuration
-WEBHOOK_URL = "http://localhost:5000/webhook"
+BULK_URL = "http://localhost:5000/webhook/bulk"
 SECRET = "your_secret_key_here"
 
-def send_candle(symbol, timeframe, timestamp, open_price, high_price, low_price, close_price):
-    """Send a single candle to the webhook."""
-    data = {
+# Keep-alive session shared by all requests
+session = requests.Session()
+
+def make_candle(symbol, timeframe, timestamp, open_price, high_price, low_price, close_price):
+    """Build a webhook candle payload."""
+    return {
         "secret": SECRET,
         "symbol": symbol,
         "timeframe": timeframe,
@@ -22,13 +24,24 @@ def send_candle(symbol, timeframe, timestamp, open_price, high_price, low_price,
         "close": close_price,
         "volume": 1000
     }
-    
+
+def send_candles(candles):
+    """Send a batch of candles in one request to the bulk endpoint."""
     try:
-        response = requests.post(WEBHOOK_URL, json=data)
+        response = session.post(BULK_URL, json=candles)
         return response.json()
     except Exception as e:
         return {"error": str(e)}
 
+def print_results(result):
+    """Print the per-symbol statuses from a bulk response."""
+    if 'error' in result:
+        print(f"  Error: {result['error']}")
+        return
+    print(f"  Sent {result.get('received', 0)} candles")
+    for item in result.get('results', []):
+        print(f"  {item['symbol']} - Status: {item.get('status', 'unknown')}")
+
 def main():
     """Send sample candles to test the strategy."""
     print("📊 Testing TradingView Webhook with Sample Data")
@@ -39,37 +52,34 @@ def main():
     base_price = 1.0800
     
     print("\n📈 Sending 4H candles...")
+    candles = []
     for i in range(55):
         timestamp = base_time - (55 - i) * 14400  # 4 hours = 14400 seconds
         price = base_price + (i * 0.0005)
-        result = send_candle("EURUSD", "4H", timestamp, price, price + 0.0010, price - 0.0005, price + 0.0003)
-        if i % 10 == 0:
-            print(f"  Sent {i+1}/55 candles - Status: {result.get('status', 'unknown')}")
-        time.sleep(0.1)
+        candles.append(make_candle("EURUSD", "4H", timestamp, price, price + 0.0010, price - 0.0005, price + 0.0003))
+    print_results(send_candles(candles))
     
     print("\n📈 Sending 1H candles...")
+    candles = []
     for i in range(55):
         timestamp = base_time - (55 - i) * 3600  # 1 hour = 3600 seconds
         price = base_price + (i * 0.0002)
-        result = send_candle("EURUSD", "1H", timestamp, price, price + 0.0008, price - 0.0003, price + 0.0002)
-        if i % 10 == 0:
-            print(f"  Sent {i+1}/55 candles - Status: {result.get('status', 'unknown')}")
-        time.sleep(0.1)
+        candles.append(make_candle("EURUSD", "1H", timestamp, price, price + 0.0008, price - 0.0003, price + 0.0002))
+    print_results(send_candles(candles))
     
     print("\n📈 Sending 5M candles...")
+    candles = []
     for i in range(55):
         timestamp = base_time - (55 - i) * 300  # 5 minutes = 300 seconds
         price = base_price + (i * 0.00005)
-        result = send_candle("EURUSD", "5M", timestamp, price, price + 0.0003, price - 0.0002, price + 0.0001)
-        if i % 10 == 0:
-            print(f"  Sent {i+1}/55 candles - Status: {result.get('status', 'unknown')}")
-        time.sleep(0.1)
+        candles.append(make_candle("EURUSD", "5M", timestamp, price, price + 0.0003, price - 0.0002, price + 0.0001))
+    print_results(send_candles(candles))
     
     print("\n✅ All candles sent!")
     print("\n🔍 Checking for signals...")
     
     try:
-        response = requests.get("http://localhost:5000/signals")
+        response = session.get("http://localhost:5000/signals")
         signals = response.json()
         print(f"\n📊 Strategy Analysis Results:")
         print(f"Status: {signals.get('status', 'unknown')}")
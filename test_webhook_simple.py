@@ -16,6 +16,9 @@ BASE_URL = "http://127.0.0.1:5000"
 SECRET = "your_secret_key_here"
 SYMBOLS = ["EURUSD", "GBPUSD", "XAUUSD"]
 
+# Keep-alive session: one connection reused for every candle
+session = requests.Session()
+
 def send_candle(symbol, timeframe, timestamp, open_price, high, low, close, volume=1000):
     """Send a single candle to the webhook."""
     data = {
@@ -31,7 +34,7 @@ def send_candle(symbol, timeframe, timestamp, open_price, high, low, close, volu
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/webhook", json=data, timeout=5)
+        response = session.post(f"{BASE_URL}/webhook", json=data, timeout=5)
         return response.json()
     except Exception as e:
         print(f"Error sending candle: {e}")
@@ -68,7 +71,7 @@ def main():
     
     # Check server health
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = session.get(f"{BASE_URL}/health", timeout=5)
         print(f"✓ Server is running: {response.json()['status']}")
         print()
     except Exception as e:
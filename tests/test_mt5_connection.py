@@ -9,17 +9,23 @@ Validates that your MT5 setup is working correctly:
 5. SMC strategy analysis
 
 Usage:
-    python3 test_mt5_connection.py
+    python3 test_mt5_connection.py [--login LOGIN] [--password PASSWORD] [--server SERVER]
 
-Set environment variables first:
+Credentials not given as flags are read from the environment:
     export MT5_LOGIN=your_login
     export MT5_PASSWORD=your_password
     export MT5_SERVER=your_server_name
+
+Anything still missing is prompted for only when run from a terminal,
+so the script can run headless (CI, batch runs) without blocking.
 """
 
 import os
 import sys
+import argparse
+import getpass
 import logging
+from datetime import datetime
 from connectors.mt5_connector import MT5Connector
 from core.smc_strategy import SMCStrategy
 from core.enhanced_risk_manager import EnhancedRiskManager
@@ -28,16 +34,32 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def test_credentials():
+def parse_args(argv=None):
+    """Parse credential flags, defaulting to the MT5_* environment variables."""
+    parser = argparse.ArgumentParser(description="Validate MT5 connection and bot setup")
+    parser.add_argument('--login', default=os.getenv('MT5_LOGIN'),
+                        help="MT5 account login (default: $MT5_LOGIN)")
+    parser.add_argument('--password', default=os.getenv('MT5_PASSWORD'),
+                        help="MT5 account password (default: $MT5_PASSWORD)")
+    parser.add_argument('--server', default=os.getenv('MT5_SERVER'),
+                        help="MT5 server name (default: $MT5_SERVER)")
+    return parser.parse_args(argv)
+
+
+def prompt_if_missing(value, prompt, secret=False):
+    """Return value, or ask for it when stdin is an interactive terminal."""
+    if value or not sys.stdin.isatty():
+        return value
+    answer = getpass.getpass(prompt) if secret else input(prompt)
+    return answer.strip() or None
+
+
+def test_credentials(login=None, password=None, server=None):
     """Test 1: Validate credentials are available."""
     print("\n" + "="*60)
     print("TEST 1: Credentials Validation")
     print("="*60)
     
-    login = os.getenv('MT5_LOGIN')
-    password = os.getenv('MT5_PASSWORD')
-    server = os.getenv('MT5_SERVER')
-    
     if not login:
         print("❌ MT5_LOGIN not set")
         return False, None, None, None
@@ -124,16 +146,16 @@ def test_candles(mt5, symbol='EURUSD'):
     try:
         candles = mt5.get_candles(symbol, timeframe='M5', count=20)
         
-        if not candles or not candles['close']:
+        if not candles:
             print(f"❌ No candles returned for {symbol}")
             return False
         
-        print(f"✓ Retrieved {len(candles['close'])} candles for {symbol} (M5)")
+        print(f"✓ Retrieved {len(candles)} candles for {symbol} (M5)")
         
         # Show last 3 candles
         print("\nLast 3 candles:")
-        for i in range(max(0, len(candles['close'])-3), len(candles['close'])):
-            time_str = candles['time'][i].strftime('%Y-%m-%d %H:%M')
+        for i in range(max(0, len(candles)-3), len(candles)):
+            time_str = datetime.fromtimestamp(candles['time'][i]).strftime('%Y-%m-%d %H:%M')
             o = candles['open'][i]
             h = candles['high'][i]
             l = candles['low'][i]
@@ -209,8 +231,10 @@ def test_risk_manager(balance):
         return False
 
 
-def main():
+def main(argv=None):
     """Run all tests."""
+    args = parse_args(argv)
+    
     print("\n" + "="*60)
     print("MT5 TRADING BOT - CONNECTION TEST")
     print("="*60)
@@ -218,7 +242,11 @@ def main():
     results = []
     
     # Test 1: Credentials
-    creds_ok, login, password, server = test_credentials()
+    creds_ok, login, password, server = test_credentials(
+        prompt_if_missing(args.login, "MT5 login: "),
+        prompt_if_missing(args.password, "MT5 password: ", secret=True),
+        prompt_if_missing(args.server, "MT5 server: ")
+    )
     results.append(("Credentials", creds_ok))
     
     if not creds_ok:
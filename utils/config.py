@@ -8,6 +8,15 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Environment variables FOREX_BOT_<KEY> override config keys
+ENV_PREFIX = "FOREX_BOT_"
+
 
 class Config:
     """Configuration manager."""
@@ -27,15 +36,23 @@ class Config:
     def __init__(self, config_path: str = "config/config.json"):
         self.config_path = Path(config_path)
         self._config = self.DEFAULTS.copy()
+        self._env: Dict[str, str] = {}
         self.load()
 
     def load(self):
-        """Load configuration from file."""
+        """Load configuration from file (and re-read environment overrides)."""
+        # Snapshot the overrides once so get() never touches os.environ
+        self._env = {
+            name[len(ENV_PREFIX):].lower(): value
+            for name, value in os.environ.items()
+            if name.startswith(ENV_PREFIX)
+        }
+        
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r') as f:
-                    file_config = json.load(f)
-                    self._config.update(file_config)
+                data = self.config_path.read_bytes()
+                file_config = orjson.loads(data) if orjson is not None else json.loads(data)
+                self._config.update(file_config)
             except Exception as e:
                 print(f"Error loading config: {e}")
 
@@ -43,18 +60,19 @@ class Config:
         """Save configuration to file."""
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            if orjson is not None:
+                self.config_path.write_bytes(orjson.dumps(self._config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_path, 'w') as f:
+                    json.dump(self._config, f, indent=2)
         except Exception as e:
             print(f"Error saving config: {e}")
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
-        env_key = f"FOREX_BOT_{key.upper()}"
-        
         # Environment variable takes precedence
-        if env_key in os.environ:
-            return os.environ[env_key]
+        if key in self._env:
+            return self._env[key]
         
         return self._config.get(key, default)
 
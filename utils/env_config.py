@@ -6,17 +6,33 @@ import os
 from pathlib import Path
 
 
+# .env is read once per process
+_ENV_LOADED = False
+
+
 def load_env():
-    """Load environment variables from .env file if it exists."""
+    """
+    Load environment variables from .env file if it exists.
+    
+    Runs once; variables already set in the environment take precedence
+    over the file. Lines without '=' are ignored.
+    """
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    
     env_file = Path(__file__).parent / ".env"
     
     if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+        for line in env_file.read_text().splitlines():
+            line = line.strip()
+            if not line or line[0] == '#':
+                continue
+            key, sep, value = line.partition('=')
+            if sep:
+                os.environ.setdefault(key.strip(), value.strip())
+    
+    _ENV_LOADED = True
 
 
 def get_mt5_credentials():
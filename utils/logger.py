@@ -3,31 +3,49 @@ Logging Utility
 Structured logging for the trading bot.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
+import threading
 from pathlib import Path
 from typing import Optional
 
+# Configured "forex_bot" logger, bound once by Logger.get_logger()
+_LOGGER: Optional[logging.Logger] = None
+
 
 class Logger:
     """Logging configuration and utility."""
 
     _instance: Optional['Logger'] = None
     _logger: Optional[logging.Logger] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._init_logger()
+            with cls._lock:
+                # Re-check: another thread may have initialized it meanwhile
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._init_logger()
+                    cls._instance = instance
         return cls._instance
 
     def _init_logger(self):
         """Initialize the logger."""
+        self._logger = logging.getLogger("forex_bot")
+        
+        # Handlers already attached (e.g. module reloaded) - don't add twice
+        if self._logger.handlers:
+            return
+        
         log_path = Path("logs")
         log_path.mkdir(exist_ok=True)
         
-        self._logger = logging.getLogger("forex_bot")
         self._logger.setLevel(logging.DEBUG)
+        self._logger.propagate = False  # root handlers would repeat every line
         
         # File handler
         file_handler = logging.handlers.RotatingFileHandler(
@@ -50,36 +68,49 @@ class Logger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+        # Callers only enqueue records; a listener thread does the
+        # file/console writes
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))  # listener adds the prefix
+        self._logger.addHandler(queue_handler)
+        
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)  # flush queued records on exit
+        Logger._listener = listener
 
     @staticmethod
     def get_logger() -> logging.Logger:
         """Get the logger instance."""
-        instance = Logger()
-        return instance._logger
+        global _LOGGER
+        if _LOGGER is None:
+            _LOGGER = Logger()._logger
+        return _LOGGER
 
     @staticmethod
     def debug(msg: str, *args, **kwargs):
         """Log debug message."""
-        Logger.get_logger().debug(msg, *args, **kwargs)
+        (_LOGGER or Logger.get_logger()).debug(msg, *args, **kwargs)
 
     @staticmethod
     def info(msg: str, *args, **kwargs):
         """Log info message."""
-        Logger.get_logger().info(msg, *args, **kwargs)
+        (_LOGGER or Logger.get_logger()).info(msg, *args, **kwargs)
 
     @staticmethod
     def warning(msg: str, *args, **kwargs):
         """Log warning message."""
-        Logger.get_logger().warning(msg, *args, **kwargs)
+        (_LOGGER or Logger.get_logger()).warning(msg, *args, **kwargs)
 
     @staticmethod
     def error(msg: str, *args, **kwargs):
         """Log error message."""
-        Logger.get_logger().error(msg, *args, **kwargs)
+        (_LOGGER or Logger.get_logger()).error(msg, *args, **kwargs)
 
     @staticmethod
     def critical(msg: str, *args, **kwargs):
         """Log critical message."""
-        Logger.get_logger().critical(msg, *args, **kwargs)
+        (_LOGGER or Logger.get_logger()).critical(msg, *args, **kwargs)
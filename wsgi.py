@@ -0,0 +1,21 @@
+"""
+WSGI entry point for the TradingView webhook server.
+
+Linux/macOS:
+    gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:5000 wsgi:application
+Windows:
+    waitress-serve --listen=0.0.0.0:5000 --threads=8 wsgi:application
+
+Market data lives in process memory, so run a single worker and scale
+with threads - separate worker processes would each see only part of
+the incoming bars.
+"""
+
+from scripts.tradingview_webhook_server import app, load_persisted_rings, warmup_strategy
+
+# Reopen the persisted candle rings and compile the strategy kernels
+# before the worker takes requests
+load_persisted_rings()
+warmup_strategy()
+
+application = app